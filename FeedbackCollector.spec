@@ -26,6 +26,9 @@ a = Analysis(
         'jinja2',
         'waitress',
         'dotenv',
+        'orjson',
+        'flask_compress',
+        'ahocorasick',
     ],
     hookspath=[],
     hooksconfig={},
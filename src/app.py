@@ -1,27 +1,265 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory, current_app
+from flask import Flask, render_template, stream_template, request, jsonify, send_from_directory, current_app, session, copy_current_request_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.exceptions import NotFound
+import numpy as np
 import pandas as pd
+import ast
+import codecs
 import os
 import logging
-import time
+import hashlib
+import threading
+from collections import Counter, deque
+from itertools import chain, islice
+from decimal import Decimal
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import List, Dict, Any, Tuple
-import json
+from pathlib import Path
+from typing import List, Dict, Any, NamedTuple, Optional, Tuple
 
-from collectors import RedditCollector, FabricCommunityCollector, GitHubDiscussionsCollector, GitHubIssuesCollector
+from collectors import RedditCollector, FabricCommunityCollector, GitHubDiscussionsCollector, GitHubIssuesCollector, create_github_session
 from ado_client import get_working_ado_items
 import config
 import utils
 import state_manager
+from id_generator import FeedbackIDGenerator
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fabric SQL support depends on pyodbc and an ODBC driver; the app still runs offline without it
+try:
+    import fabric_sql_writer
+except ImportError as e:
+    logger.warning(f"Fabric SQL Writer not available (ODBC driver missing): {e}")
+    fabric_sql_writer = None
+except Exception as e:
+    logger.warning(f"Fabric SQL Writer failed to load: {e}")
+    fabric_sql_writer = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+# With pyarrow installed, feedback CSVs are read and written by Arrow and Parquet copies are kept
+try:
+    import pyarrow
+    import pyarrow.csv
+except ImportError:
+    pyarrow = None
+CSV_READ_ENGINE = 'pyarrow' if pyarrow is not None else 'c'
+
+
+def _json_default(obj):
+    """Fallback encoder for types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for faster response encoding"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__, template_folder='templates', static_folder='static')
 app.secret_key = 'feedback_collector_secret_key_2025'  # For session management
+if orjson is not None:
+    app.json_provider_class = OrjsonProvider
+    app.json = OrjsonProvider(app)
+else:
+    logger.info("orjson not installed - using Flask's default JSON encoder")
+# Never pretty-print or sort keys (Flask 2.3 replaced JSON_SORT_KEYS/JSONIFY_PRETTYPRINT_REGULAR with these)
+app.json.sort_keys = False
+app.json.compact = True
+
+# Compress large JSON payloads (e.g. Fabric sync state_data). The SSE stream is
+# deliberately left out so EventSource clients keep receiving frames unbuffered.
+app.config.update(
+    COMPRESS_MIMETYPES=['application/json'],
+    COMPRESS_LEVEL=4,
+    COMPRESS_BR_LEVEL=4,
+    COMPRESS_MIN_SIZE=1024
+)
+if Compress is not None:
+    Compress(app)
+else:
+    logger.info("flask-compress not installed - JSON responses will not be compressed")
 
 last_collected_feedback = []
+# Feedback_ID -> items in last_collected_feedback; rebuilt whenever the list is replaced or IDs change
+_feedback_by_id: Dict[str, List[Dict[str, Any]]] = {}
 last_collection_summary = {"reddit": 0, "fabric": 0, "github": 0, "github_issues": 0, "total": 0}
 
+def _reindex_feedback():
+    """Rebuild the Feedback_ID lookup for the in-memory feedback list"""
+    global _feedback_by_id
+    index: Dict[str, List[Dict[str, Any]]] = {}
+    for item in last_collected_feedback:
+        feedback_id = item.get('Feedback_ID')
+        if feedback_id:
+            index.setdefault(feedback_id, []).append(item)
+    _feedback_by_id = index
+    invalidate_feedback_frame()
+
+def find_feedback(feedback_id) -> Optional[Dict[str, Any]]:
+    """First in-memory feedback item with this Feedback_ID, or None"""
+    items = _feedback_by_id.get(feedback_id)
+    return items[0] if items else None
+
+# Canonical viewer column -> (feedback field, legacy lowercase alias folded into that field when CSVs load)
+_CANONICAL_FEEDBACK_FIELDS = {
+    'source': ('Sources', 'source'),
+    'category': ('Category', 'category'),
+    'enhanced_category': ('Enhanced_Category', 'enhanced_category'),
+    'audience': ('Audience', 'audience'),
+    'priority': ('Priority', 'priority'),
+    'domain': ('Primary_Domain', 'domain'),
+    'sentiment': ('Sentiment', 'sentiment'),
+    'state': ('State', 'state'),
+    'subcategory': ('Subcategory', 'subcategory'),
+    'feature_area': ('Feature_Area', 'feature_area'),
+    'impact_type': ('Impacttype', 'impacttype'),
+}
+
+# Canonical columns the viewer and filter API match against
+_ENCODED_FILTER_COLUMNS = ('source', 'audience', 'priority', 'domain', 'sentiment', 'state',
+                           'enhanced_category', 'subcategory', 'impact_type')
+
+# Priority sort order; anything unrecognised sorts after 'low'
+_PRIORITY_RANK = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
+
+def canonical_feedback_frame(feedback_items):
+    """Columnar view of the viewer's filter fields, named by their canonical viewer column"""
+    columns = {field: name for name, (field, _) in _CANONICAL_FEEDBACK_FIELDS.items()}
+    frame = pd.DataFrame.from_records(feedback_items, columns=[*columns, 'is_stored_in_sql']).rename(columns=columns)
+    # Items never triaged carry no State; they are NEW wherever the viewer shows or filters them
+    frame['state'] = frame['state'].fillna('NEW')
+    # Filterable columns are dictionary-encoded, so isin/== compare small int codes rather than hashing every string
+    for column in _ENCODED_FILTER_COLUMNS:
+        frame[column] = frame[column].astype('category')
+    stored = frame['is_stored_in_sql']
+    frame['is_stored_in_sql'] = stored.notna() & stored.astype(bool)
+    # Sort keys parsed once per frame build; unparseable or missing dates become NaT, which sorts as the oldest
+    created = pd.Series([item.get('Created') for item in feedback_items], dtype=object)
+    frame['created'] = pd.to_datetime(created, format='ISO8601', utc=True, errors='coerce')
+    # Mapped per category, not per row; non-string values (all-empty columns load as float NaN) rank as unknown
+    unknown_rank = len(_PRIORITY_RANK)
+    ranks = frame['priority'].map(lambda p: _PRIORITY_RANK.get(p.lower(), unknown_rank) if isinstance(p, str) else unknown_rank)
+    frame['priority_rank'] = ranks.astype(float).fillna(unknown_rank).astype(np.int8)
+    return frame
+
+def feedback_search_text(frame, feedback_items):
+    """Lowercased Feedback/Page_Title/Enhanced_Category per row (NUL-separated so matches cannot span fields), kept on the frame"""
+    if 'search_text' not in frame:
+        frame['search_text'] = [
+            f"{item.get('Feedback', '')}\0{item.get('Page_Title', '')}\0{item.get('Enhanced_Category', '')}".lower()
+            for item in feedback_items
+        ]
+    return frame['search_text'].to_numpy(dtype=object)
+
+def _present_values(column):
+    """Sorted distinct non-empty values of a canonical column, as strings"""
+    present = column[column.notna() & column.astype(bool)]
+    return sorted(present.astype(str).unique().tolist())
+
+# Canonical columns whose values the Fabric SQL sync can overwrite
+_SQL_SYNCED_FILTER_COLUMNS = frozenset({'state', 'domain'})
+
+# (list identity, length) -> canonical frame of last_collected_feedback; swapped as one tuple so readers never see a mismatch
+_feedback_frame_cache = (None, None)
+
+def invalidate_feedback_frame():
+    """Drop the cached canonical frame; call after changing filterable fields of in-memory feedback"""
+    global _feedback_frame_cache
+    _feedback_frame_cache = (None, None)
+
+def feedback_frame():
+    """Canonical frame of last_collected_feedback, rebuilt only when the list or its items have changed"""
+    global _feedback_frame_cache
+    key = (id(last_collected_feedback), len(last_collected_feedback))
+    cached_key, frame = _feedback_frame_cache
+    if cached_key != key:
+        frame = canonical_feedback_frame(last_collected_feedback)
+        _feedback_frame_cache = (key, frame)
+    return frame
+
+def feedback_filter_mask(frame, multi_filters, single_filters, stored_only: bool = False):
+    """Boolean array of rows matching every filter (column -> allowed values, column -> exact value)"""
+    # Plain NumPy arrays, so combining filters is an in-place AND with no index alignment
+    mask = np.ones(len(frame), dtype=bool)
+    for column, values in multi_filters.items():
+        mask &= frame[column].isin(values).to_numpy()
+    for column, value in single_filters.items():
+        mask &= (frame[column] == value).to_numpy()
+    if stored_only:
+        mask &= frame['is_stored_in_sql'].to_numpy()
+    return mask
+
+def sort_feedback_positions(frame, positions, sort_by):
+    """Row positions reordered for 'newest', 'oldest' or 'priority' by a stable argsort over the frame's sort keys"""
+    if sort_by in ('newest', 'oldest'):
+        # As int64 NaT is the smallest value, so undated items stay oldest (NumPy would sort NaT last)
+        created = frame['created'].to_numpy(dtype='datetime64[ns]').view(np.int64)[positions]
+        if sort_by == 'newest':
+            # Descending but still stable: sort the reversed keys ascending, then reverse the result
+            order = np.argsort(created[::-1], kind='stable')[::-1]
+            return positions[::-1][order]
+        return positions[np.argsort(created, kind='stable')]
+    if sort_by == 'priority':
+        ranks = frame['priority_rank'].to_numpy()[positions]
+        return positions[np.argsort(ranks, kind='stable')]
+    return positions
+
+def has_usable_token(stored_token) -> bool:
+    """True when the session holds a real bearer token (not empty, blank or the 'None' placeholder)"""
+    return bool(stored_token) and stored_token != 'None' and not stored_token.isspace()
+
+class ConnectionState(NamedTuple):
+    """Fabric connection state read once from the session"""
+    bearer_token: Optional[str]
+    has_bearer_token: bool
+    states_loaded: bool
+    sql_data_applied: bool
+    
+    @property
+    def has_session_flags(self) -> bool:
+        return self.states_loaded or self.sql_data_applied
+    
+    @property
+    def fabric_sql_connected(self) -> bool:
+        # A usable bearer token enables SQL features; the session flags only record how far the sync got
+        return self.has_bearer_token
+
+def compute_connection_state(session_data) -> ConnectionState:
+    """Derive the Fabric connection state shared by the feedback viewer and the session state API"""
+    bearer_token = session_data.get('fabric_bearer_token')
+    return ConnectionState(
+        bearer_token=bearer_token,
+        has_bearer_token=has_usable_token(bearer_token),
+        states_loaded=bool(session_data.get('states_loaded', False)),
+        sql_data_applied=bool(session_data.get('sql_data_applied', False))
+    )
+
+def truncate_title(title, limit: int = 50, placeholder: str = 'No Title') -> str:
+    """Shorten a title for debug samples, falling back to a placeholder when it is missing"""
+    if not title:
+        return placeholder
+    return title[:limit] + '...' if len(title) > limit else title
+
 # Collection progress tracking
 collection_status = {
     'status': 'ready',  # ready, running, completed, error
@@ -33,45 +271,155 @@ collection_status = {
     'sources_completed': [],
     'error_message': None
 }
+# Guards multi-step updates of collection_status against the status/progress readers
+collection_status_lock = threading.Lock()
+# Notified (under collection_status_lock) whenever collection_status changes, waking progress streams
+collection_status_changed = threading.Condition(collection_status_lock)
+
+def update_collection_status(**changes):
+    """Apply changes to collection_status atomically and wake any progress streams"""
+    with collection_status_changed:
+        collection_status.update(changes)
+        collection_status_changed.notify_all()
+
+# Static lookups for the domain/audience update endpoints (DOMAIN_CATEGORIES never changes at runtime)
+_DOMAIN_NAME_BY_CODE = {code: details['name'] for code, details in config.DOMAIN_CATEGORIES.items()}
+_VALID_DOMAINS = frozenset(_DOMAIN_NAME_BY_CODE)
+_VALID_AUDIENCES = frozenset(['Developer', 'Customer'])
+
+# State-change request keys -> in-memory feedback fields
+_STATE_FIELD_MAP = {'state': 'State', 'notes': 'Feedback_Notes', 'domain': 'Primary_Domain'}
+# FeedbackState row keys (as loaded from SQL) -> in-memory feedback fields
+_SQL_STATE_FIELD_MAP = {**_STATE_FIELD_MAP, 'last_updated': 'Last_Updated', 'updated_by': 'Updated_By'}
+
+# Constant response body for a domain sync that found nothing to update
+_NO_DOMAIN_UPDATES_BODY = app.json.dumps({
+    'status': 'success',
+    'message': 'No domain updates to sync',
+    'updated_count': 0
+})
 
 DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
 if not os.path.exists(DATA_DIR):
     os.makedirs(DATA_DIR)
     logger.info(f"Created data directory: {DATA_DIR}")
+DATA_PATH = Path(DATA_DIR).resolve()
+
+def parse_matched_keywords(value):
+    """Turn a Matched_Keywords CSV cell back into a list (JSON arrays, or Python list reprs from older CSVs)"""
+    if isinstance(value, list):
+        return value
+    if not isinstance(value, str) or value in ('', '[]'):
+        return []
+    try:
+        keywords = app.json.loads(value)
+    except ValueError:
+        try:
+            keywords = ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return []
+    return keywords if isinstance(keywords, list) else []
+
+# CSVs above this size are parsed in row chunks so the DataFrame never holds the whole file
+CSV_CHUNKED_LOAD_THRESHOLD = 64 * 1024 * 1024
+CSV_LOAD_CHUNKSIZE = 50_000
+
+def find_latest_feedback_csv():
+    """Return the path of the most recent feedback CSV, or None if there is none"""
+    # Single pass over the directory (filenames embed a sortable timestamp)
+    latest_file = None
+    with os.scandir(DATA_DIR) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith('feedback_') and name.endswith('.csv') and (latest_file is None or name > latest_file):
+                latest_file = name
+    return os.path.join(DATA_DIR, latest_file) if latest_file else None
+
+def _feedback_records(df):
+    """Convert a feedback DataFrame (or chunk) to record dicts with NaN→None and parsed keywords"""
+    # Fold legacy lowercase columns into their canonical fields so every in-memory item has one schema
+    for field, alias in _CANONICAL_FEEDBACK_FIELDS.values():
+        if alias in df.columns:
+            if field in df.columns:
+                values = df[field]
+                df[field] = values.where(values.notna() & values.astype(bool), df[alias])
+            else:
+                df[field] = df[alias]
+            df = df.drop(columns=alias)
+    
+    # Replace NaN with None to avoid JSON serialization issues and sorting errors (object dtype, so typed
+    # columns such as strings or floats cannot turn the None back into NaN)
+    df = df.astype(object).where(pd.notnull(df), None)
+    
+    # Parse Matched_Keywords from string to list
+    if 'Matched_Keywords' in df.columns:
+        df['Matched_Keywords'] = df['Matched_Keywords'].map(parse_matched_keywords)
+    
+    return df.to_dict('records')
+
+def _export_cell(value):
+    """Render list/dict cells as the text pandas' CSV writer would, so every export holds the same values"""
+    return str(value) if isinstance(value, (list, dict)) else value
+
+def write_feedback_csv(df, filepath):
+    """Write a feedback CSV as UTF-8 with a BOM (for Excel), using Arrow's batched writer when available"""
+    if pyarrow is not None:
+        try:
+            table = pyarrow.Table.from_pandas(df, preserve_index=False)
+            with open(filepath, 'wb') as f:
+                f.write(codecs.BOM_UTF8)
+                pyarrow.csv.write_csv(table, f, write_options=pyarrow.csv.WriteOptions(batch_size=8192))
+            return
+        except Exception as e:
+            logger.warning(f"Arrow CSV writer failed for {filepath}, falling back to pandas: {e}")
+    df.to_csv(filepath, index=False, encoding='utf-8-sig')
+
+# Date columns kept as the text written at collection time; Arrow would otherwise infer ISO-8601 values as timestamps
+_CSV_TEXT_COLUMNS = ('Created', 'Last_Updated')
+
+def read_feedback_csv(filepath, engine: str = CSV_READ_ENGINE):
+    """Read a whole feedback CSV ('pyarrow' or 'c' engine); both engines yield the same values"""
+    if engine == 'pyarrow':
+        convert_options = pyarrow.csv.ConvertOptions(
+            column_types={column: pyarrow.string() for column in _CSV_TEXT_COLUMNS},
+            strings_can_be_null=True  # empty cells load as missing, as with the C parser
+        )
+        return pyarrow.csv.read_csv(filepath, convert_options=convert_options).to_pandas()
+    return pd.read_csv(filepath, encoding='utf-8-sig', engine=engine)
+
+def iter_latest_feedback(chunksize: int = CSV_LOAD_CHUNKSIZE):
+    """Yield the latest feedback CSV as batches of record dicts, holding at most one chunk as a DataFrame"""
+    filepath = find_latest_feedback_csv()
+    if filepath is None:
+        return
+    
+    logger.info(f"Streaming feedback from CSV: {filepath} (chunksize={chunksize})")
+    # The pyarrow engine cannot read in chunks, so this path always uses the C parser
+    for chunk in pd.read_csv(filepath, encoding='utf-8-sig', chunksize=chunksize):
+        yield _feedback_records(chunk)
 
 def load_latest_feedback_from_csv():
     """Load feedback from the most recent CSV file if in-memory data is empty"""
     try:
-        # Get all CSV files in the data directory
-        csv_files = [f for f in os.listdir(DATA_DIR) if f.startswith('feedback_') and f.endswith('.csv')]
-        if not csv_files:
+        filepath = find_latest_feedback_csv()
+        if filepath is None:
             return []
         
-        # Sort by filename (which includes timestamp) to get the latest
-        latest_file = sorted(csv_files)[-1]
-        filepath = os.path.join(DATA_DIR, latest_file)
-        
-        logger.info(f"Loading feedback from CSV: {filepath}")
-        df = pd.read_csv(filepath, encoding='utf-8-sig')
-        
-        # Replace NaN with None to avoid JSON serialization issues and sorting errors
-        df = df.where(pd.notnull(df), None)
-        
-        # Convert DataFrame to list of dictionaries
-        feedback_items = df.to_dict('records')
+        # Prefer the typed Parquet copy written alongside the CSV at collection time
+        parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+        if pyarrow is not None and os.path.exists(parquet_path):
+            try:
+                feedback_items = _feedback_records(pd.read_parquet(parquet_path))
+                logger.info(f"Loaded {len(feedback_items)} items from Parquet: {parquet_path}")
+                return feedback_items
+            except Exception as e:
+                logger.warning(f"Could not read {parquet_path}, falling back to CSV: {e}")
         
-        # Parse Matched_Keywords from string to list
-        import ast
-        for item in feedback_items:
-            if 'Matched_Keywords' in item:
-                try:
-                    # Convert string representation of list back to actual list
-                    if isinstance(item['Matched_Keywords'], str):
-                        item['Matched_Keywords'] = ast.literal_eval(item['Matched_Keywords'])
-                    elif pd.isna(item['Matched_Keywords']):
-                        item['Matched_Keywords'] = []
-                except (ValueError, SyntaxError):
-                    item['Matched_Keywords'] = []
+        if os.path.getsize(filepath) > CSV_CHUNKED_LOAD_THRESHOLD:
+            feedback_items = list(chain.from_iterable(iter_latest_feedback()))
+        else:
+            logger.info(f"Loading feedback from CSV: {filepath}")
+            feedback_items = _feedback_records(read_feedback_csv(filepath))
         
         logger.info(f"Loaded {len(feedback_items)} items from CSV")
         
@@ -174,8 +522,6 @@ def recategorize_feedback_route():
     Skips items where User_Modified_Categorization = 1.
     Preserves any user-curated overrides from the FeedbackState table.
     """
-    from flask import session
-    
     # Check SQL connectivity first
     stored_token = session.get('fabric_bearer_token')
     if not stored_token or not stored_token.strip() or stored_token == 'None':
@@ -184,9 +530,11 @@ def recategorize_feedback_route():
             'message': 'Not connected to Fabric SQL. Please authenticate first via Sources & Settings.'
         }), 400
     
+    if fabric_sql_writer is None:
+        return jsonify({'status': 'error', 'message': 'Fabric SQL writer not available'}), 500
+    
     try:
-        import fabric_sql_writer as fsw
-        writer = fsw.FabricSQLWriter(bearer_token=stored_token)
+        writer = fabric_sql_writer.FabricSQLWriter(bearer_token=stored_token)
         
         # Connect
         try:
@@ -343,45 +691,244 @@ def restore_default_impact_types_route():
         logger.error(f"Error restoring default impact types: {e}", exc_info=True)
         return jsonify({'status': 'error', 'message': f'An internal error occurred: {str(e)}'}), 500
 
-@app.route('/api/collect', methods=['POST'])
-def collect_feedback_route():
-    """Enhanced collection route with source configuration support"""
+def _enabled_repositories(source_config):
+    """Return the enabled repositories for a GitHub source, honouring the legacy single-repo config"""
+    repositories = source_config.get('repositories', [])
+    if not repositories:
+        # Fallback to single repo config for backward compatibility
+        repositories = [{
+            'owner': source_config.get('owner', 'microsoft'),
+            'repo': source_config.get('repo', 'Microsoft-Fabric-workload-development-sample'),
+            'enabled': True
+        }]
+    
+    # Filter to only enabled repositories
+    return [r for r in repositories if r.get('enabled', True)]
+
+def _collect_repository(collector_cls, github_session, repo_config, settings, icon):
+    """Run one GitHub collector against a single repository"""
+    repo_owner = repo_config.get('owner')
+    repo_name = repo_config.get('repo')
+    
+    if not repo_owner or not repo_name:
+        logger.warning(f"Skipping invalid repository config: {repo_config}")
+        return []
+    
+    logger.info(f"  {icon} Collecting from {repo_owner}/{repo_name}")
+    
+    collector = collector_cls(session=github_session)
+    collector.configure({'owner': repo_owner, 'repo': repo_name, **settings})
+    
+    repo_feedback = collector.collect()
+    logger.info(f"  ✓ Found {len(repo_feedback)} items from {repo_owner}/{repo_name}")
+    return repo_feedback
+
+def _collect_repositories(collector_cls, enabled_repos, settings, icon):
+    """Collect from all repositories in parallel over one pooled GitHub session, keeping repository order"""
+    if not enabled_repos:
+        return []
+    
+    with create_github_session() as github_session:
+        with ThreadPoolExecutor(max_workers=min(len(enabled_repos), 8)) as executor:
+            repo_results = executor.map(
+                lambda repo_config: _collect_repository(collector_cls, github_session, repo_config, settings, icon),
+                enabled_repos
+            )
+            return list(chain.from_iterable(repo_results))
+
+def _safe_ado_str(obj, key, default=''):
+    """Read an ADO work item field as a string, mapping None/NaN to the default"""
+    value = obj.get(key, default)
+    if value is None or value != value:  # NaN is the only value not equal to itself
+        return default
+    return str(value) if value != default else default
+
+def _collect_reddit(reddit_config):
+    """Collect posts from the configured subreddit"""
+    logger.info(f"🔴 REDDIT: Collecting from r/{reddit_config.get('subreddit', 'MicrosoftFabric')}")
+    
+    reddit_collector = RedditCollector()
+    
+    # Pass configuration to collector if it supports it
+    if hasattr(reddit_collector, 'configure'):
+        reddit_collector.configure({
+            'subreddit': reddit_config.get('subreddit', 'MicrosoftFabric'),
+            'sort': reddit_config.get('sort', 'new'),
+            'time_filter': reddit_config.get('timeFilter', 'month'),
+            'max_items': reddit_config.get('maxItems', 200)
+        })
+    
+    reddit_feedback = reddit_collector.collect()
+    logger.info(f"Reddit collector found {len(reddit_feedback)} items.")
+    return reddit_feedback, {}
+
+def _collect_fabric_community(fabric_config):
+    """Collect posts from the Fabric Community forums"""
+    logger.info(f"🔷 FABRIC COMMUNITY: Collecting feedback")
+    
+    fabric_collector = FabricCommunityCollector()
+    
+    # Pass configuration to collector if it supports it
+    if hasattr(fabric_collector, 'configure'):
+        fabric_collector.configure({
+            'max_items': fabric_config.get('maxItems', 200)
+        })
+    
+    fabric_feedback = fabric_collector.collect()
+    logger.info(f"Fabric Community collector found {len(fabric_feedback)} items.")
+    return fabric_feedback, {}
+
+def _collect_github_discussions(github_config):
+    """Collect GitHub Discussions from every enabled repository"""
+    enabled_repos = _enabled_repositories(github_config)
+    logger.info(f"🐙 GITHUB DISCUSSIONS: Collecting from {len(enabled_repos)} repositories")
+    
+    github_feedback = _collect_repositories(GitHubDiscussionsCollector, enabled_repos, {
+        'state': github_config.get('state', 'all'),
+        'max_items': github_config.get('maxItems', 200)
+    }, '💬')
+    
+    logger.info(f"GitHub Discussions collector found {len(github_feedback)} total items from {len(enabled_repos)} repositories.")
+    return github_feedback, {'repositories': len(enabled_repos)}
+
+def _collect_github_issues(github_issues_config):
+    """Collect GitHub Issues from every enabled repository"""
+    enabled_repos = _enabled_repositories(github_issues_config)
+    logger.info(f"🐙 GITHUB ISSUES: Collecting from {len(enabled_repos)} repositories")
+    
+    github_issues_feedback = _collect_repositories(GitHubIssuesCollector, enabled_repos, {
+        'max_items': github_issues_config.get('maxItems', 200)
+    }, '📦')
+    
+    logger.info(f"GitHub Issues collector found {len(github_issues_feedback)} total items from {len(enabled_repos)} repositories.")
+    return github_issues_feedback, {'repositories': len(enabled_repos)}
+
+def _collect_ado(ado_config):
+    """Collect child work items of the configured Azure DevOps parent"""
+    # Use ado_config from frontend first, fallback to environment config (config module)
+    parent_work_item_id = ado_config.get('parentWorkItem') or config.ADO_PARENT_WORK_ITEM_ID or '1319103'
+    logger.info(f"🔗 AZURE DEVOPS: Collecting children of work item {parent_work_item_id}")
+    
+    # Get work items using the working client
+    ado_workitems = get_working_ado_items(
+        parent_work_item_id=parent_work_item_id, 
+        top=ado_config.get('maxItems', 200)
+    )
+    logger.info(f"📊 Working client found {len(ado_workitems)} children work items")
+    
+    # Convert work items to feedback format (module functions bound once for the loop)
+    clean_text = utils.clean_feedback_text
+    categorize = utils.enhanced_categorize_feedback
+    generate_gist = utils.generate_feedback_gist
+    ado_feedback = []
+    sentiment_texts = []
+    for item in ado_workitems:
+        get = item.get
+        work_item_id = get('id')
+        title = get('title', '')
+        description = get('description', '')
+        ado_url = get('url')
+        
+        # Clean the text to remove HTML/CSS formatting
+        cleaned_title = clean_text(title)
+        cleaned_description = clean_text(description) if description and description != 'No description available' else ""
+        
+        # Use cleaned description + title for content
+        full_content = cleaned_title
+        if cleaned_description:
+            full_content += f"\n\n{cleaned_description}"
+        
+        # Enhanced categorization
+        enhanced_cat = categorize(
+            full_content,
+            source='Azure DevOps',
+            scenario='Internal',
+            organization='ADO/WorkingClient'
+        )
+        
+        # Sentiment of the cleaned content is scored for all items in one batch below
+        sentiment_texts.append(cleaned_description if cleaned_description else cleaned_title)
+        
+        ado_feedback.append({
+            'Title': f"[ADO-{work_item_id}] {cleaned_title}",
+            'Feedback_Gist': generate_gist(full_content),
+            'Feedback': full_content,
+            'Content': full_content,
+            'Author': get('createdBy', ''),
+            'Created': get('createdDate', ''),
+            'Url': ado_url,
+            'URL': ado_url,
+            'Sources': 'Azure DevOps',
+            'Category': enhanced_cat['legacy_category'],
+            'Enhanced_Category': enhanced_cat['primary_category'],
+            'Subcategory': enhanced_cat['subcategory'],
+            'Audience': enhanced_cat['audience'],
+            'Priority': enhanced_cat['priority'],
+            'Feature_Area': enhanced_cat['feature_area'],
+            'Categorization_Confidence': enhanced_cat['confidence'],
+            'Domains': enhanced_cat.get('domains', []),
+            'Primary_Domain': enhanced_cat.get('primary_domain', None),
+            'Sentiment': None,
+            'Sentiment_Score': None,
+            'Sentiment_Confidence': None,
+            'ADO_ID': work_item_id,
+            'ADO_Type': _safe_ado_str(item, 'type', ''),
+            'ADO_State': _safe_ado_str(item, 'state', ''),
+            'ADO_AssignedTo': _safe_ado_str(item, 'assignedTo', '')
+        })
+    
+    for feedback_item, sentiment_analysis in zip(ado_feedback, utils.analyze_sentiment_batch(sentiment_texts)):
+        feedback_item['Sentiment'] = sentiment_analysis['label']
+        feedback_item['Sentiment_Score'] = sentiment_analysis['polarity']
+        feedback_item['Sentiment_Confidence'] = sentiment_analysis['confidence']
+    
+    logger.info(f"🔗 Working ADO client found {len(ado_feedback)} children work items from parent {parent_work_item_id}.")
+    return ado_feedback, {}
+
+# Request source key -> (display name, collector, key reported in collection_status['source_counts'])
+# Order matters: the combined feedback list follows it regardless of which collector finishes first
+_COLLECTION_SOURCES = {
+    'reddit': ('Reddit', _collect_reddit, 'reddit'),
+    'fabricCommunity': ('Fabric Community', _collect_fabric_community, 'fabricCommunity'),
+    'github': ('GitHub Discussions', _collect_github_discussions, 'github'),
+    'githubIssues': ('GitHub Issues', _collect_github_issues, 'github_issues'),
+    'ado': ('Azure DevOps', _collect_ado, 'ado'),
+}
+
+def _run_collection(request_config, stored_token):
+    """Run a full collection for the given request configuration; returns (response body, HTTP status)"""
     global last_collected_feedback, last_collection_summary, collection_status
     last_collected_feedback = []
+    _reindex_feedback()
     
     logger.info("🚀 COLLECTION STARTED: Beginning feedback collection process")
     
     # Completely reset collection status to running (clears all old values)
-    collection_status.clear()
-    collection_status.update({
-        'status': 'running',
-        'message': 'Collection in progress...',
-        'start_time': datetime.now().isoformat(),
-        'end_time': None,
-        'total_items': 0,
-        'current_source': 'Initializing',
-        'sources_completed': [],
-        'error_message': None,
-        'progress': 0,
-        'source_counts': {}
-    })
+    with collection_status_lock:
+        collection_status.clear()
+        collection_status.update({
+            'status': 'running',
+            'message': 'Collection in progress...',
+            'start_time': datetime.now().isoformat(),
+            'end_time': None,
+            'total_items': 0,
+            'current_source': 'Initializing',
+            'sources_completed': [],
+            'error_message': None,
+            'progress': 0,
+            'source_counts': {}
+        })
+        collection_status_changed.notify_all()
     
     try:
         logger.info("Starting enhanced feedback collection process via API.")
         
-        # Get configuration from request (renamed to avoid shadowing config module)
-        request_config = {}
-        if request.is_json:
-            request_config = request.get_json() or {}
-        
         # Extract source configurations
         source_configs = request_config.get('sources', {})
         settings = request_config.get('settings', {})
         
         # Check if we're in online mode (connected to Fabric)
-        from flask import session
-        stored_token = session.get('fabric_bearer_token')
-        is_online_mode = stored_token and stored_token.strip() and stored_token != 'None'
+        is_online_mode = has_usable_token(stored_token)
         
         logger.info(f"🔍 COLLECTION MODE CHECK: {'ONLINE' if is_online_mode else 'OFFLINE'} - Token: {'Present' if stored_token else 'None'}")
         # Count enabled sources for progress tracking
@@ -391,289 +938,64 @@ def collect_feedback_route():
         # Prevent division by zero
         if total_sources == 0:
             logger.warning("No sources enabled for collection")
-            collection_status.update({
-                'status': 'error',
-                'message': 'No sources enabled for collection',
-                'end_time': datetime.now().isoformat(),
-                'error_message': 'Please enable at least one data source'
-            })
-            return jsonify({"error": "No sources enabled for collection"}), 400
+            update_collection_status(
+                status='error',
+                message='No sources enabled for collection',
+                end_time=datetime.now().isoformat(),
+                error_message='Please enable at least one data source'
+            )
+            return {"error": "No sources enabled for collection"}, 400
         
         logger.info(f"📋 COLLECTION CONFIG: {total_sources} sources enabled: {enabled_sources}")
         
-        # Reload keywords, categories, and impact types from files before collection
-        # This ensures we use the latest configuration set via the web UI
-        import config as cfg
-        cfg.KEYWORDS = cfg.load_keywords()
-        cfg.ENHANCED_FEEDBACK_CATEGORIES = cfg.load_categories()
-        cfg.IMPACT_TYPES_CONFIG = cfg.load_impact_types()
-        logger.info(f"🔄 Reloaded config - Keywords: {len(cfg.KEYWORDS)}, Categories: {len(cfg.ENHANCED_FEEDBACK_CATEGORIES)}, Impact Types: {len(cfg.IMPACT_TYPES_CONFIG)}")
-        logger.info(f"📝 Current keywords: {cfg.KEYWORDS}")
+        # Reload keywords, categories, and impact types before collection so the latest web UI
+        # configuration is used; the loaders only re-read files whose mtime changed
+        config.KEYWORDS = config.load_keywords()
+        config.ENHANCED_FEEDBACK_CATEGORIES = config.load_categories()
+        config.IMPACT_TYPES_CONFIG = config.load_impact_types()
+        logger.info(f"🔄 Reloaded config - Keywords: {len(config.KEYWORDS)}, Categories: {len(config.ENHANCED_FEEDBACK_CATEGORIES)}, Impact Types: {len(config.IMPACT_TYPES_CONFIG)}")
+        logger.info(f"📝 Current keywords: {config.KEYWORDS}")
         
-        all_feedback = []
         results = {}
         
-        # Initialize all feedback variables to empty lists
-        reddit_feedback = []
-        fabric_feedback = []
-        github_feedback = []
-        github_issues_feedback = []
-        ado_feedback = []
-        
-        # Collect from Reddit if enabled
-        if source_configs.get('reddit', {}).get('enabled', False):
-            collection_status['current_source'] = 'Reddit'
-            collection_status['message'] = 'Collecting from Reddit...'
-            reddit_config = source_configs['reddit']
-            logger.info(f"🔴 REDDIT: Collecting from r/{reddit_config.get('subreddit', 'MicrosoftFabric')}")
-            
-            reddit_collector = RedditCollector()
-            
-            # Pass configuration to collector if it supports it
-            if hasattr(reddit_collector, 'configure'):
-                reddit_collector.configure({
-                    'subreddit': reddit_config.get('subreddit', 'MicrosoftFabric'),
-                    'sort': reddit_config.get('sort', 'new'),
-                    'time_filter': reddit_config.get('timeFilter', 'month'),
-                    'max_items': reddit_config.get('maxItems', 200)
-                })
-            
-            reddit_feedback = reddit_collector.collect()
-            logger.info(f"Reddit collector found {len(reddit_feedback)} items.")
-            collection_status['sources_completed'].append('Reddit')
-            if total_sources > 0:
-                collection_status['progress'] = (len(collection_status['sources_completed']) / total_sources) * 100
-            # Add source counts for real-time updates
-            collection_status['source_counts'] = collection_status.get('source_counts', {})
-            collection_status['source_counts']['reddit'] = len(reddit_feedback)
-            all_feedback.extend(reddit_feedback)
-            results['reddit'] = {'count': len(reddit_feedback), 'completed': True}
-        
-        # Collect from Fabric Community if enabled
-        if source_configs.get('fabricCommunity', {}).get('enabled', False):
-            collection_status['current_source'] = 'Fabric Community'
-            collection_status['message'] = 'Collecting from Fabric Community...'
-            fabric_config = source_configs['fabricCommunity']
-            logger.info(f"🔷 FABRIC COMMUNITY: Collecting feedback")
-            
-            fabric_collector = FabricCommunityCollector()
-            
-            # Pass configuration to collector if it supports it
-            if hasattr(fabric_collector, 'configure'):
-                fabric_collector.configure({
-                    'max_items': fabric_config.get('maxItems', 200)
-                })
-            
-            fabric_feedback = fabric_collector.collect()
-            logger.info(f"Fabric Community collector found {len(fabric_feedback)} items.")
-            collection_status['sources_completed'].append('Fabric Community')
-            if total_sources > 0:
-                collection_status['progress'] = (len(collection_status['sources_completed']) / total_sources) * 100
-            # Add source counts for real-time updates
-            collection_status['source_counts'] = collection_status.get('source_counts', {})
-            collection_status['source_counts']['fabricCommunity'] = len(fabric_feedback)
-            all_feedback.extend(fabric_feedback)
-            results['fabricCommunity'] = {'count': len(fabric_feedback), 'completed': True}
-        
-        # Collect from GitHub if enabled
-        if source_configs.get('github', {}).get('enabled', False):
-            collection_status['current_source'] = 'GitHub Discussions'
-            collection_status['message'] = 'Collecting from GitHub Discussions...'
-            github_config = source_configs['github']
-            
-            # Get list of repositories to collect from
-            repositories = github_config.get('repositories', [])
-            if not repositories:
-                # Fallback to single repo config for backward compatibility
-                repositories = [{
-                    'owner': github_config.get('owner', 'microsoft'),
-                    'repo': github_config.get('repo', 'Microsoft-Fabric-workload-development-sample'),
-                    'enabled': True
-                }]
-            
-            # Filter to only enabled repositories
-            enabled_repos = [r for r in repositories if r.get('enabled', True)]
-            logger.info(f"🐙 GITHUB DISCUSSIONS: Collecting from {len(enabled_repos)} repositories")
-            
-            github_feedback = []
-            for repo_config in enabled_repos:
-                repo_owner = repo_config.get('owner')
-                repo_name = repo_config.get('repo')
-                
-                if not repo_owner or not repo_name:
-                    logger.warning(f"Skipping invalid repository config: {repo_config}")
-                    continue
-                
-                logger.info(f"  💬 Collecting from {repo_owner}/{repo_name}")
-                
-                github_collector = GitHubDiscussionsCollector()
-                
-                # Configure collector with specific repo
-                if hasattr(github_collector, 'configure'):
-                    github_collector.configure({
-                        'owner': repo_owner,
-                        'repo': repo_name,
-                        'state': github_config.get('state', 'all'),
-                        'max_items': github_config.get('maxItems', 200)
-                    })
-                
-                repo_feedback = github_collector.collect()
-                logger.info(f"  ✓ Found {len(repo_feedback)} items from {repo_owner}/{repo_name}")
-                github_feedback.extend(repo_feedback)
-            
-            logger.info(f"GitHub Discussions collector found {len(github_feedback)} total items from {len(enabled_repos)} repositories.")
-            collection_status['sources_completed'].append('GitHub Discussions')
-            if total_sources > 0:
-                collection_status['progress'] = (len(collection_status['sources_completed']) / total_sources) * 100
-            # Add source counts for real-time updates
-            collection_status['source_counts'] = collection_status.get('source_counts', {})
-            collection_status['source_counts']['github'] = len(github_feedback)
-            all_feedback.extend(github_feedback)
-            results['github'] = {'count': len(github_feedback), 'completed': True, 'repositories': len(enabled_repos)}
-        
-        # Collect from GitHub Issues if enabled
-        if source_configs.get('githubIssues', {}).get('enabled', False):
-            collection_status['current_source'] = 'GitHub Issues'
-            collection_status['message'] = 'Collecting from GitHub Issues...'
-            github_issues_config = source_configs['githubIssues']
-            
-            # Get list of repositories to collect from
-            repositories = github_issues_config.get('repositories', [])
-            if not repositories:
-                # Fallback to single repo config for backward compatibility
-                repositories = [{
-                    'owner': github_issues_config.get('owner', 'microsoft'),
-                    'repo': github_issues_config.get('repo', 'Microsoft-Fabric-workload-development-sample'),
-                    'enabled': True
-                }]
-            
-            # Filter to only enabled repositories
-            enabled_repos = [r for r in repositories if r.get('enabled', True)]
-            logger.info(f"🐙 GITHUB ISSUES: Collecting from {len(enabled_repos)} repositories")
-            
-            github_issues_feedback = []
-            for repo_config in enabled_repos:
-                repo_owner = repo_config.get('owner')
-                repo_name = repo_config.get('repo')
-                
-                if not repo_owner or not repo_name:
-                    logger.warning(f"Skipping invalid repository config: {repo_config}")
-                    continue
-                
-                logger.info(f"  📦 Collecting from {repo_owner}/{repo_name}")
-                
-                github_issues_collector = GitHubIssuesCollector()
-                
-                # Pass configuration to collector
-                github_issues_collector.configure({
-                    'owner': repo_owner,
-                    'repo': repo_name,
-                    'max_items': github_issues_config.get('maxItems', 200)
-                })
-                
-                repo_feedback = github_issues_collector.collect()
-                logger.info(f"  ✓ Found {len(repo_feedback)} items from {repo_owner}/{repo_name}")
-                github_issues_feedback.extend(repo_feedback)
-            
-            logger.info(f"GitHub Issues collector found {len(github_issues_feedback)} total items from {len(enabled_repos)} repositories.")
-            collection_status['sources_completed'].append('GitHub Issues')
-            if total_sources > 0:
-                collection_status['progress'] = (len(collection_status['sources_completed']) / total_sources) * 100
-            # Add source counts for real-time updates
-            collection_status['source_counts'] = collection_status.get('source_counts', {})
-            collection_status['source_counts']['github_issues'] = len(github_issues_feedback)
-            all_feedback.extend(github_issues_feedback)
-            results['githubIssues'] = {'count': len(github_issues_feedback), 'completed': True, 'repositories': len(enabled_repos)}
-        
-        # Collect from Azure DevOps if enabled
-        if source_configs.get('ado', {}).get('enabled', False):
-            collection_status['current_source'] = 'Azure DevOps'
-            collection_status['message'] = 'Collecting from Azure DevOps...'
-            ado_config = source_configs['ado']
-            # Use ado_config from frontend first, fallback to environment config (cfg module)
-            parent_work_item_id = ado_config.get('parentWorkItem') or cfg.ADO_PARENT_WORK_ITEM_ID or '1319103'
-            logger.info(f"🔗 AZURE DEVOPS: Collecting children of work item {parent_work_item_id}")
-            
-            # Get work items using the working client
-            ado_workitems = get_working_ado_items(
-                parent_work_item_id=parent_work_item_id, 
-                top=ado_config.get('maxItems', 200)
-            )
-            logger.info(f"📊 Working client found {len(ado_workitems)} children work items")
-            
-            # Convert work items to feedback format
-            ado_feedback = []
-            for item in ado_workitems:
-                work_item_id = item.get('id')
-                title = item.get('title', '')
-                description = item.get('description', '')
-                ado_url = item.get('url')
-                
-                # Clean and handle None/NaN values
-                def safe_get(obj, key, default=''):
-                    import math
-                    value = obj.get(key, default)
-                    if value is None or (isinstance(value, float) and math.isnan(value)):
-                        return default
-                    return str(value) if value != default else default
-                
-                # Clean the text to remove HTML/CSS formatting
-                cleaned_title = utils.clean_feedback_text(title)
-                cleaned_description = utils.clean_feedback_text(description) if description and description != 'No description available' else ""
-                
-                # Use cleaned description + title for content
-                full_content = cleaned_title
-                if cleaned_description:
-                    full_content += f"\n\n{cleaned_description}"
-                
-                # Enhanced categorization
-                enhanced_cat = utils.enhanced_categorize_feedback(
-                    full_content,
-                    source='Azure DevOps',
-                    scenario='Internal',
-                    organization='ADO/WorkingClient'
-                )
-                
-                # Analyze sentiment of the cleaned content
-                sentiment_analysis = utils.analyze_sentiment(cleaned_description if cleaned_description else cleaned_title)
+        # Run the enabled collectors concurrently; each one is I/O bound against a different host
+        sources_to_run = [key for key in _COLLECTION_SOURCES if source_configs.get(key, {}).get('enabled', False)]
+        running_sources = [_COLLECTION_SOURCES[key][0] for key in sources_to_run]
+        update_collection_status(
+            current_source=', '.join(running_sources),
+            message=f"Collecting from {', '.join(running_sources)}..."
+        )
+        
+        feedback_by_source = {}
+        with ThreadPoolExecutor(max_workers=max(len(sources_to_run), 1)) as executor:
+            futures = {
+                executor.submit(_COLLECTION_SOURCES[key][1], source_configs[key]): key
+                for key in sources_to_run
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                display_name, _, count_key = _COLLECTION_SOURCES[key]
+                source_feedback, extra_results = future.result()
+                feedback_by_source[key] = source_feedback
+                results[key] = {'count': len(source_feedback), 'completed': True, **extra_results}
                 
-                ado_feedback.append({
-                    'Title': f"[ADO-{work_item_id}] {cleaned_title}",
-                    'Feedback_Gist': utils.generate_feedback_gist(full_content),
-                    'Feedback': full_content,
-                    'Content': full_content,
-                    'Author': item.get('createdBy', ''),
-                    'Created': item.get('createdDate', ''),
-                    'Url': ado_url,
-                    'URL': ado_url,
-                    'Sources': 'Azure DevOps',
-                    'Category': enhanced_cat['legacy_category'],
-                    'Enhanced_Category': enhanced_cat['primary_category'],
-                    'Subcategory': enhanced_cat['subcategory'],
-                    'Audience': enhanced_cat['audience'],
-                    'Priority': enhanced_cat['priority'],
-                    'Feature_Area': enhanced_cat['feature_area'],
-                    'Categorization_Confidence': enhanced_cat['confidence'],
-                    'Domains': enhanced_cat.get('domains', []),
-                    'Primary_Domain': enhanced_cat.get('primary_domain', None),
-                    'Sentiment': sentiment_analysis['label'],
-                    'Sentiment_Score': sentiment_analysis['polarity'],
-                    'Sentiment_Confidence': sentiment_analysis['confidence'],
-                    'ADO_ID': work_item_id,
-                    'ADO_Type': safe_get(item, 'type', ''),
-                    'ADO_State': safe_get(item, 'state', ''),
-                    'ADO_AssignedTo': safe_get(item, 'assignedTo', '')
-                })
-            
-            logger.info(f"🔗 Working ADO client found {len(ado_feedback)} children work items from parent {parent_work_item_id}.")
-            collection_status['sources_completed'].append('Azure DevOps')
-            if total_sources > 0:
-                collection_status['progress'] = (len(collection_status['sources_completed']) / total_sources) * 100
-            # Add source counts for real-time updates
-            collection_status['source_counts'] = collection_status.get('source_counts', {})
-            collection_status['source_counts']['ado'] = len(ado_feedback)
-            all_feedback.extend(ado_feedback)
-            results['ado'] = {'count': len(ado_feedback), 'completed': True}
+                running_sources.remove(display_name)
+                with collection_status_lock:
+                    collection_status['current_source'] = ', '.join(running_sources) or display_name
+                    collection_status['sources_completed'].append(display_name)
+                    collection_status['progress'] = (len(collection_status['sources_completed']) / total_sources) * 100
+                    # Add source counts for real-time updates
+                    collection_status['source_counts'][count_key] = len(source_feedback)
+                    collection_status_changed.notify_all()
+        
+        # Combine in source order so results are deterministic regardless of completion order
+        all_feedback = list(chain.from_iterable(feedback_by_source[key] for key in sources_to_run))
+        
+        reddit_feedback = feedback_by_source.get('reddit', [])
+        fabric_feedback = feedback_by_source.get('fabricCommunity', [])
+        github_feedback = feedback_by_source.get('github', [])
+        github_issues_feedback = feedback_by_source.get('githubIssues', [])
+        ado_feedback = feedback_by_source.get('ado', [])
         
         # Log sample work items
         if ado_feedback:
@@ -681,63 +1003,61 @@ def collect_feedback_route():
             for item in ado_feedback[:3]:
                 logger.info(f"  - {item['Title']} | URL: {item['URL']}")
         
-        # Apply sentiment analysis to all feedback sources
-        def add_sentiment_to_feedback(feedback_list, source_name):
-            for item in feedback_list:
-                if 'Sentiment_Score' not in item or item.get('Sentiment_Score') is None:
-                    # Get the text content for sentiment analysis
-                    text_content = item.get('Feedback', '') or item.get('Content', '') or item.get('Title', '')
-                    sentiment_analysis = utils.analyze_sentiment(text_content)
-                    
-                    item['Sentiment'] = sentiment_analysis['label']
-                    item['Sentiment_Score'] = sentiment_analysis['polarity']
-                    item['Sentiment_Confidence'] = sentiment_analysis['confidence']
-                    
-                    logger.debug(f"Added sentiment analysis to {source_name} item: {sentiment_analysis['label']} ({sentiment_analysis['polarity']})")
-            return feedback_list
-        
-        # Add sentiment analysis to all feedback sources
-        reddit_feedback = add_sentiment_to_feedback(reddit_feedback, "Reddit")
-        fabric_feedback = add_sentiment_to_feedback(fabric_feedback, "Fabric Community")
-        github_feedback = add_sentiment_to_feedback(github_feedback, "GitHub Discussions")
-        github_issues_feedback = add_sentiment_to_feedback(github_issues_feedback, "GitHub Issues")
-        
         # Note: all_feedback was already built by extending with each source
         # No need to combine again as it would lose the items
         logger.info(f"Final feedback counts: Reddit={len(reddit_feedback)}, Fabric={len(fabric_feedback)}, GitHub Discussions={len(github_feedback)}, GitHub Issues={len(github_issues_feedback)}, ADO={len(ado_feedback)}, Total={len(all_feedback)}")
         
-        # Generate deterministic IDs for all feedback items BEFORE state initialization
-        from id_generator import FeedbackIDGenerator
-        for feedback_item in all_feedback:
-            if 'Feedback_ID' not in feedback_item or not feedback_item.get('Feedback_ID'):
-                feedback_item['Feedback_ID'] = FeedbackIDGenerator.generate_id_from_feedback_dict(feedback_item)
-                logger.info(f"Generated deterministic ID for item: {feedback_item['Feedback_ID']}")
-                # Use the actual field names from collectors
-                title = feedback_item.get('Feedback_Gist') or feedback_item.get('Title', 'N/A')
-                content = feedback_item.get('Feedback') or feedback_item.get('Content', 'N/A')
-                source = feedback_item.get('Sources') or feedback_item.get('Source', 'N/A')
-                author = feedback_item.get('Customer') or feedback_item.get('Author', 'N/A')
-                logger.info(f"  Title: {title}")
-                logger.info(f"  Content: {str(content)[:100]}...")
-                logger.info(f"  Source: {source}")
-                logger.info(f"  Author: {author}")
-        
-        # Check if we're in online mode (connected to Fabric)
-        from flask import session
-        stored_token = session.get('fabric_bearer_token')
-        is_online_mode = stored_token and stored_token.strip() and stored_token != 'None'
-        
         # OFFLINE COLLECTION MODE: Skip SQL state preservation to avoid authentication prompts
         # This prevents the collection process from prompting for Fabric authentication
         # State preservation will happen later when user explicitly syncs with Fabric
         logger.info("� COLLECTION MODE: Skipping SQL state preservation during collection to avoid authentication prompts")
         logger.info("ℹ️ Manual state updates will be preserved when you explicitly sync with Fabric after collection")
         
-        # Initialize state management for all feedback items
+        # Single pass over the collected items:
+        # - queue items without a sentiment score for one batched analysis afterwards
+        #   (collectors always set 'Feedback', so the fallbacks are only read when it is empty)
+        # - generate deterministic IDs BEFORE state initialization, which would otherwise assign a random one
+        # - initialize state management fields
+        log_generated_ids = logger.isEnabledFor(logging.DEBUG)
+        generate_id = FeedbackIDGenerator.generate_id_from_feedback_dict
+        initialize_state = state_manager.initialize_feedback_state
+        now_iso = datetime.now().isoformat()
+        pending_sentiment = []
+        sentiment_texts = []
+        generated_ids = 0
         for feedback_item in all_feedback:
-            state_manager.initialize_feedback_state(feedback_item)
+            if feedback_item.get('Sentiment_Score') is None:
+                pending_sentiment.append(feedback_item)
+                sentiment_texts.append(feedback_item.get('Feedback') or feedback_item.get('Content') or feedback_item.get('Title') or '')
+            
+            if not feedback_item.get('Feedback_ID'):
+                feedback_item['Feedback_ID'] = generate_id(feedback_item)
+                generated_ids += 1
+                if log_generated_ids:
+                    # Use the actual field names from collectors
+                    title = feedback_item.get('Feedback_Gist') or feedback_item.get('Title', 'N/A')
+                    content = feedback_item.get('Feedback') or feedback_item.get('Content', 'N/A')
+                    source = feedback_item.get('Sources') or feedback_item.get('Source', 'N/A')
+                    author = feedback_item.get('Customer') or feedback_item.get('Author', 'N/A')
+                    logger.debug(f"Generated deterministic ID for item: {feedback_item['Feedback_ID']}")
+                    logger.debug(f"  Title: {title}")
+                    logger.debug(f"  Content: {str(content)[:100]}...")
+                    logger.debug(f"  Source: {source}")
+                    logger.debug(f"  Author: {author}")
+            
+            initialize_state(feedback_item, now_iso)
+        logger.info(f"🆔 Generated deterministic IDs for {generated_ids} items")
+        
+        if pending_sentiment:
+            sentiments = utils.analyze_sentiment_batch(sentiment_texts)
+            for item, sentiment_analysis in zip(pending_sentiment, sentiments):
+                item['Sentiment'] = sentiment_analysis['label']
+                item['Sentiment_Score'] = sentiment_analysis['polarity']
+                item['Sentiment_Confidence'] = sentiment_analysis['confidence']
+            logger.debug(f"Added sentiment analysis to {len(pending_sentiment)} items")
         
         last_collected_feedback = all_feedback
+        _reindex_feedback()
         last_collection_summary = {
             "reddit": {"count": len(reddit_feedback), "completed": True},
             "fabric": {"count": len(fabric_feedback), "completed": True},
@@ -750,29 +1070,42 @@ def collect_feedback_route():
 
         if not all_feedback:
             logger.info("No feedback items collected in this run.")
-            return jsonify(last_collection_summary)
+            return last_collection_summary, 200
 
         # Save to CSV
         try:
-            df = pd.DataFrame(all_feedback)
             expected_columns = getattr(config, 'TABLE_COLUMNS', getattr(config, 'EXPECTED_COLUMNS', []))
-            if not expected_columns:
-                expected_columns = df.columns.tolist()
+            if expected_columns:
+                # Build only the persisted columns; keys missing from an item become empty cells
+                df = pd.DataFrame(all_feedback, columns=expected_columns)
+            else:
+                df = pd.DataFrame(all_feedback)
                 logger.warning("TABLE_COLUMNS or EXPECTED_COLUMNS not found in config. Using DataFrame's columns.")
-
-            for col in expected_columns:
-                if col not in df.columns:
-                    df[col] = None 
-
-            df = df.reindex(columns=expected_columns)
+            
+            # Store keyword lists as JSON arrays so they load back with a JSON parser
+            if 'Matched_Keywords' in df.columns:
+                df['Matched_Keywords'] = df['Matched_Keywords'].map(
+                    lambda keywords: app.json.dumps(keywords) if isinstance(keywords, list) else keywords
+                )
 
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"feedback_{timestamp}.csv"
             filepath = os.path.join(DATA_DIR, filename)
             
-            df.to_csv(filepath, index=False, encoding='utf-8-sig') 
+            # Arrow cannot write nested cells to CSV, so lists/dicts are flattened to text up front
+            df = df.apply(lambda column: column.map(_export_cell) if column.dtype == object else column)
+            write_feedback_csv(df, filepath)
             logger.info(f"Feedback saved to {filepath}")
             
+            if pyarrow is not None:
+                # Parquet copy for faster reloads; the CSV stays the canonical export
+                parquet_path = os.path.splitext(filepath)[0] + '.parquet'
+                try:
+                    df.to_parquet(parquet_path, index=False, compression='zstd')
+                    logger.info(f"Feedback Parquet copy saved to {parquet_path}")
+                except Exception as e:
+                    logger.warning(f"Could not write Parquet copy of {filename}: {e}")
+            
             current_app.config['LAST_CSV_FILE'] = filename
             
             # Add filename to summary for download link
@@ -781,26 +1114,26 @@ def collect_feedback_route():
         except Exception as e:
             logger.error(f"Error processing or saving feedback to CSV: {e}", exc_info=True)
             # Update status to error
-            collection_status.update({
-                'status': 'error',
-                'message': 'Error saving feedback to CSV',
-                'end_time': datetime.now().isoformat(),
-                'error_message': str(e)
-            })
-            return jsonify({**last_collection_summary, "csv_error": str(e)}), 500
+            update_collection_status(
+                status='error',
+                message='Error saving feedback to CSV',
+                end_time=datetime.now().isoformat(),
+                error_message=str(e)
+            )
+            return {**last_collection_summary, "csv_error": str(e)}, 500
         
         # Update status to completed
-        collection_status.update({
-            'status': 'completed',
-            'message': f'Collection completed successfully - {len(all_feedback)} items collected',
-            'end_time': datetime.now().isoformat(),
-            'total_items': len(all_feedback),
-            'current_source': 'Completed',
-            'progress': 100,
-            'results': results  # Include results for client display
-        })
+        update_collection_status(
+            status='completed',
+            message=f'Collection completed successfully - {len(all_feedback)} items collected',
+            end_time=datetime.now().isoformat(),
+            total_items=len(all_feedback),
+            current_source='Completed',
+            progress=100,
+            results=results  # Include results for client display
+        )
             
-        return jsonify(last_collection_summary)
+        return last_collection_summary, 200
         
     except Exception as e:
         import traceback
@@ -808,31 +1141,53 @@ def collect_feedback_route():
         logger.error(f"Error in collection route: {e}")
         logger.error(f"Full traceback:\n{full_traceback}")
         # Update status to error
-        collection_status.update({
-            'status': 'error',
-            'message': 'Collection failed',
-            'end_time': datetime.now().isoformat(),
-            'error_message': str(e)
-        })
-        return jsonify({"error": str(e)}), 500
+        update_collection_status(
+            status='error',
+            message='Collection failed',
+            end_time=datetime.now().isoformat(),
+            error_message=str(e)
+        )
+        return {"error": str(e)}, 500
+
+@app.route('/api/collect', methods=['POST'])
+def collect_feedback_route():
+    """
+    Enhanced collection route with source configuration support.
+    
+    Runs the collection inline and returns the summary. With ?background=1 (or "background": true
+    in the JSON body) the collection runs on a worker thread and the route answers 202 straight
+    away; progress is then available from /api/collection_status and /api/collection-progress.
+    """
+    # Get configuration from request (renamed to avoid shadowing config module)
+    request_config = {}
+    if request.is_json:
+        request_config = request.get_json() or {}
+    
+    # Session data is only readable on the request thread, so capture it up front
+    stored_token = session.get('fabric_bearer_token')
+    
+    if request.args.get('background') != '1' and request_config.get('background') is not True:
+        response_body, status_code = _run_collection(request_config, stored_token)
+        return jsonify(response_body), status_code
+    
+    with collection_status_lock:
+        if collection_status.get('status') == 'running':
+            return jsonify({'status': 'error', 'message': 'A collection is already running'}), 409
+        collection_status['status'] = 'running'
+        collection_status_changed.notify_all()
+    
+    def run_in_background():
+        with app.app_context():
+            _run_collection(request_config, stored_token)
+    
+    threading.Thread(target=run_in_background, name='feedback-collection', daemon=True).start()
+    return jsonify({'status': 'running', 'message': 'Collection started'}), 202
 
 @app.route('/feedback')
 def feedback_viewer():
     """Full-featured feedback viewer with template rendering"""
     global last_collected_feedback
     
-    try:
-        import fabric_sql_writer
-    except ImportError as e:
-        logger.warning(f"Fabric SQL Writer not available (ODBC driver missing): {e}")
-        fabric_sql_writer = None
-    except Exception as e:
-        logger.warning(f"Fabric SQL Writer failed to load: {e}")
-        fabric_sql_writer = None
-        
-    import id_generator
-    from id_generator import FeedbackIDGenerator
-    
     # Multi-select filter parameter parsing
     def parse_filter_param(param_name, default='All'):
         """Parse filter parameter that can be single value or comma-separated list"""
@@ -865,41 +1220,36 @@ def feedback_viewer():
     fabric_connected_param = request.args.get('fabric_connected', 'false').lower() == 'true'
     
     # Check authentication tokens and connection states
-    from flask import session
-    stored_token = session.get('fabric_bearer_token')  # Bearer token for lakehouse writes only
+    connection = compute_connection_state(session)
+    stored_token = connection.bearer_token  # Bearer token for lakehouse writes only
+    fabric_sql_connected = connection.fabric_sql_connected
     
     # CRITICAL FIX: Balanced connection logic - conservative for new connections, preserving for valid sessions
-    # Validate both new connections and existing sessions properly
-    has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
-    has_session_flags = session.get('states_loaded') or session.get('sql_data_applied')
-    
     # NEW CONNECTION: URL parameter + bearer token (fresh connection from sync)
-    if fabric_connected_param and has_bearer_token:
+    if fabric_connected_param and connection.has_bearer_token:
         logger.info("🔗 NEW FABRIC CONNECTION: Valid parameter + bearer token detected - setting session flags for persistence.")
-        fabric_sql_connected = True
         session['states_loaded'] = True
         session['sql_data_applied'] = True
+        connection = connection._replace(states_loaded=True, sql_data_applied=True)
     # EXISTING CONNECTION: Valid bearer token + session flags (preserve on page refresh)
-    elif has_bearer_token and has_session_flags:
+    elif connection.has_bearer_token and connection.has_session_flags:
         logger.info("🔒 MAINTAINING CONNECTION: Valid bearer token + session flags - preserving connection state.")
-        fabric_sql_connected = True
     # BEARER TOKEN ONLY: Valid token without session flags (partial connection state)
-    elif has_bearer_token:
+    elif connection.has_bearer_token:
         logger.info("� PARTIAL CONNECTION: Bearer token exists but no session flags - enabling connection for domain updates.")
-        fabric_sql_connected = True
         # Don't set session flags yet - let the sync process do that
     else:
         # No valid connection indicators - clear any stale session flags
         logger.info("❌ NO CONNECTION: No valid connection indicators found - clearing stale flags.")
-        fabric_sql_connected = False
         session.pop('states_loaded', None)
         session.pop('sql_data_applied', None)
+        connection = connection._replace(states_loaded=False, sql_data_applied=False)
         
     # Online mode for lakehouse writes (bearer token based)
-    is_online_mode = stored_token and stored_token.strip() and stored_token != 'None'
+    is_online_mode = connection.has_bearer_token
     
     logger.info(f"Bearer Token Mode: {'ONLINE' if is_online_mode else 'OFFLINE'} - Token: {'Present' if stored_token else 'None'}")
-    logger.info(f"Fabric SQL Connected: {fabric_sql_connected} (states_loaded: {session.get('states_loaded')}, sql_data_applied: {session.get('sql_data_applied')})")
+    logger.info(f"Fabric SQL Connected: {fabric_sql_connected} (states_loaded: {connection.states_loaded}, sql_data_applied: {connection.sql_data_applied})")
     logger.info(f"Fabric Connected Param: {fabric_connected_param}, Has Bearer Token: {bool(stored_token)}")
     
     # If no feedback in memory, try loading from the latest CSV
@@ -908,15 +1258,50 @@ def feedback_viewer():
         last_collected_feedback = load_latest_feedback_from_csv()
         if last_collected_feedback:
             # Basic processing for CSV data
+            now_iso = datetime.now().isoformat()
+            items_without_id = [item for item in last_collected_feedback if not item.get('id')]
+            for item, feedback_id in zip(items_without_id, FeedbackIDGenerator.generate_ids_batch(items_without_id)):
+                item['id'] = feedback_id
             for item in last_collected_feedback:
-                if 'id' not in item or not item['id']:
-                    item['id'] = FeedbackIDGenerator.generate_id_from_feedback_dict(item)
-                state_manager.initialize_feedback_state(item)
+                state_manager.initialize_feedback_state(item, now_iso)
+            _reindex_feedback()
     
-    feedback_to_display = list(last_collected_feedback)
+    # No copy: the list is only read until the display list is gathered after sorting
+    feedback_to_display = last_collected_feedback
     
     logger.info(f"Feedback viewer - Bearer Token Mode: {'ONLINE' if is_online_mode else 'OFFLINE'}, Fabric SQL Connected: {fabric_sql_connected}, Count: {len(feedback_to_display)}")
     
+    # Multi-select filters take precedence; the legacy single-select value applies only when no list was given
+    multi_filters = {
+        'source': source_filters,
+        'enhanced_category': enhanced_category_filters,
+        'audience': audience_filters,
+        'priority': priority_filters,
+        'domain': domain_filters,
+        'sentiment': sentiment_filters,
+        'state': state_filters,
+    }
+    single_filters = {
+        'source': source_filter,
+        'category': category_filter,
+        'enhanced_category': enhanced_category_filter,
+        'audience': audience_filter,
+        'priority': priority_filter,
+        'domain': domain_filter,
+        'sentiment': sentiment_filter,
+        'state': state_filter,
+    }
+    active_multi = {column: values for column, values in multi_filters.items() if values}
+    active_single = {column: value for column, value in single_filters.items()
+                     if value != 'All' and column not in active_multi}
+    
+    # SQL can change state and domain, so only filters on the remaining fields run before the sync
+    pre_sync_multi = {column: values for column, values in active_multi.items() if column not in _SQL_SYNCED_FILTER_COLUMNS}
+    pre_sync_single = {column: value for column, value in active_single.items() if column not in _SQL_SYNCED_FILTER_COLUMNS}
+    mask = feedback_filter_mask(feedback_frame(), pre_sync_multi, pre_sync_single)
+    if pre_sync_multi or pre_sync_single:
+        feedback_to_display = [last_collected_feedback[i] for i in np.flatnonzero(mask).tolist()]
+    
     # ONLINE MODE: Sync with SQL database if connected
     if fabric_sql_connected:
         # Check if SQL data has already been applied to in-memory data
@@ -925,101 +1310,60 @@ def feedback_viewer():
         if sql_data_already_applied:
             logger.info("SQL data already applied in this session. Skipping re-sync.")
         else:
-            logger.info("First load with Fabric connection in this session. Syncing with SQL database.")
+            logger.info(f"Syncing {len(feedback_to_display)} filtered items with SQL database.")
             try:
-                feedback_to_display = fabric_sql_writer.sync_feedback_with_sql(feedback_to_display)
-                session['sql_data_applied'] = True  # Mark as applied for this session
+                feedback_ids = {f.get('Feedback_ID') for f in feedback_to_display}
+                fabric_sql_writer.sync_feedback_with_sql(feedback_to_display, id_whitelist=feedback_ids)
+                invalidate_feedback_frame()
+                # Only a sync over the full list counts as applied; a filtered view syncs just its own slice
+                if len(feedback_to_display) == len(last_collected_feedback):
+                    session['sql_data_applied'] = True
                 logger.info("✅ Successfully synced with SQL database.")
             except Exception as e:
                 logger.error(f"Error syncing with SQL database: {e}", exc_info=True)
                 # Optionally, pass an error to the template
                 # error_message = f"Error syncing with SQL: {e}"
 
-    # Filtering logic (multi-select)
-    if source_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Sources') or f.get('source')) in source_filters]
-    if enhanced_category_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Enhanced_Category') or f.get('enhanced_category')) in enhanced_category_filters]
-    if audience_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Audience') or f.get('audience')) in audience_filters]
-    if priority_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Priority') or f.get('priority')) in priority_filters]
-    if domain_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Primary_Domain') or f.get('domain')) in domain_filters]
-    if sentiment_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Sentiment') or f.get('sentiment')) in sentiment_filters]
-    if state_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('State') or f.get('state')) in state_filters]
-
-    # Filtering logic (single-select, for backwards compatibility)
-    if source_filter != 'All' and not source_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Sources') or f.get('source')) == source_filter]
-    if category_filter != 'All':
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Category') or f.get('category')) == category_filter]
-    if enhanced_category_filter != 'All' and not enhanced_category_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Enhanced_Category') or f.get('enhanced_category')) == enhanced_category_filter]
-    if audience_filter != 'All' and not audience_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Audience') or f.get('audience')) == audience_filter]
-    if priority_filter != 'All' and not priority_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Priority') or f.get('priority')) == priority_filter]
-    if domain_filter != 'All' and not domain_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Primary_Domain') or f.get('domain')) == domain_filter]
-    if sentiment_filter != 'All' and not sentiment_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('Sentiment') or f.get('sentiment')) == sentiment_filter]
-    if state_filter != 'All' and not state_filters:
-        feedback_to_display = [f for f in feedback_to_display if (f.get('State') or f.get('state')) == state_filter]
-
-    # Show only stored feedback if requested
-    if show_only_stored:
-        feedback_to_display = [f for f in feedback_to_display if f.get('is_stored_in_sql', False)]
+    # Filters on SQL-backed fields and the stored flag run on the synced slice
+    post_sync_multi = {column: values for column, values in active_multi.items() if column in _SQL_SYNCED_FILTER_COLUMNS}
+    post_sync_single = {column: value for column, value in active_single.items() if column in _SQL_SYNCED_FILTER_COLUMNS}
+    if post_sync_multi or post_sync_single or show_only_stored:
+        # Reuses the cached frame unless the sync changed items; the pre-sync mask aligns with it row for row
+        mask &= feedback_filter_mask(feedback_frame(), post_sync_multi, post_sync_single, stored_only=show_only_stored)
 
     # Handle repeating feedback
     if not show_repeating:
         # This logic needs to be robust
         pass
 
-    # Sorting
-    if sort_by == 'newest':
-        feedback_to_display.sort(key=lambda x: x.get('Created') or x.get('timestamp', ''), reverse=True)
-    elif sort_by == 'oldest':
-        feedback_to_display.sort(key=lambda x: x.get('Created') or x.get('timestamp', ''))
-    elif sort_by == 'priority':
-        priority_map = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        feedback_to_display.sort(key=lambda x: priority_map.get((x.get('Priority') or x.get('priority', 'low')).lower(), 3))
+    # Sorting runs on row positions; the display list is gathered once, in final order
+    positions = sort_feedback_positions(feedback_frame(), np.flatnonzero(mask), sort_by)
+    feedback_to_display = [last_collected_feedback[i] for i in positions.tolist()]
 
     # Get unique values for filter dropdowns from the originally loaded data
     if last_collected_feedback:
-        # Helper to safely get string values for sorting
-        def safe_str(val):
-            return str(val) if val is not None else ""
-
-        all_sources = sorted(list(set(safe_str(item.get('Sources') or item.get('source')) for item in last_collected_feedback if item.get('Sources') or item.get('source'))))
-        all_categories = sorted(list(set(safe_str(item.get('Category') or item.get('category')) for item in last_collected_feedback if item.get('Category') or item.get('category'))))
-        all_enhanced_categories = sorted(list(set(safe_str(item.get('Enhanced_Category') or item.get('enhanced_category')) for item in last_collected_feedback if item.get('Enhanced_Category') or item.get('enhanced_category'))))
-        all_subcategories = sorted(list(set(safe_str(item.get('Subcategory') or item.get('subcategory')) for item in last_collected_feedback if item.get('Subcategory') or item.get('subcategory'))))
-        
-        # Group subcategories by feature area for organized display
-        subcategories_by_feature_area = {}
-        for item in last_collected_feedback:
-            feature_area = item.get('Feature_Area') or item.get('feature_area')
-            subcategory = item.get('Subcategory') or item.get('subcategory')
-            if feature_area and subcategory:
-                if feature_area not in subcategories_by_feature_area:
-                    subcategories_by_feature_area[feature_area] = set()
-                subcategories_by_feature_area[feature_area].add(subcategory)
-        # Convert sets to sorted lists and sort by feature area
-        # Ensure safe sorting for both keys and values
+        # The cached columnar view of the loaded data feeds every dropdown
+        frame = feedback_frame()
+        all_sources = _present_values(frame['source'])
+        all_categories = _present_values(frame['category'])
+        all_enhanced_categories = _present_values(frame['enhanced_category'])
+        all_subcategories = _present_values(frame['subcategory'])
+        
+        # Group subcategories by feature area for organized display, sorted by their string form
+        feature_areas, subcategories = frame['feature_area'], frame['subcategory']
+        has_both = feature_areas.notna() & feature_areas.astype(bool) & subcategories.notna() & subcategories.astype(bool)
+        grouped = frame[has_both].groupby('feature_area', sort=False)['subcategory'].unique()
         subcategories_by_feature_area = {
-            k: sorted(list(v), key=safe_str) 
-            for k, v in sorted(subcategories_by_feature_area.items(), key=lambda x: safe_str(x[0]))
+            k: sorted(v.tolist(), key=str)
+            for k, v in sorted(grouped.items(), key=lambda x: str(x[0]))
         }
         
-        all_impact_types = sorted(list(set(safe_str(item.get('Impacttype') or item.get('impacttype')) for item in last_collected_feedback if item.get('Impacttype') or item.get('impacttype'))))
-        all_audiences = sorted(list(set(safe_str(item.get('Audience') or item.get('audience')) for item in last_collected_feedback if item.get('Audience') or item.get('audience'))))
+        all_impact_types = _present_values(frame['impact_type'])
+        all_audiences = _present_values(frame['audience'])
         all_priorities = ['critical', 'high', 'medium', 'low']
-        all_domains = sorted(list(set(safe_str(item.get('Primary_Domain') or item.get('domain')) for item in last_collected_feedback if item.get('Primary_Domain') or item.get('domain'))))
-        all_sentiments = sorted(list(set(safe_str(item.get('Sentiment') or item.get('sentiment')) for item in last_collected_feedback if item.get('Sentiment') or item.get('sentiment'))))
-        all_states = sorted(list(set(safe_str(item.get('State') or item.get('state')) for item in last_collected_feedback if item.get('State') or item.get('state'))))
+        all_domains = _present_values(frame['domain'])
+        all_sentiments = _present_values(frame['sentiment'])
+        all_states = _present_values(frame['state'])
         
         # Debug logging for filter data
         logger.info(f"🔍 FILTER DEBUG: Sources: {len(all_sources)}, Domains: {len(all_domains)}, States: {len(all_states)}")
@@ -1033,7 +1377,8 @@ def feedback_viewer():
 
     total_items = len(feedback_to_display)
     
-    return render_template('feedback_viewer.html', 
+    # Stream the page so the browser gets the header and filters while the item rows are still rendering
+    return stream_template('feedback_viewer.html', 
                            feedback_items=feedback_to_display,
                            total_items=total_items,
                            sort_by=sort_by,
@@ -1081,35 +1426,21 @@ def feedback_viewer():
 @app.route('/api/session_state', methods=['GET'])
 def get_session_state():
     """Get current session state for frontend"""
-    from flask import session
-    stored_token = session.get('fabric_bearer_token')
+    # Same connection logic as the feedback_viewer route
+    connection = compute_connection_state(session)
     
-    # Use the SAME logic as feedback_viewer route for consistency
-    has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
-    has_session_flags = session.get('states_loaded') or session.get('sql_data_applied')
-    
-    # Determine connection state using same logic as main route
-    if has_bearer_token and has_session_flags:
-        fabric_sql_connected = True
-    elif has_bearer_token:
-        fabric_sql_connected = True  # Partial connection
-    else:
-        fabric_sql_connected = False
-    
-    logger.info(f"📡 SESSION STATE API: Bearer: {bool(has_bearer_token)}, Flags: {bool(has_session_flags)}, Connected: {fabric_sql_connected}")
+    logger.info(f"📡 SESSION STATE API: Bearer: {connection.has_bearer_token}, Flags: {connection.has_session_flags}, Connected: {connection.fabric_sql_connected}")
     
     return jsonify({
-        'has_bearer_token': has_bearer_token,
-        'fabric_sql_connected': fabric_sql_connected,
-        'states_loaded': session.get('states_loaded', False),
-        'sql_data_applied': session.get('sql_data_applied', False)
+        'has_bearer_token': connection.has_bearer_token,
+        'fabric_sql_connected': connection.fabric_sql_connected,
+        'states_loaded': connection.states_loaded,
+        'sql_data_applied': connection.sql_data_applied
     })
 
 @app.route('/api/clear_session', methods=['POST'])
 def clear_session_state():
     """Clear session state to reset connection status"""
-    from flask import session
-    
     # Clear all Fabric-related session flags
     session.pop('fabric_bearer_token', None)
     session.pop('states_loaded', None)
@@ -1146,15 +1477,13 @@ def write_to_fabric_route():
         logger.info(f"Attempting to write {len(filtered_feedback)} items (filtered from {len(last_collected_feedback)}) to Fabric SQL Database.")
         
         # Use fabric_sql_writer for direct SQL writes
-        try:
-            from fabric_sql_writer import FabricSQLWriter
-        except ImportError as ie:
-            logger.error(f"Failed to import fabric_sql_writer module: {ie}")
-            return jsonify({'status': 'error', 'message': f'Fabric SQL writer module not available: {str(ie)}'}), 500
+        if fabric_sql_writer is None:
+            logger.error("Fabric SQL writer module not available")
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer module not available'}), 500
         
         # Write to SQL database
         try:
-            writer = FabricSQLWriter(bearer_token=fabric_token)
+            writer = fabric_sql_writer.FabricSQLWriter(bearer_token=fabric_token)
             result = writer.bulletproof_sync_with_deduplication(filtered_feedback)
             
             new_items = result.get('new_items', 0)
@@ -1177,14 +1506,43 @@ def write_to_fabric_route():
 
 # Global storage for async operations
 fabric_operations = {}
+# Guards each operation's log queue, which the worker fills and the progress endpoint drains
+fabric_operations_lock = threading.Lock()
+# Oldest log lines are dropped past this many undelivered entries
+FABRIC_OPERATION_LOG_LIMIT = 1000
+# Finished operations stay available to late progress polls for this long
+FABRIC_OPERATION_RETENTION_SECONDS = 3600
+
+def log_fabric_operation(operation_id, message, log_type='info'):
+    """Queue a log line for delivery with the operation's next progress poll"""
+    operation = fabric_operations.get(operation_id)
+    if operation is None:
+        return
+    with fabric_operations_lock:
+        operation['logs'].append({'message': message, 'type': log_type})
+
+def prune_fabric_operations():
+    """Drop operations that finished more than FABRIC_OPERATION_RETENTION_SECONDS ago so the registry stays bounded"""
+    now = datetime.now()
+    with fabric_operations_lock:
+        # Measured from completion, so a long-running write keeps its final status and logs for the full window
+        expired = [operation_id for operation_id, operation in fabric_operations.items()
+                   if operation['completed'] and (now - operation['end_time']).total_seconds() > FABRIC_OPERATION_RETENTION_SECONDS]
+        for operation_id in expired:
+            del fabric_operations[operation_id]
+
+def drain_fabric_logs(operation):
+    """Take every queued log line of an operation, leaving its queue empty"""
+    with fabric_operations_lock:
+        logs = list(operation['logs'])
+        operation['logs'].clear()
+    return logs
 
 @app.route('/api/write_to_fabric_async', methods=['POST'])
 def write_to_fabric_async_endpoint():
     """Start asynchronous write to Fabric SQL Database with progress tracking"""
     try:
         import uuid
-        import threading
-        from datetime import datetime
         
         data = request.get_json()
         fabric_token = data.get('fabric_token')
@@ -1192,6 +1550,9 @@ def write_to_fabric_async_endpoint():
         if not fabric_token:
             return jsonify({'status': 'error', 'message': 'Fabric token is required'}), 400
         
+        if fabric_sql_writer is None:
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer module not available'}), 500
+        
         global last_collected_feedback
         if not last_collected_feedback:
             return jsonify({'status': 'error', 'message': 'No feedback data collected yet or last collection was empty.'}), 400
@@ -1209,43 +1570,48 @@ def write_to_fabric_async_endpoint():
         operation_id = str(uuid.uuid4())
         
         # Initialize operation tracking
-        fabric_operations[operation_id] = {
+        prune_fabric_operations()
+        operation = {
             'status': 'starting',
             'progress': 0,
             'total_items': len(filtered_feedback),
             'processed_items': 0,
             'start_time': datetime.now(),
-            'logs': [],
+            'end_time': None,
+            'logs': deque(maxlen=FABRIC_OPERATION_LOG_LIMIT),
             'completed': False,
             'success': False,
             'message': '',
             'operation': 'Initializing...'
         }
+        with fabric_operations_lock:
+            fabric_operations[operation_id] = operation
+        
+        def report_write_progress(processed_items, total_items):
+            """Publish per-batch progress from the SQL writer to the operation tracker"""
+            fabric_operations[operation_id]['processed_items'] = processed_items
+            fabric_operations[operation_id]['progress'] = int(100 * processed_items / total_items) if total_items else 100
         
-        # Start background thread
+        # Start background thread (with a copy of the request context so the worker can record session flags)
+        @copy_current_request_context
         def fabric_write_worker():
             try:
-                fabric_operations[operation_id]['logs'].append({
-                    'message': f'🚀 Starting Fabric SQL write operation for {len(filtered_feedback)} items (filtered from {len(last_collected_feedback)} total)',
-                    'type': 'info'
-                })
+                log_fabric_operation(operation_id, f'🚀 Starting Fabric SQL write operation for {len(filtered_feedback)} items (filtered from {len(last_collected_feedback)} total)')
                 fabric_operations[operation_id]['status'] = 'in_progress'
                 fabric_operations[operation_id]['operation'] = 'Writing to Fabric SQL Database...'
                 
-                from fabric_sql_writer import FabricSQLWriter
-                
                 # Call SQL writer
-                fabric_operations[operation_id]['logs'].append({
-                    'message': '📝 Writing to Fabric SQL Database...',
-                    'type': 'info'
-                })
+                log_fabric_operation(operation_id, '📝 Writing to Fabric SQL Database...')
                 
-                writer = FabricSQLWriter(bearer_token=fabric_token)
-                result = writer.bulletproof_sync_with_deduplication(filtered_feedback)
+                writer = fabric_sql_writer.FabricSQLWriter(bearer_token=fabric_token)
+                result = writer.write_feedback_bulk(filtered_feedback, progress_callback=report_write_progress)
+                state_manager.invalidate_feedback_states_cache()
+                _reindex_feedback()
                 
                 new_items = result.get('new_items', 0)
                 existing_items = result.get('existing_items', 0)
                 
+                fabric_operations[operation_id]['end_time'] = datetime.now()
                 fabric_operations[operation_id]['completed'] = True
                 fabric_operations[operation_id]['success'] = True
                 fabric_operations[operation_id]['progress'] = 100
@@ -1254,24 +1620,18 @@ def write_to_fabric_async_endpoint():
                 fabric_operations[operation_id]['existing_items'] = existing_items
                 
                 fabric_operations[operation_id]['message'] = f'Successfully wrote {new_items} new items to Fabric SQL Database ({existing_items} already existed)'
-                fabric_operations[operation_id]['logs'].append({
-                    'message': '✅ Fabric SQL write operation completed successfully',
-                    'type': 'success'
-                })
+                log_fabric_operation(operation_id, '✅ Fabric SQL write operation completed successfully', 'success')
                 
                 # Store token in session for feedback viewer
-                from flask import session
                 session['fabric_bearer_token'] = fabric_token
                 session['states_loaded'] = True
                 
             except Exception as e:
+                fabric_operations[operation_id]['end_time'] = datetime.now()
                 fabric_operations[operation_id]['completed'] = True
                 fabric_operations[operation_id]['success'] = False
                 fabric_operations[operation_id]['message'] = f'Error: {str(e)}'
-                fabric_operations[operation_id]['logs'].append({
-                    'message': f'❌ Error during Fabric write: {str(e)}',
-                    'type': 'danger'
-                })
+                log_fabric_operation(operation_id, f'❌ Error during Fabric write: {str(e)}', 'danger')
                 logger.error(f"Error in Fabric write worker: {e}", exc_info=True)
         
         thread = threading.Thread(target=fabric_write_worker)
@@ -1304,27 +1664,24 @@ def load_states_after_fabric_write(fabric_token, operation_id):
         # TODO: Replace with actual Fabric Lakehouse query
         # For now, simulate loading states - in production this would query the Fabric table
         fabric_states = {}
+        now_iso = datetime.now().isoformat()
         for feedback_id in feedback_ids:
             # Mock state loading - in production, this would be a real Fabric query
             # The fabric_writer.py would be extended to also read states
             fabric_states[feedback_id] = {
                 'State': 'NEW',  # This would come from actual Fabric table
                 'Feedback_Notes': '',  # This would come from actual Fabric table
-                'Last_Updated': datetime.now().isoformat(),
+                'Last_Updated': now_iso,
                 'Updated_By': 'System'
             }
         
         # Update in-memory feedback data with loaded states
-        for item in last_collected_feedback:
-            feedback_id = item.get('Feedback_ID')
-            if feedback_id and feedback_id in fabric_states:
-                state_data = fabric_states[feedback_id]
+        for feedback_id, state_data in fabric_states.items():
+            for item in _feedback_by_id.get(feedback_id, ()):
                 item.update(state_data)
+        invalidate_feedback_frame()
         
-        fabric_operations[operation_id]['logs'].append({
-            'message': f'📊 Loaded states for {len(fabric_states)} feedback items',
-            'type': 'info'
-        })
+        log_fabric_operation(operation_id, f'📊 Loaded states for {len(fabric_states)} feedback items')
         
         logger.info(f"Successfully loaded states for {len(fabric_states)} feedback items after Fabric write")
         
@@ -1337,19 +1694,17 @@ def load_states_after_fabric_write(fabric_token, operation_id):
 def get_fabric_progress(operation_id):
     """Get progress of Fabric write operation"""
     try:
-        if operation_id not in fabric_operations:
+        operation = fabric_operations.get(operation_id)
+        if operation is None:
             return jsonify({'error': 'Operation not found'}), 404
         
-        operation = fabric_operations[operation_id]
-        
         # Calculate stats
         stats = {
             'items': operation['processed_items']
         }
         
-        # Get new logs since last check (simplified - returns all logs)
-        logs = operation['logs']
-        operation['logs'] = []  # Clear logs after sending
+        # Get new logs since last check
+        logs = drain_fabric_logs(operation)
         
         return jsonify({
             'progress': operation['progress'],
@@ -1389,10 +1744,7 @@ def cancel_fabric_write(operation_id):
     """Cancel Fabric write operation"""
     try:
         if operation_id in fabric_operations:
-            fabric_operations[operation_id]['logs'].append({
-                'message': 'Cancellation requested',
-                'type': 'warning'
-            })
+            log_fabric_operation(operation_id, 'Cancellation requested', 'warning')
             # Note: Actual cancellation would require more complex implementation
             return jsonify({'status': 'success', 'message': 'Cancellation requested'})
         else:
@@ -1402,8 +1754,37 @@ def cancel_fabric_write(operation_id):
 
 # Modern Filter API Endpoints
 
+# List items (or dict entries) encoded per streamed chunk
+STREAM_JSON_CHUNK_SIZE = 500
+
+def stream_json_object(payload: Dict[str, Any], stream_key: str = 'feedback'):
+    """JSON response written field by field, with the list or dict under stream_key encoded chunk by chunk"""
+    dumps = app.json.dumps
+    
+    def generate():
+        separator = '{'
+        for key, value in payload.items():
+            yield f"{separator}{dumps(key)}:"
+            separator = ','
+            if key == stream_key and isinstance(value, (list, dict)):
+                is_dict = isinstance(value, dict)
+                entries = iter(value.items() if is_dict else value)
+                container = dict if is_dict else list
+                yield '{' if is_dict else '['
+                first = True
+                # Each chunk is encoded as its own container, then unwrapped into the enclosing one
+                while chunk := container(islice(entries, STREAM_JSON_CHUNK_SIZE)):
+                    yield dumps(chunk)[1:-1] if first else f",{dumps(chunk)[1:-1]}"
+                    first = False
+                yield '}' if is_dict else ']'
+            else:
+                yield dumps(value)
+        yield '}' if payload else '{}'
+    
+    return app.response_class(generate(), mimetype='application/json')
+
 def clean_nan_values(data):
-    """Clean NaN values from data for JSON serialization"""
+    """Clean NaN values from data for JSON serialization (needed only without orjson)"""
     import math
     
     if isinstance(data, dict):
@@ -1451,9 +1832,8 @@ def get_filtered_feedback():
         fabric_connected = request.args.get('fabric_connected', 'false').lower() == 'true'
         
         # Check session for Fabric connection
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
-        is_online_mode = stored_token and stored_token.strip() and stored_token != 'None'
+        is_online_mode = has_usable_token(stored_token)
         
         # Load feedback data if not available
         if not last_collected_feedback:
@@ -1461,11 +1841,11 @@ def get_filtered_feedback():
             last_collected_feedback = load_latest_feedback_from_csv()
             
             if last_collected_feedback:
-                from id_generator import FeedbackIDGenerator
                 # Generate IDs for CSV data
-                for item in last_collected_feedback:
-                    if 'Feedback_ID' not in item or not item.get('Feedback_ID'):
-                        item['Feedback_ID'] = FeedbackIDGenerator.generate_id_from_feedback_dict(item)
+                items_without_id = [item for item in last_collected_feedback if not item.get('Feedback_ID')]
+                for item, feedback_id in zip(items_without_id, FeedbackIDGenerator.generate_ids_batch(items_without_id)):
+                    item['Feedback_ID'] = feedback_id
+                _reindex_feedback()
         
         if not last_collected_feedback:
             return jsonify({
@@ -1497,8 +1877,9 @@ def get_filtered_feedback():
         end_idx = start_idx + per_page
         paginated_feedback = feedback_to_display[start_idx:end_idx]
         
-        # Clean NaN values before JSON serialization
-        paginated_feedback = clean_nan_values(paginated_feedback)
+        # orjson already writes NaN as null; only Flask's stdlib encoder needs the values cleaned first
+        if orjson is None:
+            paginated_feedback = clean_nan_values(paginated_feedback)
         
         # Analyze repeating requests if requested
         repeating_analysis = None
@@ -1510,21 +1891,18 @@ def get_filtered_feedback():
         # Get filter options for UI updates (use full dataset for filter options)
         filter_options = extract_filter_options(last_collected_feedback)
         
-        # Get current Fabric state data if available
+        # Current Fabric state for this page, from the SQL state already merged into memory (no query per request)
         fabric_state_data = {}
-        try:
-            if is_online_mode:
-                # Try to load current state from Fabric if connected
-                from fabric_state_writer import FabricStateWriter
-                fabric_writer = FabricStateWriter(stored_token)
-                fabric_state_data = fabric_writer.load_state_data()
-                logger.info(f"Loaded {len(fabric_state_data)} state records for AJAX response")
-        except Exception as e:
-            logger.warning(f"Could not load Fabric state data for AJAX: {e}")
-            fabric_state_data = {}
+        if is_online_mode:
+            fabric_state_data = {
+                item['Feedback_ID']: {src: item.get(dst) for src, dst in _SQL_STATE_FIELD_MAP.items()}
+                for item in paginated_feedback
+                if item.get('is_stored_in_sql') and item.get('Feedback_ID')
+            }
+            logger.info(f"Included {len(fabric_state_data)} state records for AJAX response")
         
-        # Return JSON response
-        return jsonify({
+        # Stream the JSON response so the page's items are encoded one at a time
+        return stream_json_object({
             'success': True,
             'feedback': paginated_feedback,
             'total_count': total_count,
@@ -1557,6 +1935,10 @@ def get_filtered_feedback():
             'message': str(e)
         }), 500
 
+# (canonical frame, filter query -> ordered row positions) for last_collected_feedback; reset when the frame is rebuilt
+_filter_positions_cache = (None, {})
+FILTER_POSITIONS_CACHE_SIZE = 256
+
 def apply_filters_to_feedback(feedback_data, source_filters=None, audience_filters=None, 
                             priority_filters=None, state_filters=None, domain_filters=None,
                             sentiment_filters=None, enhanced_category_filters=None, 
@@ -1568,136 +1950,117 @@ def apply_filters_to_feedback(feedback_data, source_filters=None, audience_filte
     if not feedback_data:
         return []
     
-    filtered_feedback = list(feedback_data)  # Create a copy
-    
-    # Apply search filter
-    if search_query:
-        search_lower = search_query.lower()
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if search_lower in str(item.get('Feedback', '')).lower() or
-               search_lower in str(item.get('Page_Title', '')).lower() or
-               search_lower in str(item.get('Enhanced_Category', '')).lower()
-        ]
-    
-    # Apply source filter
-    if source_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Sources') in source_filters
-        ]
-    
-    # Apply audience filter
-    if audience_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Audience') in audience_filters
-        ]
+    # Exact-match filters run as one vectorized mask over the canonical frame (cached for the in-memory list)
+    in_memory = feedback_data is last_collected_feedback
+    frame = feedback_frame() if in_memory else canonical_feedback_frame(feedback_data)
+    field_filters = {
+        'source': source_filters,
+        'audience': audience_filters,
+        'priority': priority_filters,
+        'state': state_filters,
+        'sentiment': sentiment_filters,
+        'enhanced_category': enhanced_category_filters,
+        'subcategory': subcategory_filters,
+        'impact_type': impacttype_filters,
+    }
     
-    # Apply priority filter
-    if priority_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Priority') in priority_filters
-        ]
+    # Repeated browsing of the in-memory list reuses the ordered row positions of an identical query
+    global _filter_positions_cache
+    cache_key = None
+    if in_memory:
+        cache_key = (
+            tuple((column, tuple(sorted(map(str, values)))) for column, values in field_filters.items() if values),
+            tuple(sorted(map(str, domain_filters or ()))),
+            search_query,
+            sort_by,
+        )
+        cached_frame, cached_positions = _filter_positions_cache
+        if cached_frame is frame and cache_key in cached_positions:
+            return [feedback_data[i] for i in cached_positions[cache_key].tolist()]
     
-    # Apply state filter
-    if state_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('State', 'NEW') in state_filters
-        ]
+    mask = feedback_filter_mask(frame, {column: values for column, values in field_filters.items() if values}, {})
     
-    # Apply domain filter
+    # Domain filter
     if domain_filters:
-        # Handle special "Uncategorized" filter
+        domains = frame['domain']
         if 'Uncategorized' in domain_filters:
             # Include items that match other filters OR have no domain classification
             other_domains = [d for d in domain_filters if d != 'Uncategorized']
-            filtered_feedback = [item for item in filtered_feedback if 
-                              (item.get('Primary_Domain') in other_domains if other_domains else False) or
-                              not item.get('Primary_Domain') or 
-                              item.get('Primary_Domain') in ['', 'None', None]]
+            mask &= (domains.isin(other_domains) | domains.isna() | domains.isin(['', 'None'])).to_numpy()
         else:
             # Normal domain filtering - only show items with matching domains
-            filtered_feedback = [
-                item for item in filtered_feedback
-                if item.get('Primary_Domain') in domain_filters
-            ]
+            mask &= domains.isin(domain_filters).to_numpy()
     
-    # Apply sentiment filter
-    if sentiment_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Sentiment') in sentiment_filters
-        ]
+    positions = np.flatnonzero(mask)
     
-    # Apply enhanced category filter
-    if enhanced_category_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Enhanced_Category') in enhanced_category_filters
-        ]
+    # Search filter on the survivors, over the frame's lowercased search text (built on the first search)
+    if search_query:
+        search_text = feedback_search_text(frame, feedback_data)[positions]
+        hits = pd.Series(search_text, dtype=object).str.contains(search_query.lower(), regex=False).to_numpy(dtype=bool)
+        positions = positions[hits]
     
-    # Apply subcategory filter
-    if subcategory_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Subcategory') in subcategory_filters
-        ]
+    # Apply sorting
+    positions = sort_feedback_positions(frame, positions, sort_by)
+    if sort_by in ('newest', 'oldest') and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Sorted {sort_by} - first dates: {[feedback_data[i].get('Created', '') for i in positions[:3].tolist()]}")
     
-    # Apply impact type filter
-    if impacttype_filters:
-        filtered_feedback = [
-            item for item in filtered_feedback
-            if item.get('Impacttype') in impacttype_filters
-        ]
+    if cache_key is not None:
+        cached_frame, cached_positions = _filter_positions_cache
+        if cached_frame is not frame:
+            cached_positions = {}
+            _filter_positions_cache = (frame, cached_positions)
+        elif len(cached_positions) >= FILTER_POSITIONS_CACHE_SIZE:
+            # Evict the oldest query (dicts keep insertion order)
+            cached_positions.pop(next(iter(cached_positions)), None)
+        cached_positions[cache_key] = positions
     
-    # Apply sorting
-    if sort_by == 'newest':
-        # Debug: check some Created values before sorting
-        sample_dates = [item.get('Created', '') for item in filtered_feedback[:3]]
-        logger.info(f"DEBUG: Sorting newest - sample dates before: {sample_dates}")
-        filtered_feedback.sort(key=lambda x: x.get('Created', ''), reverse=True)
-        sample_dates_after = [item.get('Created', '') for item in filtered_feedback[:3]]
-        logger.info(f"DEBUG: Sorting newest - sample dates after: {sample_dates_after}")
-    elif sort_by == 'oldest':
-        # Debug: check some Created values before sorting
-        sample_dates = [item.get('Created', '') for item in filtered_feedback[:3]]
-        logger.info(f"DEBUG: Sorting oldest - sample dates before: {sample_dates}")
-    elif sort_by == 'priority':
-        priority_order = {'critical': 0, 'high': 1, 'medium': 2, 'low': 3}
-        filtered_feedback.sort(key=lambda x: priority_order.get(x.get('Priority', 'low').lower(), 4))
+    filtered_feedback = [feedback_data[i] for i in positions.tolist()]
     
     return filtered_feedback
 
+# Every configured feedback state, offered as a filter option even when no item has it yet
+_ALL_POSSIBLE_STATES = frozenset(config.FEEDBACK_STATES)
+
+# (canonical frame, options) for last_collected_feedback; a new frame object means the data changed
+_filter_options_cache = (None, None)
+
 def extract_filter_options(feedback_data):
     """Extract available filter options from feedback data"""
+    global _filter_options_cache
     if not feedback_data:
         return {}
     
-    # Helper to safely get string values for sorting
-    def safe_str(val):
-        return str(val) if val is not None else ""
+    # The in-memory list reuses its options until the canonical frame is rebuilt (same invalidation points)
+    if feedback_data is last_collected_feedback:
+        frame = feedback_frame()
+        cached_frame, options = _filter_options_cache
+        if cached_frame is not frame:
+            options = _compute_filter_options(feedback_data)
+            _filter_options_cache = (frame, options)
+        return options
+    return _compute_filter_options(feedback_data)
+
+def _compute_filter_options(feedback_data):
+    """Filter option lists for the given (non-empty) feedback data"""
+    # Distinct values per field, all extracted column-wise from one pass over the records
+    frame = pd.DataFrame.from_records(
+        feedback_data, columns=['Source', 'Audience', 'Priority', 'Enhanced_Domain', 'Sentiment', 'Enhanced_Category', 'State']
+    )
     
-    # Get states currently in the data
-    data_states = set(safe_str(item.get('State', 'NEW')) for item in feedback_data)
+    # Get states currently in the data (items without one are NEW)
+    data_states = set(frame['State'].fillna('NEW').astype(str).unique().tolist())
     
     # Always include all possible states from config, regardless of what's in the data
-    from config import FEEDBACK_STATES
-    all_possible_states = set(FEEDBACK_STATES.keys())
-    
-    # Merge data states with all possible states to ensure comprehensive list
-    comprehensive_states = sorted(list(all_possible_states.union(data_states)))
+    comprehensive_states = sorted(_ALL_POSSIBLE_STATES.union(data_states))
     
     options = {
-        'sources': sorted(list(set(safe_str(item.get('Source', '')) for item in feedback_data if item.get('Source')))),
-        'audiences': sorted(list(set(safe_str(item.get('Audience', '')) for item in feedback_data if item.get('Audience')))),
-        'priorities': sorted(list(set(safe_str(item.get('Priority', '')) for item in feedback_data if item.get('Priority')))),
+        'sources': _present_values(frame['Source']),
+        'audiences': _present_values(frame['Audience']),
+        'priorities': _present_values(frame['Priority']),
         'states': comprehensive_states,  # Always show all possible states
-        'domains': sorted(list(set(safe_str(item.get('Enhanced_Domain', '')) for item in feedback_data if item.get('Enhanced_Domain')))),
-        'sentiments': sorted(list(set(safe_str(item.get('Sentiment', '')) for item in feedback_data if item.get('Sentiment')))),
-        'enhanced_categories': sorted(list(set(safe_str(item.get('Enhanced_Category', '')) for item in feedback_data if item.get('Enhanced_Category'))))
+        'domains': _present_values(frame['Enhanced_Domain']),
+        'sentiments': _present_values(frame['Sentiment']),
+        'enhanced_categories': _present_values(frame['Enhanced_Category'])
     }
     
     return options
@@ -1750,10 +2113,10 @@ def update_feedback_state():
         
         # For now, update in memory (in production, this would update Fabric table)
         global last_collected_feedback
-        for item in last_collected_feedback:
-            if item.get('Feedback_ID') == feedback_id:
-                item.update(update_data)
-                break
+        item = find_feedback(feedback_id)
+        if item is not None:
+            item.update(update_data)
+        invalidate_feedback_frame()
         
         logger.info(f"Updated feedback {feedback_id} state to {new_state} by {user}")
         
@@ -1826,7 +2189,6 @@ def store_session_token():
             return jsonify({'status': 'error', 'message': 'Token required'}), 400
         
         # Store token in session
-        from flask import session
         session['fabric_bearer_token'] = token
         session['states_loaded'] = True
         
@@ -1841,11 +2203,24 @@ def store_session_token():
         logger.error(f"Error storing session token: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+def conditional_json_response(etag_source: bytes, build_body):
+    """Return 304 when the client's If-None-Match matches, otherwise a JSON response with an ETag.
+    
+    build_body returns the encoded JSON string and is only called on a cache miss.
+    """
+    etag = hashlib.blake2b(etag_source, digest_size=8).hexdigest()
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(build_body(), mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
 @app.route('/api/fabric/token/status', methods=['GET'])
 def get_fabric_token_status():
     """Get current Fabric token status"""
     try:
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
         last_validated = session.get('fabric_token_validated_at')
         session_starting = session.get('fabric_session_starting')
@@ -1853,19 +2228,22 @@ def get_fabric_token_status():
         
         # Check if has validated token
         if stored_token:
-            return jsonify({
+            payload = {
                 'has_token': True,
                 'last_validated': last_validated,
                 'session_starting': session_starting or False,
                 'session_id': session_id,
                 'status': 'connected'
-            })
+            }
+        else:
+            # No token
+            payload = {
+                'has_token': False,
+                'status': 'disconnected'
+            }
         
-        # No token
-        return jsonify({
-            'has_token': False,
-            'status': 'disconnected'
-        })
+        etag_source = repr((bool(stored_token), last_validated, session_starting, session_id)).encode()
+        return conditional_json_response(etag_source, lambda: app.json.dumps(payload))
         
     except Exception as e:
         logger.error(f"Error getting token status: {e}")
@@ -1886,27 +2264,27 @@ def validate_fabric_token():
         logger.info(f"🔥 FABRIC TOKEN VALIDATION: Testing token with SQL connection")
         
         # Test token with SQL connection
-        from fabric_sql_writer import FabricSQLWriter
+        if fabric_sql_writer is None:
+            raise ImportError("fabric_sql_writer could not be loaded")
         
         try:
-            writer = FabricSQLWriter(bearer_token=token)
+            writer = fabric_sql_writer.FabricSQLWriter(bearer_token=token)
             conn = writer.connect_with_token(token)
             
             if conn:
                 conn.close()
                 
                 # Token is valid - store it
-                from flask import session as flask_session
-                flask_session['fabric_bearer_token'] = token
-                flask_session['states_loaded'] = True
-                flask_session['fabric_token_validated_at'] = datetime.now().isoformat()
+                session['fabric_bearer_token'] = token
+                session['states_loaded'] = True
+                session['fabric_token_validated_at'] = datetime.now().isoformat()
                 
                 logger.info(f"✅ FABRIC TOKEN VALIDATION: Token validated successfully")
                 
                 return jsonify({
                     'status': 'success',
                     'message': 'Token validated successfully',
-                    'validated_at': flask_session['fabric_token_validated_at']
+                    'validated_at': session['fabric_token_validated_at']
                 })
             else:
                 logger.error(f"❌ FABRIC TOKEN VALIDATION: SQL connection failed")
@@ -1939,8 +2317,6 @@ def validate_fabric_token():
 def clear_fabric_token():
     """Clear stored Fabric token"""
     try:
-        from flask import session
-        
         # Clear token from session
         session.pop('fabric_bearer_token', None)
         session.pop('states_loaded', None)
@@ -1962,13 +2338,18 @@ def collection_progress():
     """Server-Sent Events endpoint for real-time collection progress"""
     def generate():
         while True:
-            yield f"data: {json.dumps(collection_status)}\n\n"
+            with collection_status_changed:
+                payload = app.json.dumps(collection_status)
+                finished = collection_status.get('status') in ['completed', 'error']
+            yield f"data: {payload}\n\n"
             
             # Stop streaming AFTER sending the final status
-            if collection_status.get('status') in ['completed', 'error']:
+            if finished:
                 break
-                
-            time.sleep(1)
+            
+            # Wake as soon as the status changes; the timeout keeps a once-a-second heartbeat
+            with collection_status_changed:
+                collection_status_changed.wait(timeout=1)
     
     return app.response_class(generate(), mimetype='text/event-stream')
 
@@ -1979,18 +2360,21 @@ def get_collection_status():
         global collection_status
         
         # Return current collection status
-        return jsonify({
-            'status': collection_status['status'],
-            'message': collection_status['message'],
-            'start_time': collection_status['start_time'],
-            'end_time': collection_status['end_time'],
-            'total_items': collection_status['total_items'],
-            'current_source': collection_status['current_source'],
-            'sources_completed': collection_status['sources_completed'],
-            'error_message': collection_status['error_message'],
-            'source_counts': collection_status.get('source_counts', {}),
-            'progress': collection_status.get('progress', 0)
-        })
+        with collection_status_lock:
+            status_payload = {
+                'status': collection_status['status'],
+                'message': collection_status['message'],
+                'start_time': collection_status['start_time'],
+                'end_time': collection_status['end_time'],
+                'total_items': collection_status['total_items'],
+                'current_source': collection_status['current_source'],
+                'sources_completed': collection_status['sources_completed'],
+                'error_message': collection_status['error_message'],
+                'source_counts': collection_status.get('source_counts', {}),
+                'progress': collection_status.get('progress', 0)
+            }
+            body = app.json.dumps(status_payload)
+        return conditional_json_response(body.encode(), lambda: body)
         
     except Exception as e:
         logger.error(f"Error checking collection status: {e}")
@@ -2031,13 +2415,13 @@ def sync_states_to_fabric():
             if new_state and not state_manager.validate_state(new_state):
                 return jsonify({'status': 'error', 'message': f'Invalid state: {new_state}'}), 400
         logger.info(f"🔥 FABRIC SQL SYNC: Writing {len(state_changes)} state changes to Fabric SQL Database")
-        print(f"🔥 FABRIC SQL SYNC: Processing {len(state_changes)} state changes")
         
         # Update in Fabric SQL database using state_manager (no bearer token needed)
         success = state_manager.update_feedback_states_in_fabric_sql(
             auth_header.replace('Bearer ', ''),
             state_changes
         )
+        state_manager.invalidate_feedback_states_cache()
         
         if not success:
             logger.error("❌ FABRIC SQL SYNC FAILED: Could not write to Fabric SQL Database")
@@ -2047,32 +2431,25 @@ def sync_states_to_fabric():
             }), 500
             
         logger.warning("✅ FABRIC SQL SYNC SUCCESS: All state changes written to Fabric SQL Database")
-        print("✅ FABRIC SQL SYNC COMPLETED SUCCESSFULLY")
         
         # Update in-memory data after successful Fabric write
         global last_collected_feedback
         updated_count = 0
+        now_iso = datetime.now().isoformat()
         
         for change in state_changes:
             feedback_id = change.get('feedback_id')
             
             # Find and update the feedback item in memory
-            for item in last_collected_feedback:
-                if item.get('Feedback_ID') == feedback_id:
-                    # Update all provided fields
-                    if 'state' in change:
-                        item['State'] = change['state']
-                    if 'notes' in change:
-                        item['Feedback_Notes'] = change['notes']
-                    if 'domain' in change:
-                        item['Primary_Domain'] = change['domain']
-                    
-                    # Update audit fields
-                    item['Last_Updated'] = datetime.now().isoformat()
-                    item['Updated_By'] = user
-                    
-                    updated_count += 1
-                    break
+            item = find_feedback(feedback_id)
+            if item is not None:
+                # Update all provided fields plus audit fields in one pass
+                item.update({dst: change[src] for src, dst in _STATE_FIELD_MAP.items() if src in change})
+                item['Last_Updated'] = now_iso
+                item['Updated_By'] = user
+                
+                updated_count += 1
+        invalidate_feedback_frame()
         
         logger.info(f"Synced {updated_count} state changes to Fabric by {user}")
         
@@ -2086,6 +2463,25 @@ def sync_states_to_fabric():
         logger.error(f"Error syncing states to Fabric: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+def _fetch_feedback_state_data(conn):
+    """Load all FeedbackState rows into a dict keyed by Feedback_ID"""
+    cursor = conn.cursor()
+    cursor.execute("""
+        SELECT Feedback_ID, State, Feedback_Notes, Primary_Domain, Last_Updated, Updated_By
+        FROM FeedbackState
+    """)
+    
+    state_data = {}
+    for row in fabric_sql_writer.iter_cursor_rows(cursor):
+        state_data[row[0]] = {
+            'state': row[1],
+            'notes': row[2],
+            'domain': row[3],
+            'last_updated': row[4].isoformat() if row[4] else None,
+            'updated_by': row[5]
+        }
+    return state_data
+
 @app.route('/api/fabric/sync', methods=['POST'])
 def sync_with_fabric():
     """Connect to Fabric SQL Database, write all feedback data, and load existing state data"""
@@ -2101,88 +2497,70 @@ def sync_with_fabric():
             logger.debug(f"No JSON body in request: {json_error}")
             request_data = {}
         
-        # Import SQL writer
-        import fabric_sql_writer
+        if fabric_sql_writer is None:
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer not available', 'connected': False}), 500
         
         # Test SQL connection and create writer
-        writer = fabric_sql_writer.FabricSQLWriter()
+        writer = fabric_sql_writer.get_shared_writer()
         
         # Try to connect to SQL database (will prompt for Azure AD auth)
         try:
             conn = writer.connect_interactive()
-            
-            # Ensure both tables exist
-            writer.ensure_feedback_table(conn)
-            writer.ensure_feedback_state_table(conn)
-            
-            # Step 1: Bulletproof sync of cached feedback data to Feedback table
-            global last_collected_feedback
-            sync_result = {'new_items': 0, 'existing_items': 0, 'total_items': 0, 'id_regenerated': 0}
-            if last_collected_feedback:
-                logger.info(f"🔄 Bulletproof sync: Analyzing {len(last_collected_feedback)} feedback items...")
+            try:
+                # Ensure both tables exist
+                writer.ensure_feedback_table(conn)
+                writer.ensure_feedback_state_table(conn)
                 
-                # Use the bulletproof bulk writer with deterministic IDs
-                sync_result = writer.write_feedback_bulk(last_collected_feedback, use_token=False)
-                logger.info(f"✅ Bulletproof sync complete: {sync_result['new_items']} new, {sync_result['existing_items']} existing, {sync_result['id_regenerated']} IDs regenerated")
-            
-            # Step 2: Load all existing state data from FeedbackState table
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT Feedback_ID, State, Feedback_Notes, Primary_Domain, Last_Updated, Updated_By
-                FROM FeedbackState
-            """)
-            
-            state_data = {}
-            rows = cursor.fetchall()
-            for row in rows:
-                state_data[row[0]] = {
-                    'state': row[1],
-                    'notes': row[2],
-                    'domain': row[3],
-                    'last_updated': row[4].isoformat() if row[4] else None,
-                    'updated_by': row[5]
-                }
-            
-            conn.close()
+                # Step 1 (bulletproof sync of cached feedback to the Feedback table) and
+                # Step 2 (load existing FeedbackState rows) are independent, so run them concurrently.
+                # write_feedback_bulk opens its own (second, interactive) connection; the state fetch reuses `conn`.
+                global last_collected_feedback
+                sync_result = {'new_items': 0, 'existing_items': 0, 'total_items': 0, 'id_regenerated': 0}
+                write_future = None
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    if last_collected_feedback:
+                        logger.info(f"🔄 Bulletproof sync: Analyzing {len(last_collected_feedback)} feedback items...")
+                        # Use the bulletproof bulk writer with deterministic IDs
+                        write_future = executor.submit(writer.write_feedback_bulk, last_collected_feedback, use_token=False)
+                    state_future = executor.submit(_fetch_feedback_state_data, conn)
+                # Leaving the executor waits for both tasks, so neither result is read (or raised) while `conn` is in use
+                
+                if write_future is not None:
+                    sync_result = write_future.result()
+                    _reindex_feedback()
+                    logger.info(f"✅ Bulletproof sync complete: {sync_result['new_items']} new, {sync_result['existing_items']} existing, {sync_result['id_regenerated']} IDs regenerated")
+                state_data = state_future.result()
+            finally:
+                conn.close()
             
             # CRITICAL FIX: Apply loaded state data to in-memory feedback items
             if state_data and last_collected_feedback:
                 applied_states = 0
                 applied_domains = 0
                 applied_notes = 0
+                log_domain_changes = logger.isEnabledFor(logging.DEBUG)
                 
-                for item in last_collected_feedback:
-                    feedback_id = item.get('Feedback_ID')
-                    if feedback_id and feedback_id in state_data:
-                        sql_state = state_data[feedback_id]
-                        
-                        # Apply state from SQL (manual updates take precedence)
-                        if sql_state.get('state'):
-                            item['State'] = sql_state['state']
-                            applied_states += 1
+                # Walk the SQL rows and reach their in-memory items through the Feedback_ID index
+                for feedback_id, sql_state in state_data.items():
+                    items = _feedback_by_id.get(feedback_id)
+                    if not items:
+                        continue
+                    
+                    # Apply all non-empty SQL values at once (manual updates take precedence)
+                    updates = {dst: sql_state[src] for src, dst in _SQL_STATE_FIELD_MAP.items() if sql_state.get(src)}
+                    for item in items:
+                        if log_domain_changes and 'Primary_Domain' in updates:
+                            logger.debug(f"🔄 Applied domain update for {feedback_id}: {item.get('Primary_Domain')} → {updates['Primary_Domain']}")
+                        item.update(updates)
                         
-                        # Apply domain from SQL (manual updates take precedence) 
-                        if sql_state.get('domain'):
-                            original_domain = item.get('Primary_Domain')
-                            item['Primary_Domain'] = sql_state['domain']
-                            logger.info(f"🔄 Applied domain update for {feedback_id}: {original_domain} → {sql_state['domain']}")
-                            applied_domains += 1
-                            
-                        # Apply notes from SQL
-                        if sql_state.get('notes'):
-                            item['Feedback_Notes'] = sql_state['notes']
-                            applied_notes += 1
-                            
-                        # Apply audit info
-                        if sql_state.get('last_updated'):
-                            item['Last_Updated'] = sql_state['last_updated']
-                        if sql_state.get('updated_by'):
-                            item['Updated_By'] = sql_state['updated_by']
+                        applied_states += 'State' in updates
+                        applied_domains += 'Primary_Domain' in updates
+                        applied_notes += 'Feedback_Notes' in updates
+                invalidate_feedback_frame()
                 
                 logger.info(f"✅ Applied SQL state data to in-memory feedback: {applied_states} states, {applied_domains} domains, {applied_notes} notes")
             
             # Set session flags to indicate successful SQL connection and data sync
-            from flask import session
             session['states_loaded'] = True
             session['sql_data_applied'] = True  # New flag to indicate SQL data has been applied to in-memory data
             session['fabric_bearer_token'] = 'SQL_CONNECTED'  # Pseudo-token to enable domain updates
@@ -2223,7 +2601,8 @@ def sync_with_fabric():
             if recategorize_result:
                 response_data['recategorize_result'] = recategorize_result
             
-            return jsonify(response_data)
+            # state_data can hold thousands of rows, so it is streamed rather than encoded as one string
+            return stream_json_object(response_data, stream_key='state_data')
             
         except Exception as sql_error:
             logger.error(f"❌ SQL connection failed: {sql_error}")
@@ -2239,14 +2618,22 @@ def sync_with_fabric():
 
 
 
+def _pending_state_write_response(feedback_id):
+    """202 for a state write still queued or running when submit_state_change stopped waiting"""
+    logger.warning(f"⏳ SQL write for feedback {feedback_id} still pending; memory updates when it commits")
+    return jsonify({
+        'status': 'pending',
+        'message': 'The change is still being written to the SQL database; refresh shortly to see whether it was saved',
+        'feedback_id': feedback_id
+    }), 202
+
 @app.route('/api/feedback/state/update', methods=['POST'])
 def update_feedback_state_sql():
     """Update a single feedback state and immediately sync to SQL"""
     try:
         # Validate session and authentication
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
-        has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
+        has_bearer_token = has_usable_token(stored_token)
         
         if not has_bearer_token:
             logger.warning("❌ STATE UPDATE DENIED: No valid bearer token in session")
@@ -2268,8 +2655,8 @@ def update_feedback_state_sql():
         if new_state and not state_manager.validate_state(new_state):
             return jsonify({'status': 'error', 'message': f'Invalid state: {new_state}'}), 400
         
-        # Import SQL writer and update immediately
-        import fabric_sql_writer
+        if fabric_sql_writer is None:
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer not available'}), 500
         
         # Create state change record
         state_change = {
@@ -2285,25 +2672,24 @@ def update_feedback_state_sql():
         
         logger.info(f"🔄 Updating state for feedback {feedback_id}: {state_change}")
         
+        def apply_in_memory():
+            item = find_feedback(feedback_id)
+            if item is not None:
+                item.update({dst: data[src] for src, dst in _STATE_FIELD_MAP.items() if src in data})
+                item['Last_Updated'] = datetime.now().isoformat()
+            invalidate_feedback_frame()
+        
         # Write to SQL database immediately
-        writer = fabric_sql_writer.FabricSQLWriter()
-        success = writer.update_feedback_states([state_change], use_token=False)
+        success = fabric_sql_writer.submit_state_change(state_change, on_committed=apply_in_memory)
+        state_manager.invalidate_feedback_states_cache()
         
+        if success is None:
+            return _pending_state_write_response(feedback_id)
         if success:
             logger.info(f"✅ Successfully updated feedback {feedback_id} in SQL database")
             
             # Update in-memory cache
-            global last_collected_feedback
-            for item in last_collected_feedback:
-                if item.get('Feedback_ID') == feedback_id:
-                    if 'state' in data:
-                        item['State'] = data['state']
-                    if 'notes' in data:
-                        item['Feedback_Notes'] = data['notes']
-                    if 'domain' in data:
-                        item['Primary_Domain'] = data['domain']
-                    item['Last_Updated'] = datetime.now().isoformat()
-                    break
+            apply_in_memory()
             
             return jsonify({
                 'status': 'success',
@@ -2336,15 +2722,15 @@ def update_feedback_domain():
             return jsonify({'status': 'error', 'message': 'feedback_id and domain are required'}), 400
         
         # Resolve domain code to name if needed
-        if new_domain in config.DOMAIN_CATEGORIES:
-            resolved_domain = config.DOMAIN_CATEGORIES[new_domain]['name']
+        if new_domain in _VALID_DOMAINS:
+            resolved_domain = _DOMAIN_NAME_BY_CODE[new_domain]
             logger.info(f"Resolved domain code '{new_domain}' to name '{resolved_domain}'")
             new_domain = resolved_domain
         
         logger.info(f"🔄 Updating domain for feedback {feedback_id}: {new_domain}")
         
-        # Import SQL writer and update immediately
-        import fabric_sql_writer
+        if fabric_sql_writer is None:
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer not available'}), 500
         
         # Create state change record for domain update
         state_change = {
@@ -2355,20 +2741,24 @@ def update_feedback_domain():
         
         logger.info(f"🔄 Updating domain for feedback {feedback_id}: {state_change}")
         
+        def apply_in_memory():
+            item = find_feedback(feedback_id)
+            if item is not None:
+                item['Primary_Domain'] = new_domain
+                item['Last_Updated'] = datetime.now().isoformat()
+            invalidate_feedback_frame()
+        
         # Write to SQL database immediately
-        writer = fabric_sql_writer.FabricSQLWriter()
-        success = writer.update_feedback_states([state_change], use_token=False)
+        success = fabric_sql_writer.submit_state_change(state_change, on_committed=apply_in_memory)
+        state_manager.invalidate_feedback_states_cache()
         
+        if success is None:
+            return _pending_state_write_response(feedback_id)
         if success:
             logger.info(f"✅ Successfully updated domain for feedback {feedback_id} in SQL database")
             
             # Update in-memory cache
-            global last_collected_feedback
-            for item in last_collected_feedback:
-                if item.get('Feedback_ID') == feedback_id:
-                    item['Primary_Domain'] = new_domain
-                    item['Last_Updated'] = datetime.now().isoformat()
-                    break
+            apply_in_memory()
             
             return jsonify({
                 'status': 'success',
@@ -2391,9 +2781,8 @@ def update_feedback_notes():
     """Update the notes of a feedback item"""
     try:
         # Validate session and authentication
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
-        has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
+        has_bearer_token = has_usable_token(stored_token)
         
         if not has_bearer_token:
             logger.warning("❌ NOTES UPDATE DENIED: No valid bearer token in session")
@@ -2412,8 +2801,8 @@ def update_feedback_notes():
         
         logger.info(f"🔄 NOTES UPDATE REQUEST: Updating {feedback_id} notes: {notes[:50]}...")
         
-        # Import SQL writer and update immediately
-        import fabric_sql_writer
+        if fabric_sql_writer is None:
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer not available'}), 500
         
         # Create state change record for notes update
         state_change = {
@@ -2424,20 +2813,23 @@ def update_feedback_notes():
         
         logger.info(f"🔄 Updating notes for feedback {feedback_id}: {state_change}")
         
+        def apply_in_memory():
+            item = find_feedback(feedback_id)
+            if item is not None:
+                item['Feedback_Notes'] = notes
+                item['Last_Updated'] = datetime.now().isoformat()
+        
         # Write to SQL database immediately
-        writer = fabric_sql_writer.FabricSQLWriter()
-        success = writer.update_feedback_states([state_change], use_token=False)
+        success = fabric_sql_writer.submit_state_change(state_change, on_committed=apply_in_memory)
+        state_manager.invalidate_feedback_states_cache()
         
+        if success is None:
+            return _pending_state_write_response(feedback_id)
         if success:
             logger.info(f"✅ Successfully updated notes for feedback {feedback_id} in SQL database")
             
             # Update in-memory cache
-            global last_collected_feedback
-            for item in last_collected_feedback:
-                if item.get('Feedback_ID') == feedback_id:
-                    item['Feedback_Notes'] = notes
-                    item['Last_Updated'] = datetime.now().isoformat()
-                    break
+            apply_in_memory()
             
             return jsonify({
                 'status': 'success',
@@ -2464,9 +2856,8 @@ def update_domain_sql():
     """Update feedback domain directly in SQL database"""
     try:
         # Validate session and authentication
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
-        has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
+        has_bearer_token = has_usable_token(stored_token)
         
         if not has_bearer_token:
             logger.warning("❌ DOMAIN UPDATE DENIED: No valid bearer token in session")
@@ -2482,15 +2873,11 @@ def update_domain_sql():
         logger.info(f"🔄 DOMAIN UPDATE REQUEST: Updating {feedback_id} to domain {new_domain}")
         
         # Validate domain
-        valid_domains = list(config.DOMAIN_CATEGORIES.keys())
-        if new_domain not in valid_domains:
-            return jsonify({'success': False, 'message': f'Invalid domain. Must be one of: {valid_domains}'}), 400
-        
-        # Map internal domain code to friendly name for storage
-        domain_mapping = {code: details['name'] for code, details in config.DOMAIN_CATEGORIES.items()}
+        if new_domain not in _VALID_DOMAINS:
+            return jsonify({'success': False, 'message': f'Invalid domain. Must be one of: {list(_DOMAIN_NAME_BY_CODE)}'}), 400
         
-        # Convert internal code to friendly name
-        friendly_domain_name = domain_mapping.get(new_domain, new_domain)
+        # Convert internal code to friendly name for storage
+        friendly_domain_name = _DOMAIN_NAME_BY_CODE.get(new_domain, new_domain)
         
         # Update in Fabric SQL database using state_manager (no bearer token needed)
         success = state_manager.update_feedback_field_in_sql(feedback_id, 'Primary_Domain', friendly_domain_name, None)
@@ -2511,9 +2898,8 @@ def update_domain_sql():
 def update_category_sql():
     """Update feedback category/subcategory metadata directly in SQL."""
     try:
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
-        has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
+        has_bearer_token = has_usable_token(stored_token)
 
         if not has_bearer_token:
             logger.warning("❌ CATEGORY UPDATE DENIED: No valid bearer token in session")
@@ -2537,8 +2923,8 @@ def update_category_sql():
         domain_code = _clean(data.get('domain_code'))
 
         # Resolve domain code to name if needed
-        if domain_code and domain_code in config.DOMAIN_CATEGORIES:
-            domain_name = config.DOMAIN_CATEGORIES[domain_code]['name']
+        if domain_code and domain_code in _VALID_DOMAINS:
+            domain_name = _DOMAIN_NAME_BY_CODE[domain_code]
             logger.info(f"Resolved domain code '{domain_code}' to name '{domain_name}'")
             domain_code = domain_name
 
@@ -2572,9 +2958,8 @@ def update_audience_sql():
     """Update feedback audience directly in SQL database"""
     try:
         # Validate session and authentication
-        from flask import session
         stored_token = session.get('fabric_bearer_token')
-        has_bearer_token = stored_token and stored_token.strip() and stored_token != 'None'
+        has_bearer_token = has_usable_token(stored_token)
         
         if not has_bearer_token:
             logger.warning("❌ AUDIENCE UPDATE DENIED: No valid bearer token in session")
@@ -2590,9 +2975,8 @@ def update_audience_sql():
         logger.info(f"🔄 AUDIENCE UPDATE REQUEST: Updating {feedback_id} to audience {new_audience}")
         
         # Validate audience (only Developer or Customer)
-        valid_audiences = ['Developer', 'Customer']
-        if new_audience not in valid_audiences:
-            return jsonify({'success': False, 'message': f'Invalid audience. Must be one of: {valid_audiences}'}), 400
+        if new_audience not in _VALID_AUDIENCES:
+            return jsonify({'success': False, 'message': f'Invalid audience. Must be one of: {sorted(_VALID_AUDIENCES)}'}), 400
         
         # Update in Fabric SQL database using state_manager (no bearer token needed)
         success = state_manager.update_feedback_field_in_sql(feedback_id, 'Audience', new_audience, None)
@@ -2610,14 +2994,30 @@ def update_audience_sql():
 
 @app.route('/api/feedback/query/getting_started', methods=['GET'])
 def get_getting_started_feedback_ids():
-    """Get all Feedback IDs that are tagged with 'Getting Started' domain"""
+    """Get all Feedback IDs that are tagged with 'Getting Started' domain.
+    
+    Query params:
+        include_sql: set to 1/true to also return DELETE/transaction SQL for the matched IDs
+        offset, limit: optional paging over the matched IDs
+    """
     try:
-        import state_manager
-        
-        # Get all feedback states from SQL database
-        all_states = state_manager.get_all_feedback_states()
+        include_sql = request.args.get('include_sql', 'false').lower() in ('1', 'true')
+        try:
+            offset = int(request.args.get('offset', 0))
+            limit = request.args.get('limit')
+            limit = int(limit) if limit else None
+        except ValueError:
+            return jsonify({'status': 'error', 'message': 'offset and limit must be integers'}), 400
+        if offset < 0 or (limit is not None and limit < 1):
+            return jsonify({'status': 'error', 'message': 'offset must be >= 0 and limit must be >= 1'}), 400
+        
+        # Filter for Getting Started domain in SQL rather than loading every state
+        matched_states, total_found = state_manager.get_feedback_states_by_domain(
+            ['Getting Started', 'GETTING_STARTED'], offset=offset, limit=limit
+        )
+        total_stored = state_manager.count_feedback_states()
         
-        if not all_states:
+        if not total_stored:
             return jsonify({
                 'status': 'success',
                 'total_found': 0,
@@ -2627,28 +3027,24 @@ def get_getting_started_feedback_ids():
                 'message': 'No feedback states found in database'
             })
         
-        # Filter for Getting Started domain
-        getting_started_ids = []
-        getting_started_details = []
-        
-        for feedback_id, state_data in all_states.items():
-            domain = state_data.get('domain', '')
-            if domain and ('Getting Started' in domain or 'GETTING_STARTED' in domain):
-                getting_started_ids.append(feedback_id)
-                getting_started_details.append({
-                    'feedback_id': feedback_id,
-                    'domain': domain,
-                    'state': state_data.get('state', ''),
-                    'notes': state_data.get('notes', ''),
-                    'last_updated': state_data.get('last_updated', ''),
-                    'updated_by': state_data.get('updated_by', '')
-                })
+        getting_started_ids = list(matched_states)
+        getting_started_details = [
+            {
+                'feedback_id': feedback_id,
+                'domain': state_data.get('domain', ''),
+                'state': state_data.get('state', ''),
+                'notes': state_data.get('notes', ''),
+                'last_updated': state_data.get('last_updated', ''),
+                'updated_by': state_data.get('updated_by', '')
+            }
+            for feedback_id, state_data in matched_states.items()
+        ]
         
-        # Generate SQL DELETE statement
+        # Generate SQL DELETE statement only when explicitly requested
         delete_sql = ""
         transaction_sql = ""
         
-        if getting_started_ids:
+        if include_sql and getting_started_ids:
             ids_list = "', '".join(getting_started_ids)
             delete_sql = f"DELETE FROM FeedbackState WHERE Feedback_ID IN ('{ids_list}');"
             
@@ -2669,19 +3065,26 @@ WHERE Feedback_ID IN ('{ids_list}');
         
         return jsonify({
             'status': 'success',
-            'total_found': len(getting_started_ids),
-            'total_stored': len(all_states),
+            'total_found': total_found,
+            'total_stored': total_stored,
             'feedback_ids': getting_started_ids,
             'details': getting_started_details,
             'delete_sql': delete_sql,
             'transaction_sql': transaction_sql,
-            'message': f'Found {len(getting_started_ids)} feedback items tagged with Getting Started out of {len(all_states)} total items'
+            'message': f'Found {total_found} feedback items tagged with Getting Started out of {total_stored} total items'
         })
         
     except Exception as e:
         logger.error(f"Error querying Getting Started feedback: {e}")
         return jsonify({'status': 'error', 'message': str(e)}), 500
 
+@app.after_request
+def disable_caching_for_debug_endpoints(response):
+    """Keep debug payloads out of browser and proxy caches"""
+    if request.endpoint and request.endpoint.startswith('debug_'):
+        response.headers['Cache-Control'] = 'no-store'
+    return response
+
 @app.route('/api/debug/feedback_domains', methods=['GET'])
 def debug_feedback_domains():
     """Debug endpoint to check domain values in memory"""
@@ -2696,32 +3099,38 @@ def debug_feedback_domains():
                 'domains': {}
             })
         
-        # Get domain distribution
-        domain_counts = {}
-        sample_items = []
-        
-        for item in last_collected_feedback[:10]:  # Show first 10 items
-            domain = item.get('Primary_Domain', 'None')
-            domain_counts[domain] = domain_counts.get(domain, 0) + 1
-            
-            sample_items.append({
+        # Sample the first 10 items, reading each field once per item
+        sample_items = [
+            {
                 'feedback_id': item.get('Feedback_ID', 'No ID'),
-                'title': item.get('Title', 'No Title')[:50] + '...' if len(item.get('Title', '')) > 50 else item.get('Title', 'No Title'),
-                'domain': domain,
+                'title': truncate_title(item.get('Title')),
+                'domain': item.get('Primary_Domain', 'None'),
                 'state': item.get('State', 'No State'),
                 'last_updated': item.get('Last_Updated', 'Never')
-            })
+            }
+            for item in islice(last_collected_feedback, 10)
+        ]
+        
+        # Get domain distribution
+        domain_counts = dict(Counter(sample['domain'] for sample in sample_items))
+        
+        # Resolve the session proxy once and read all flags from it
+        current_session = session._get_current_object()
+        stored_token, states_loaded, sql_data_applied = (
+            current_session.get('fabric_bearer_token'),
+            current_session.get('states_loaded', False),
+            current_session.get('sql_data_applied', False)
+        )
         
-        from flask import session
         return jsonify({
             'status': 'success',
             'total_items': len(last_collected_feedback),
             'domain_counts': domain_counts,
             'sample_items': sample_items,
             'session_flags': {
-                'has_token': bool(session.get('fabric_bearer_token')),
-                'states_loaded': session.get('states_loaded', False),
-                'sql_data_applied': session.get('sql_data_applied', False)
+                'has_token': bool(stored_token),
+                'states_loaded': states_loaded,
+                'sql_data_applied': sql_data_applied
             }
         })
         
@@ -2732,30 +3141,47 @@ def debug_feedback_domains():
 @app.route('/api/debug/feedback_status', methods=['GET'])
 def debug_feedback_status():
     """Debug endpoint to inspect feedback data and SQL sync status"""
-    from flask import session
-    
-    # Check session flags
-    stored_token = session.get('fabric_bearer_token')
-    is_online_mode = stored_token and stored_token.strip() and stored_token != 'None'
-    sql_data_applied = session.get('sql_data_applied', False)
-    states_loaded = session.get('states_loaded', False)
+    # Check session flags (resolve the session proxy once)
+    current_session = session._get_current_object()
+    stored_token, sql_data_applied, states_loaded = (
+        current_session.get('fabric_bearer_token'),
+        current_session.get('sql_data_applied', False),
+        current_session.get('states_loaded', False)
+    )
+    is_online_mode = has_usable_token(stored_token)
     
     # Check in-memory feedback
     feedback_count = len(last_collected_feedback)
-    sample_feedback = last_collected_feedback[:3] if last_collected_feedback else []
     
-    # Sample domains from in-memory data
-    sample_domains = [item.get('Primary_Domain', 'None') for item in last_collected_feedback[:10]]
-    sample_states = [item.get('State', 'None') for item in last_collected_feedback[:10]]
+    # Sample domains/states (first 10) and full records (first 3) in a single pass
+    sample_domains = []
+    sample_states = []
+    sample_feedback_ids = []
+    sample_feedback = []
+    for index, item in enumerate(islice(last_collected_feedback, 10)):
+        get = item.get
+        domain = get('Primary_Domain', 'None')
+        state = get('State', 'None')
+        sample_domains.append(domain)
+        sample_states.append(state)
+        if index < 3:
+            feedback_id = get('Feedback_ID', 'None')
+            sample_feedback_ids.append(feedback_id)
+            sample_feedback.append({
+                'id': feedback_id,
+                'title': truncate_title(get('Title'), placeholder='None'),
+                'domain': domain,
+                'state': state,
+                'source': get('Sources', 'None')
+            })
     
     # Check SQL data if online
     sql_record_count = 0
     sql_sample_domains = []
     if is_online_mode:
         try:
-            sql_data = state_manager.get_all_feedback_states()
-            sql_record_count = len(sql_data) if sql_data else 0
-            sql_sample_domains = list(sql_data.values())[:5] if sql_data else []
+            sql_record_count = state_manager.count_feedback_states()
+            sql_sample_domains = state_manager.sample_feedback_states(5)
         except Exception as e:
             sql_sample_domains = [f"Error: {str(e)}"]
     
@@ -2770,36 +3196,30 @@ def debug_feedback_status():
             'feedback_count': feedback_count,
             'sample_domains': sample_domains,
             'sample_states': sample_states,
-            'sample_feedback_ids': [item.get('Feedback_ID', 'None') for item in sample_feedback]
+            'sample_feedback_ids': sample_feedback_ids
         },
         'sql_info': {
             'sql_record_count': sql_record_count,
             'sql_sample_domains': sql_sample_domains
         },
-        'sample_feedback': [
-            {
-                'id': item.get('Feedback_ID', 'None'),
-                'title': item.get('Title', 'None')[:50] + '...' if item.get('Title') else 'None',
-                'domain': item.get('Primary_Domain', 'None'),
-                'state': item.get('State', 'None'),
-                'source': item.get('Sources', 'None')
-            } for item in sample_feedback
-        ]
+        'sample_feedback': sample_feedback
     }
     
-    return jsonify(debug_info)
+    # Serialize directly through the app's JSON provider (orjson when available)
+    return app.response_class(app.json.dumps(debug_info), mimetype='application/json')
 @app.route('/api/fabric/domains/sync', methods=['POST'])
 def sync_domains_from_state():
     """Sync domain updates from FeedbackState to Feedback table"""
     try:
         logger.info("🔄 Starting domain sync from FeedbackState to Feedback table...")
         
-        # Import SQL writer
-        import fabric_sql_writer
+        if fabric_sql_writer is None:
+            return jsonify({'status': 'error', 'message': 'Fabric SQL writer not available'}), 500
         
         # Create writer and sync domains
-        writer = fabric_sql_writer.FabricSQLWriter()
+        writer = fabric_sql_writer.get_shared_writer()
         updated_count = writer.sync_domains_from_state(use_token=False)
+        state_manager.invalidate_feedback_states_cache()
         
         if updated_count > 0:
             logger.info(f"✅ Domain sync complete: {updated_count} records updated")
@@ -2812,15 +3232,19 @@ def sync_domains_from_state():
                 
                 # Apply domain updates to in-memory feedback
                 applied_domains = 0
-                for item in last_collected_feedback:
-                    feedback_id = item.get('Feedback_ID')
-                    if feedback_id and feedback_id in state_data:
-                        sql_state = state_data[feedback_id]
-                        if sql_state.get('domain'):
-                            original_domain = item.get('Primary_Domain')
-                            item['Primary_Domain'] = sql_state['domain']
-                            logger.info(f"🔄 Applied domain update to memory for {feedback_id}: {original_domain} → {sql_state['domain']}")
+                log_domain_changes = logger.isEnabledFor(logging.DEBUG)
+                for feedback_id, sql_state in state_data.items():
+                    new_domain = sql_state.get('domain')
+                    if not new_domain:
+                        continue
+                    for item in _feedback_by_id.get(feedback_id, ()):
+                        original_domain = item.get('Primary_Domain')
+                        if new_domain != original_domain:
+                            item['Primary_Domain'] = new_domain
+                            if log_domain_changes:
+                                logger.debug(f"🔄 Applied domain update to memory for {feedback_id}: {original_domain} → {new_domain}")
                             applied_domains += 1
+                invalidate_feedback_frame()
                 
                 logger.info(f"✅ Applied {applied_domains} domain updates to in-memory feedback")
             
@@ -2830,11 +3254,7 @@ def sync_domains_from_state():
                 'updated_count': updated_count
             })
         else:
-            return jsonify({
-                'status': 'success',
-                'message': 'No domain updates to sync',
-                'updated_count': 0
-            })
+            return app.response_class(_NO_DOMAIN_UPDATES_BODY, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error syncing domains from state: {e}")
@@ -2845,25 +3265,29 @@ def download_csv(filename):
     """Serve CSV files from the data directory"""
     try:
         # Validate filename to prevent directory traversal attacks
-        if not filename.startswith('feedback_') or not filename.endswith('.csv'):
+        filepath = (DATA_PATH / filename).resolve()
+        if (not filepath.is_relative_to(DATA_PATH) or filepath.suffix != '.csv'
+                or not filepath.name.startswith('feedback_')):
             return jsonify({'error': 'Invalid filename'}), 400
         
-        # Construct the full path to the CSV file
-        filepath = os.path.join(DATA_DIR, filename)
-        
-        # Check if file exists
-        if not os.path.exists(filepath):
-            return jsonify({'error': 'File not found'}), 404
-        
-        # Send the file with proper headers
-        return send_from_directory(
+        # send_from_directory performs the existence check itself (raises NotFound)
+        # Send the file with proper headers; conditional/etag let repeat downloads revalidate
+        # with a 304 (or serve byte ranges) instead of re-sending the whole CSV
+        response = send_from_directory(
             DATA_DIR,
             filename,
             as_attachment=True,
             download_name=filename,
-            mimetype='text/csv'
+            mimetype='text/csv',
+            conditional=True,
+            etag=True,
+            max_age=60
         )
+        response.headers['Accept-Ranges'] = 'bytes'
+        return response
         
+    except NotFound:
+        return jsonify({'error': 'File not found'}), 404
     except Exception as e:
         logger.error(f"Error serving CSV file {filename}: {e}")
         return jsonify({'error': 'Error serving file'}), 500
\ No newline at end of file
@@ -1,5 +1,6 @@
 import praw
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 from datetime import datetime, timezone, timedelta 
 import logging
@@ -10,11 +11,21 @@ import xml.etree.ElementTree as ET
 import re 
 import time 
 import config 
-from utils import generate_feedback_gist, categorize_feedback, enhanced_categorize_feedback, clean_feedback_text
+from utils import generate_feedback_gist, categorize_feedback, enhanced_categorize_feedback, clean_feedback_text, KeywordMatcher
 
 logging.basicConfig(level=logging.INFO) 
 logger = logging.getLogger(__name__)
 
+def create_github_session(pool_maxsize: int = 16) -> requests.Session:
+    """Create a GitHub API session whose connection pool can be shared by collectors running in parallel"""
+    session = requests.Session()
+    session.headers = {
+        'Authorization': f'Bearer {config.GITHUB_TOKEN}', 'Content-Type': 'application/json',
+        'Accept': 'application/vnd.github+json', 'X-Github-Api-Version': '2022-11-28'
+    }
+    session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=pool_maxsize))
+    return session
+
 def analyze_sentiment(text: str) -> str:
     blob = TextBlob(text)
     score = blob.sentiment.polarity
@@ -22,16 +33,20 @@ def analyze_sentiment(text: str) -> str:
     if score > 0.1: return "Positive"
     return "Neutral"
 
+# (keywords list, [(keyword, lowercase keyword)], KeywordMatcher) for the last keyword list seen
+_keyword_matcher_cache = None
+
 def find_matched_keywords(text: str, keywords: List[str]) -> List[str]:
     """Find which keywords matched in the given text (case-insensitive)."""
+    global _keyword_matcher_cache
     if not text or not keywords:
         return []
-    text_lower = text.lower()
-    matched = []
-    for keyword in keywords:
-        if keyword.lower() in text_lower:
-            matched.append(keyword)
-    return matched
+    cached = _keyword_matcher_cache
+    if cached is None or cached[0] is not keywords:
+        pairs = [(keyword, keyword.lower()) for keyword in keywords]
+        cached = _keyword_matcher_cache = (keywords, pairs, KeywordMatcher(lowered for _, lowered in pairs))
+    found = cached[2].find(text.lower())
+    return [keyword for keyword, lowered in cached[1] if lowered in found]
 
 class RedditCollector:
     def __init__(self):
@@ -390,13 +405,9 @@ class FabricCommunityCollector:
         return 'Feedback'
 
 class GitHubDiscussionsCollector:
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
         self.max_items = config.MAX_ITEMS_PER_RUN
-        self.session = requests.Session()
-        self.session.headers = {
-            'Authorization': f'Bearer {config.GITHUB_TOKEN}', 'Content-Type': 'application/json',
-            'Accept': 'application/vnd.github+json', 'X-Github-Api-Version': '2022-11-28'
-        }
+        self.session = session if session is not None else create_github_session()
         self.owner = config.GITHUB_REPO_OWNER
         self.repo = config.GITHUB_REPO_NAME
         
@@ -502,13 +513,9 @@ class GitHubDiscussionsCollector:
         return 'Feedback'
 
 class GitHubIssuesCollector:
-    def __init__(self):
+    def __init__(self, session: requests.Session = None):
         self.max_items = config.MAX_ITEMS_PER_RUN
-        self.session = requests.Session()
-        self.session.headers = {
-            'Authorization': f'Bearer {config.GITHUB_TOKEN}', 'Content-Type': 'application/json',
-            'Accept': 'application/vnd.github+json', 'X-Github-Api-Version': '2022-11-28'
-        }
+        self.session = session if session is not None else create_github_session()
         self.owner = config.GITHUB_REPO_OWNER
         self.repo = config.GITHUB_REPO_NAME
         
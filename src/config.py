@@ -1,8 +1,16 @@
+import copy
 import os
 import sys
 from dotenv import load_dotenv
 import json # Ensure json is imported
 
+try:
+    import orjson
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so existing handlers still apply
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # Determine the correct path for .env file
 if getattr(sys, 'frozen', False):
     # Running as compiled executable - .env must be next to FeedbackCollector.exe
@@ -497,7 +505,36 @@ DEFAULT_KEYWORDS = [
     "Fabric Extensibility Toolkit"
 ]
 
+# Parsed config files keyed by path: (st_mtime_ns, value). Loaders reuse the value until the file changes.
+_config_file_cache = {}
+
+def _load_cached(path, read_file):
+    """
+    Return read_file() for path, reusing the last result while the file's mtime is unchanged.
+    Callers get their own copy, so changing it never changes the cached value.
+    """
+    cached = _config_file_cache.get(path)
+    for _ in range(2):
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            return read_file()
+        if cached is not None and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+        value = read_file()
+        try:
+            unchanged = os.stat(path).st_mtime_ns == mtime_ns
+        except OSError:
+            return value
+        # Only cache content known to match mtime_ns; a save during the read (or a reader
+        # rewriting the file with defaults) changes the mtime, so read the file again
+        if unchanged:
+            _config_file_cache[path] = (mtime_ns, value)
+            return copy.deepcopy(value)
+    return value
+
 def save_keywords(keywords_to_save):
+    _config_file_cache.pop(KEYWORDS_FILE, None)
     try:
         with open(KEYWORDS_FILE, 'w') as f:
             json.dump(keywords_to_save, f, indent=2)
@@ -505,6 +542,9 @@ def save_keywords(keywords_to_save):
         print(f"Error saving keywords to '{KEYWORDS_FILE}': {e}")
 
 def load_keywords():
+    return _load_cached(KEYWORDS_FILE, _read_keywords_file)
+
+def _read_keywords_file():
     if os.path.exists(KEYWORDS_FILE):
         try:
             with open(KEYWORDS_FILE, 'r') as f:
@@ -514,7 +554,7 @@ def load_keywords():
                     save_keywords(DEFAULT_KEYWORDS)
                     return DEFAULT_KEYWORDS.copy() # Return a copy
                 # Attempt to parse non-empty content
-                loaded_kws = json.loads(content)
+                loaded_kws = _json_loads(content)
                 if isinstance(loaded_kws, list):
                     return loaded_kws # Return the user-defined list (could be empty [])
                 else:
@@ -547,6 +587,7 @@ IMPACT_TYPES_FILE = os.path.join(os.path.dirname(__file__), 'impact_types.json')
 
 def save_categories(categories_to_save):
     """Save custom categories configuration to JSON file."""
+    _config_file_cache.pop(CATEGORIES_FILE, None)
     try:
         with open(CATEGORIES_FILE, 'w') as f:
             json.dump(categories_to_save, f, indent=2)
@@ -555,6 +596,9 @@ def save_categories(categories_to_save):
 
 def load_categories():
     """Load categories configuration from JSON file, or use defaults."""
+    return _load_cached(CATEGORIES_FILE, _read_categories_file)
+
+def _read_categories_file():
     if os.path.exists(CATEGORIES_FILE):
         try:
             with open(CATEGORIES_FILE, 'r') as f:
@@ -563,7 +607,7 @@ def load_categories():
                     print(f"Warning: '{CATEGORIES_FILE}' is empty. Using default categories and saving them to the file.")
                     save_categories(DEFAULT_ENHANCED_FEEDBACK_CATEGORIES)
                     return DEFAULT_ENHANCED_FEEDBACK_CATEGORIES.copy()
-                loaded_cats = json.loads(content)
+                loaded_cats = _json_loads(content)
                 if isinstance(loaded_cats, dict):
                     return loaded_cats
                 else:
@@ -588,6 +632,7 @@ def load_categories():
 
 def save_impact_types(impact_types_to_save):
     """Save custom impact types configuration to JSON file."""
+    _config_file_cache.pop(IMPACT_TYPES_FILE, None)
     try:
         with open(IMPACT_TYPES_FILE, 'w') as f:
             json.dump(impact_types_to_save, f, indent=2)
@@ -596,6 +641,9 @@ def save_impact_types(impact_types_to_save):
 
 def load_impact_types():
     """Load impact types configuration from JSON file, or use defaults."""
+    return _load_cached(IMPACT_TYPES_FILE, _read_impact_types_file)
+
+def _read_impact_types_file():
     if os.path.exists(IMPACT_TYPES_FILE):
         try:
             with open(IMPACT_TYPES_FILE, 'r') as f:
@@ -604,7 +652,7 @@ def load_impact_types():
                     print(f"Warning: '{IMPACT_TYPES_FILE}' is empty. Using default impact types and saving them to the file.")
                     save_impact_types(IMPACT_TYPES)
                     return IMPACT_TYPES.copy()
-                loaded_types = json.loads(content)
+                loaded_types = _json_loads(content)
                 if isinstance(loaded_types, dict):
                     return loaded_types
                 else:
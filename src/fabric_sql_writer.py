@@ -7,12 +7,47 @@ Much more reliable and faster than the lakehouse approach
 import pyodbc
 import pandas as pd
 import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Iterable, Optional
 from config import FABRIC_SQL_SERVER, FABRIC_SQL_DATABASE, FABRIC_SQL_AUTHENTICATION
 
 logger = logging.getLogger(__name__)
 
+# Feedback_IDs per IN (...) query; SQL Server allows at most 2100 parameters per statement
+STATE_ID_BATCH_SIZE = 1000
+# Rows per executemany() call when inserting new feedback (sent as one array-bound round-trip each)
+FEEDBACK_INSERT_BATCH_SIZE = 1000
+
+# Rows per fetchmany() round when streaming query results
+ROW_FETCH_BATCH_SIZE = 1000
+
+def iter_cursor_rows(cursor, batch_size: int = ROW_FETCH_BATCH_SIZE) -> Iterable:
+    """Yield the rows of an executed query, fetched batch_size at a time instead of all at once"""
+    cursor.arraysize = batch_size
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            return
+        yield from rows
+
+# ODBC driver that last connected successfully; tried first so later connections skip drivers known to fail
+_working_driver = None
+
+def _drivers_in_preference(drivers_to_try: List[str]) -> List[str]:
+    """Candidate drivers with the last working one moved to the front"""
+    if _working_driver in drivers_to_try:
+        return [_working_driver] + [driver for driver in drivers_to_try if driver != _working_driver]
+    return drivers_to_try
+
+def _remember_working_driver(driver_name: str):
+    """Record the driver that just connected so the next connection tries it first"""
+    global _working_driver
+    _working_driver = driver_name
+
 class FabricSQLWriter:
     """Handles writing feedback state changes to Fabric SQL Database"""
     
@@ -21,7 +56,6 @@ class FabricSQLWriter:
         self.server = FABRIC_SQL_SERVER
         self.database = FABRIC_SQL_DATABASE
         self.auth_method = FABRIC_SQL_AUTHENTICATION
-        self.current_user = None  # Will be set after connection
         
         # Validate that required configuration is present
         if not self.server or not self.database:
@@ -39,7 +73,7 @@ class FabricSQLWriter:
             "SQL Server"
         ]
         
-        for driver_name in drivers_to_try:
+        for driver_name in _drivers_in_preference(drivers_to_try):
             try:
                 logger.info(f"Trying to connect with driver: {driver_name}")
                 
@@ -66,6 +100,7 @@ class FabricSQLWriter:
                 
                 conn = pyodbc.connect(connection_string)
                 logger.info(f"Successfully connected to Fabric SQL database using driver: {driver_name}")
+                _remember_working_driver(driver_name)
                 return conn
                 
             except Exception as e:
@@ -86,7 +121,7 @@ class FabricSQLWriter:
             "SQL Server Native Client 11.0"
         ]
         
-        for driver_name in drivers_to_try:
+        for driver_name in _drivers_in_preference(drivers_to_try):
             try:
                 logger.info(f"Trying to connect with bearer token using driver: {driver_name}")
                 
@@ -104,6 +139,7 @@ class FabricSQLWriter:
                 # Use token for authentication (SQL_COPT_SS_ACCESS_TOKEN = 1256)
                 conn = pyodbc.connect(connection_string, attrs_before={1256: token_bytes})
                 logger.info(f"Successfully connected to Fabric SQL database using bearer token with driver: {driver_name}")
+                _remember_working_driver(driver_name)
                 return conn
                 
             except Exception as e:
@@ -191,15 +227,12 @@ class FabricSQLWriter:
             result = cursor.fetchone()
             if result:
                 user = result[0]
-                self.current_user = user
                 logger.info(f"Current SQL user: {user}")
                 return user
             else:
-                self.current_user = "unknown_user"
                 return "unknown_user"
         except Exception as e:
             logger.error(f"Error getting current user: {e}")
-            self.current_user = "unknown_user"
             return "unknown_user"
     
     def ensure_feedback_table(self, conn):
@@ -323,74 +356,87 @@ class FabricSQLWriter:
         
         logger.info("🔄 Feedback table migration completed")
     
-    def load_feedback_states(self):
-        """Load state data from FeedbackState table for server-side filtering"""
+    def load_feedback_states(self, feedback_ids: Optional[Iterable[str]] = None):
+        """Load state data from FeedbackState table, optionally only for the given Feedback_IDs ({} on failure)"""
         try:
-            # Connect to database using same pattern as other methods
-            conn = None
-            if self.bearer_token:
-                try:
-                    conn = self.connect_with_token(self.bearer_token)
-                except Exception as token_error:
-                    logger.warning(f"Bearer token authentication failed: {token_error}")
-                    logger.info("Falling back to interactive authentication...")
-                    conn = self.connect_interactive()
-            else:
-                conn = self.connect_interactive()
-            
-            if not conn:
-                logger.error("❌ Cannot load feedback states - no database connection")
-                return {}
-            
-            cursor = conn.cursor()
-            
-            # Query to get all state data with correct column names
-            # Use COALESCE to fallback to Feedback.Primary_Domain if FeedbackState.Primary_Domain is NULL
-            query = """
-                SELECT 
-                    fs.Feedback_ID, 
-                    fs.State, 
-                    COALESCE(fs.Primary_Domain, f.Primary_Domain) as Primary_Domain,
-                    fs.Feedback_Notes, 
-                    fs.Last_Updated, 
-                    fs.Updated_By
-                FROM FeedbackState fs
-                LEFT JOIN Feedback f ON fs.Feedback_ID = f.Feedback_ID
-                ORDER BY fs.Last_Updated DESC
-            """
-            
-            cursor.execute(query)
-            rows = cursor.fetchall()
-            
-            # Convert to dictionary for easy lookup
-            state_data = {}
-            for row in rows:
-                feedback_id = row[0]
-                state_data[feedback_id] = {
-                    'state': row[1],
-                    'domain': row[2],
-                    'notes': row[3],
-                    'last_updated': row[4].isoformat() if row[4] else None,
-                    'updated_by': row[5]
-                }
-            
-            cursor.close()
-            conn.close()
-            
-            logger.info(f"📊 Loaded {len(state_data)} state records from FeedbackState table")
-            return state_data
-            
+            return self.query_feedback_states(feedback_ids=feedback_ids)
         except Exception as e:
             logger.error(f"❌ Error loading feedback states: {e}")
             return {}
     
-    def write_feedback_bulk(self, feedback_data: List[Dict[str, Any]], use_token: bool = True) -> Dict[str, int]:
+    def query_feedback_states(self, feedback_ids: Optional[Iterable[str]] = None):
+        """Like load_feedback_states, but raises on connection or query errors instead of returning {}"""
+        # Connect to database using same pattern as other methods
+        conn = None
+        if self.bearer_token:
+            try:
+                conn = self.connect_with_token(self.bearer_token)
+            except Exception as token_error:
+                logger.warning(f"Bearer token authentication failed: {token_error}")
+                logger.info("Falling back to interactive authentication...")
+                conn = self.connect_interactive()
+        else:
+            conn = self.connect_interactive()
+        
+        if not conn:
+            raise ConnectionError("Cannot load feedback states - no database connection")
+        
+        cursor = conn.cursor()
+        
+        # Query to get all state data with correct column names
+        # Use COALESCE to fallback to Feedback.Primary_Domain if FeedbackState.Primary_Domain is NULL
+        query = """
+            SELECT 
+                fs.Feedback_ID, 
+                fs.State, 
+                COALESCE(fs.Primary_Domain, f.Primary_Domain) as Primary_Domain,
+                fs.Feedback_Notes, 
+                fs.Last_Updated, 
+                fs.Updated_By
+            FROM FeedbackState fs
+            LEFT JOIN Feedback f ON fs.Feedback_ID = f.Feedback_ID
+        """
+        
+        def state_rows():
+            if feedback_ids is None:
+                cursor.execute(query + " ORDER BY fs.Last_Updated DESC")
+                yield from iter_cursor_rows(cursor)
+                return
+            # Filter server-side in batches that stay under the SQL Server parameter limit
+            ids = list(dict.fromkeys(feedback_id for feedback_id in feedback_ids if feedback_id))
+            for start in range(0, len(ids), STATE_ID_BATCH_SIZE):
+                batch = ids[start:start + STATE_ID_BATCH_SIZE]
+                placeholders = ', '.join('?' * len(batch))
+                cursor.execute(query + f" WHERE fs.Feedback_ID IN ({placeholders})", batch)
+                yield from iter_cursor_rows(cursor)
+        
+        # Convert to dictionary for easy lookup, as rows arrive
+        state_data = {}
+        for row in state_rows():
+            feedback_id = row[0]
+            state_data[feedback_id] = {
+                'state': row[1],
+                'domain': row[2],
+                'notes': row[3],
+                'last_updated': row[4].isoformat() if row[4] else None,
+                'updated_by': row[5]
+            }
+        
+        cursor.close()
+        conn.close()
+        
+        logger.info(f"📊 Loaded {len(state_data)} state records from FeedbackState table")
+        return state_data
+    
+    def write_feedback_bulk(self, feedback_data: List[Dict[str, Any]], use_token: bool = True,
+                            progress_callback: Optional[Callable[[int, int], None]] = None) -> Dict[str, int]:
         """
         Bulletproof bulk write with deterministic IDs and true duplicate prevention
         
         Args:
             feedback_data: List of feedback dictionaries from cache
             use_token: Whether to use bearer token (True) or interactive auth (False)
+            progress_callback: Optional callable(processed_items, total_items), called as insert batches complete
             
         Returns:
             dict: {'new_items': X, 'existing_items': Y, 'total_items': Z, 'id_regenerated': W}
@@ -584,18 +630,31 @@ class FabricSQLWriter:
                     logger.error(f"❌ Error processing feedback: {e}")
                     continue
             
-            # Execute bulk insert if there are new items
+            # Items that need no insert are done once classification finishes
+            total_items = len(feedback_data)
+            processed_items = total_items - len(new_items_params)
+            if progress_callback:
+                progress_callback(processed_items, total_items)
+            
+            # Execute bulk insert in batches if there are new items, reporting progress per batch
             if new_items_params:
                 logger.info(f"🚀 Executing bulk insert for {len(new_items_params)} items...")
-                cursor.executemany("""
-                    INSERT INTO Feedback (
-                        Feedback_ID, Title, Content, Source, Source_URL, Author,
-                        Created_Date, Sentiment, Primary_Category, Enhanced_Category,
-                        Audience, Priority, Feedback_Gist, Area, Impacttype, Scenario,
-                        Tag, Organization, Status, Created_by, Rawfeedback, Category,
-                        Subcategory, Feature_Area, Categorization_Confidence, Primary_Domain, Domains, Matched_Keywords
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, new_items_params)
+                # Bind each batch as one parameter array (a single round-trip) instead of one execute per row
+                cursor.fast_executemany = True
+                for start in range(0, len(new_items_params), FEEDBACK_INSERT_BATCH_SIZE):
+                    batch = new_items_params[start:start + FEEDBACK_INSERT_BATCH_SIZE]
+                    cursor.executemany("""
+                        INSERT INTO Feedback (
+                            Feedback_ID, Title, Content, Source, Source_URL, Author,
+                            Created_Date, Sentiment, Primary_Category, Enhanced_Category,
+                            Audience, Priority, Feedback_Gist, Area, Impacttype, Scenario,
+                            Tag, Organization, Status, Created_by, Rawfeedback, Category,
+                            Subcategory, Feature_Area, Categorization_Confidence, Primary_Domain, Domains, Matched_Keywords
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, batch)
+                    processed_items += len(batch)
+                    if progress_callback:
+                        progress_callback(processed_items, total_items)
                 logger.info("✅ Bulk insert completed")
             
             conn.commit()
@@ -741,12 +800,19 @@ class FabricSQLWriter:
             
             # Process each state change
             updated_count = 0
+            sql_login = None  # Looked up only for changes that don't say who made them
             for change in state_changes:
                 feedback_id = change.get('feedback_id')
                 if not feedback_id:
                     logger.warning(f"Skipping change without feedback_id: {change}")
                     continue
                 
+                updated_by = change.get('updated_by')
+                if not updated_by:
+                    if sql_login is None:
+                        sql_login = self.get_current_user(conn)
+                    updated_by = sql_login
+                
                 logger.info(f"Processing state change for feedback_id: {feedback_id}")
                 
                 # Check if record exists
@@ -769,7 +835,7 @@ class FabricSQLWriter:
                         change.get('state'),
                         change.get('notes'),
                         change.get('domain'),
-                        self.current_user or change.get('updated_by') or 'unknown_user',
+                        updated_by,
                         feedback_id
                     ])
                     
@@ -787,7 +853,7 @@ class FabricSQLWriter:
                         change.get('state', 'NEW'),
                         change.get('notes'),
                         change.get('domain'),
-                        self.current_user or change.get('updated_by') or 'unknown_user'
+                        updated_by
                     ])
                     
                     logger.info(f"Inserted new record for feedback_id: {feedback_id}")
@@ -966,6 +1032,152 @@ class FabricSQLWriter:
             logger.error(f"❌ Error in recategorize_all_feedback: {e}")
             return {'recategorized': 0, 'skipped_user_modified': 0, 'total_processed': 0}
 
+# Shared writer instance; the writer opens a fresh connection per operation, so one instance can serve every request
+_shared_writer = None
+_shared_writer_lock = threading.Lock()
+
+def get_shared_writer() -> FabricSQLWriter:
+    """Return the process-wide FabricSQLWriter, creating it on first use"""
+    global _shared_writer
+    writer = _shared_writer
+    if writer is None:
+        with _shared_writer_lock:
+            if _shared_writer is None:
+                _shared_writer = FabricSQLWriter()
+            writer = _shared_writer
+    return writer
+
+def reset_shared_writer():
+    """Drop the shared writer so the next call to get_shared_writer() builds a new one"""
+    global _shared_writer
+    with _shared_writer_lock:
+        _shared_writer = None
+
+# Single-row state changes submitted within this window share one connection and transaction
+STATE_CHANGE_COALESCE_SECONDS = 0.05
+STATE_CHANGE_MAX_BATCH = 200
+# Longest a request waits for its change to be written (covers an interactive sign-in prompt)
+STATE_CHANGE_RESULT_TIMEOUT = 120
+
+class _StateChangeCoalescer:
+    """Funnels state changes from concurrent requests into batched update_feedback_states calls"""
+    
+    def __init__(self):
+        self._pending = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+    
+    def submit(self, state_change: Dict[str, Any]) -> Future:
+        future = Future()
+        self._pending.put((state_change, future))
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name='state-change-coalescer', daemon=True)
+                self._worker.start()
+        return future
+    
+    def _run(self):
+        while True:
+            # Block for the first change, then gather whatever arrives before the window closes
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + STATE_CHANGE_COALESCE_SECONDS
+            while len(batch) < STATE_CHANGE_MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            if self._write([change for change, _ in batch]):
+                for _, future in batch:
+                    future.set_result(True)
+            else:
+                # One bad change must not fail the edits it was batched with: retry each on its own
+                if len(batch) > 1:
+                    logger.warning(f"Batch of {len(batch)} state changes failed, retrying them one at a time")
+                for change, future in batch:
+                    future.set_result(len(batch) > 1 and self._write([change]))
+    
+    @staticmethod
+    def _write(changes: List[Dict[str, Any]]) -> bool:
+        try:
+            return get_shared_writer().update_feedback_states(changes, use_token=False)
+        except Exception as e:
+            logger.error(f"Error writing {len(changes)} coalesced state changes: {e}")
+            return False
+
+_state_change_coalescer = _StateChangeCoalescer()
+
+def submit_state_change(state_change: Dict[str, Any], on_committed: Optional[Callable[[], None]] = None) -> Optional[bool]:
+    """
+    Write one state change and wait for it to commit. Changes submitted within the coalescing window
+    share one transaction.
+    
+    Returns True once committed and False if the write failed. None means the write was still queued or
+    running after STATE_CHANGE_RESULT_TIMEOUT seconds: its outcome is unknown, and on_committed (the
+    caller's in-memory update) is called from the writer thread if it commits later.
+    """
+    future = _state_change_coalescer.submit(state_change)
+    try:
+        return future.result(timeout=STATE_CHANGE_RESULT_TIMEOUT)
+    except FutureTimeoutError:
+        logger.warning(f"State change for {state_change.get('feedback_id')} still pending after {STATE_CHANGE_RESULT_TIMEOUT}s")
+    
+    def apply_late_commit(done: Future):
+        if not done.result():
+            return
+        import state_manager
+        
+        logger.info(f"Pending state change for {state_change.get('feedback_id')} committed")
+        state_manager.invalidate_feedback_states_cache()
+        if on_committed is not None:
+            on_committed()
+    
+    future.add_done_callback(apply_late_commit)
+    return None
+
+# FeedbackState row keys (as returned by load_feedback_states) -> in-memory feedback fields
+_STATE_ROW_FIELDS = {
+    'state': 'State',
+    'domain': 'Primary_Domain',
+    'notes': 'Feedback_Notes',
+    'last_updated': 'Last_Updated',
+    'updated_by': 'Updated_By'
+}
+
+def sync_feedback_with_sql(feedback_items: List[Dict[str, Any]], id_whitelist: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+    """
+    Apply FeedbackState rows from Fabric SQL to feedback items in place
+    
+    Args:
+        feedback_items: Feedback dicts to update
+        id_whitelist: Feedback_IDs to fetch; defaults to the IDs of feedback_items
+        
+    Returns:
+        List[Dict[str, Any]]: The same feedback items, with SQL state applied
+    """
+    import state_manager
+    
+    if not feedback_items:
+        return feedback_items
+    if id_whitelist is None:
+        id_whitelist = [item.get('Feedback_ID') for item in feedback_items]
+    # Briefly cached per ID set, so refreshes and filter changes reuse one query until a state write
+    state_data = state_manager.get_feedback_states_for_ids(id_whitelist)
+    
+    applied = 0
+    for item in feedback_items:
+        sql_state = state_data.get(item.get('Feedback_ID'))
+        if sql_state:
+            item.update({dst: sql_state[src] for src, dst in _STATE_ROW_FIELDS.items() if sql_state.get(src)})
+            item['is_stored_in_sql'] = True
+            applied += 1
+    
+    logger.info(f"📊 Applied SQL state to {applied} of {len(feedback_items)} feedback items")
+    return feedback_items
+
 def update_feedback_states_in_fabric_sql(bearer_token: str, state_changes: List[Dict[str, Any]]) -> bool:
     """
     Convenience function to update feedback states in Fabric SQL database
@@ -981,7 +1193,7 @@ def update_feedback_states_in_fabric_sql(bearer_token: str, state_changes: List[
     try:
         # Always try interactive authentication for now since bearer token has issues
         logger.info("Using interactive authentication for SQL database (bearer token method needs refinement)")
-        writer = FabricSQLWriter()
+        writer = get_shared_writer()
         return writer.update_feedback_states(state_changes, use_token=False)
         
     except Exception as e:
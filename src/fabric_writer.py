@@ -160,13 +160,29 @@ else:
 """
     return pyspark_code
 
-def _test_fabric_token(token: str, livy_endpoint: str, spark_conf: dict = None) -> str:
-    """Fast token validation: Just test if Livy accepts session creation request"""
+# Stable tag so token checks attach to a shared high-concurrency Livy session instead of cold-starting one
+TOKEN_TEST_SESSION_TAG = 'fc-token-validate'
+
+def _high_concurrency_endpoint(livy_endpoint: str) -> str:
+    """Map a Livy `.../sessions` endpoint to its `.../highConcurrencySessions` counterpart"""
+    base = livy_endpoint.rstrip('/')
+    if base.endswith('/sessions'):
+        return base[:-len('/sessions')] + '/highConcurrencySessions'
+    return base
+
+def _test_fabric_token(token: str, livy_endpoint: str, spark_conf: dict = None, release: bool = True) -> str:
+    """Fast token validation: acquire (and by default release) a tagged high-concurrency Livy session"""
     headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
-    session_payload = {'name': 'FeedbackCollectorTokenTest', 'kind': 'pyspark', 'conf': spark_conf or DEFAULT_SPARK_CONF}
+    hc_endpoint = _high_concurrency_endpoint(livy_endpoint)
+    session_payload = {
+        'name': 'FeedbackCollectorTokenTest',
+        'kind': 'pyspark',
+        'sessionTag': TOKEN_TEST_SESSION_TAG,
+        'conf': spark_conf or DEFAULT_SPARK_CONF
+    }
     try:
-        logger.info(f"Testing Fabric token with Livy session creation at {livy_endpoint}")
-        response = requests.post(livy_endpoint, headers=headers, json=session_payload, timeout=60)
+        logger.info(f"Testing Fabric token with high-concurrency Livy session at {hc_endpoint}")
+        response = requests.post(hc_endpoint, headers=headers, json=session_payload, timeout=60)
         response.raise_for_status()
         session_data = response.json()
         session_id = session_data.get('id')
@@ -176,10 +192,13 @@ def _test_fabric_token(token: str, livy_endpoint: str, spark_conf: dict = None)
             logger.error(f"Livy rejected token - no session ID: {session_data}")
             return None
             
-        logger.info(f"✅ Token validation successful - Livy accepted session: ID {session_id}, State {session_state}")
+        logger.info(f"✅ Token validation successful - Livy accepted HC session: ID {session_id}, State {session_state}")
+        
+        # The underlying Livy session stays warm for other callers with the same tag,
+        # so release our HC handle straight away unless the caller wants to keep it
+        if release:
+            _close_livy_session(token, hc_endpoint, session_id)
         
-        # Don't wait for session to be ready - just return the session ID
-        # The session will start in the background
         return session_id
         
     except requests.exceptions.HTTPError as e:
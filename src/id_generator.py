@@ -6,6 +6,13 @@ Ensures same content always gets same ID across sessions
 import hashlib
 import re
 from datetime import datetime
+from functools import lru_cache
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Distinct (title, content, source, author, date) inputs whose IDs are kept; reposted content skips rehashing
+ID_CACHE_SIZE = 8192
 
 class FeedbackIDGenerator:
     """Generates consistent IDs based on feedback content"""
@@ -20,14 +27,15 @@ class FeedbackIDGenerator:
         content = content.lower()
         
         # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content.strip())
+        content = _WHITESPACE_RE.sub(' ', content.strip())
         
         # Remove common punctuation that might vary
-        content = re.sub(r'[^\w\s]', '', content)
+        content = _PUNCTUATION_RE.sub('', content)
         
         return content
     
     @staticmethod
+    @lru_cache(maxsize=ID_CACHE_SIZE)
     def generate_feedback_id(title, content, source, author=None, created_date=None):
         """Generate deterministic feedback ID based on STABLE content only
         
@@ -113,4 +121,13 @@ class FeedbackIDGenerator:
             source=source,
             author=author,
             created_date=created_date
-        )
\ No newline at end of file
+        )
+    
+    @staticmethod
+    def generate_ids_batch(feedback_items):
+        """Generate IDs for a list of feedback dictionaries, in order
+        
+        Duplicate items (same stable fields) are hashed once thanks to the ID cache.
+        """
+        generate = FeedbackIDGenerator.generate_id_from_feedback_dict
+        return [generate(feedback) for feedback in feedback_items]
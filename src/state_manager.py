@@ -1,14 +1,69 @@
 import uuid
 import json
 import base64
+import functools
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import logging
 
 from config import FEEDBACK_STATES, DEFAULT_FEEDBACK_STATE
 
 logger = logging.getLogger(__name__)
 
+# Short-lived cache for FeedbackState reads so polling endpoints don't re-query SQL on every hit
+FEEDBACK_STATES_CACHE_TTL = 5  # seconds
+# Viewer syncs fetch the same ID slice on every refresh or filter change; every state write clears the cache
+FEEDBACK_SYNC_CACHE_TTL = 60  # seconds
+# Most cached reads kept at once (each viewer page's ID slice is its own entry); expired and then oldest entries go first
+FEEDBACK_STATES_CACHE_MAX_ENTRIES = 32
+# Cache key -> (expiry on the monotonic clock, result), in insertion order
+_states_cache: Dict[Any, tuple] = {}
+_states_cache_lock = threading.Lock()
+
+def _store_cached_states(key, result, expires_at: float) -> None:
+    """Insert a cache entry (caller holds _states_cache_lock), keeping the cache within its size cap"""
+    now = time.monotonic()
+    for expired_key in [k for k, (expiry, _) in _states_cache.items() if expiry <= now]:
+        del _states_cache[expired_key]
+    _states_cache.pop(key, None)
+    while len(_states_cache) >= FEEDBACK_STATES_CACHE_MAX_ENTRIES:
+        del _states_cache[next(iter(_states_cache))]
+    _states_cache[key] = (expires_at, result)
+
+def _cached_for_ttl(func=None, *, ttl: float = FEEDBACK_STATES_CACHE_TTL, fallback=None):
+    """
+    Cache a FeedbackState query result for `ttl` seconds, keyed by function and arguments.
+    The query raises on failure; the wrapper logs it and returns `fallback()` without caching,
+    so a transient SQL or auth error is retried on the next call instead of served for the whole TTL.
+    """
+    if func is None:
+        return functools.partial(_cached_for_ttl, ttl=ttl, fallback=fallback)
+    
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        now = time.monotonic()
+        with _states_cache_lock:
+            cached = _states_cache.get(key)
+        if cached and now < cached[0]:
+            return cached[1]
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            logger.error(f"Error in {func.__name__} querying Fabric SQL: {e}")
+            return fallback()
+        with _states_cache_lock:
+            _store_cached_states(key, result, now + ttl)
+        return result
+    return wrapper
+
+def invalidate_feedback_states_cache() -> None:
+    """Drop cached FeedbackState reads after a write"""
+    with _states_cache_lock:
+        _states_cache.clear()
+
 def generate_feedback_id() -> str:
     """Generate a unique feedback ID using UUID4"""
     return str(uuid.uuid4())
@@ -81,12 +136,15 @@ def get_all_states() -> List[Dict[str, Any]]:
         for key, info in FEEDBACK_STATES.items()
     ]
 
-def initialize_feedback_state(feedback_item: Dict[str, Any]) -> Dict[str, Any]:
-    """Initialize state-related fields for a new feedback item"""
-    now = datetime.now().isoformat()
+def initialize_feedback_state(feedback_item: Dict[str, Any], now: Optional[str] = None) -> Dict[str, Any]:
+    """Initialize state-related fields for a new feedback item.
+    Batch callers can pass a shared ISO timestamp as `now` to avoid a clock read per item.
+    """
+    if now is None:
+        now = datetime.now().isoformat()
     
     # Add unique ID if not present
-    if 'Feedback_ID' not in feedback_item or not feedback_item['Feedback_ID']:
+    if not feedback_item.get('Feedback_ID'):
         feedback_item['Feedback_ID'] = generate_feedback_id()
     
     # Set default state
@@ -149,7 +207,7 @@ def get_stored_feedback_ids() -> List[str]:
         import fabric_sql_writer
         
         # Create SQL writer and get connection
-        writer = fabric_sql_writer.FabricSQLWriter()
+        writer = fabric_sql_writer.get_shared_writer()
         conn = writer.connect_interactive()
         
         if not conn:
@@ -187,7 +245,7 @@ def get_all_feedback_states() -> Dict[str, Dict[str, Any]]:
         import fabric_sql_writer
         
         # Create SQL writer and get connection
-        writer = fabric_sql_writer.FabricSQLWriter()
+        writer = fabric_sql_writer.get_shared_writer()
         conn = writer.connect_interactive()
         
         if not conn:
@@ -216,11 +274,10 @@ def get_all_feedback_states() -> Dict[str, Dict[str, Any]]:
         """
         
         cursor.execute(query)
-        results = cursor.fetchall()
         
-        # Convert to dictionary for easy lookup
+        # Convert to dictionary for easy lookup, fetching rows in batches
         state_data = {}
-        for row in results:
+        for row in fabric_sql_writer.iter_cursor_rows(cursor):
             feedback_id = row[0]
             state_data[feedback_id] = {
                 'state': row[1],
@@ -244,6 +301,163 @@ def get_all_feedback_states() -> Dict[str, Dict[str, Any]]:
         logger.error(f"Error querying feedback states from Fabric SQL: {e}")
         return {}
 
+def get_feedback_states_by_domain(domain_patterns: List[str], offset: int = 0,
+                                  limit: Optional[int] = None) -> Tuple[Dict[str, Dict[str, Any]], int]:
+    """
+    Get feedback states whose domain contains any of the given substrings, plus the total number of matches.
+    The domain falls back to Feedback.Primary_Domain when FeedbackState has none (as in get_all_feedback_states).
+    The filter and optional paging run in SQL, so only the requested page of matching rows is fetched.
+    Returns (feedback_id -> state data for the page, total matching rows); ({}, 0) if SQL is unreachable.
+    """
+    if not domain_patterns:
+        return {}, 0
+    
+    try:
+        import fabric_sql_writer
+        
+        # Create SQL writer and get connection
+        writer = fabric_sql_writer.get_shared_writer()
+        conn = writer.connect_interactive()
+        
+        if not conn:
+            logger.error("Could not establish SQL connection to get feedback states by domain")
+            return {}, 0
+        
+        try:
+            cursor = conn.cursor()
+            
+            domain_clause = " OR ".join("COALESCE(fs.Primary_Domain, f.Primary_Domain) LIKE ?" for _ in domain_patterns)
+            matches = f"""
+                FROM FeedbackState fs
+                LEFT JOIN Feedback f ON fs.Feedback_ID = f.Feedback_ID
+                WHERE fs.Feedback_ID IS NOT NULL AND fs.Feedback_ID != '' AND ({domain_clause})
+            """
+            match_params = [f"%{pattern}%" for pattern in domain_patterns]
+            
+            cursor.execute(f"SELECT COUNT(*) {matches}", match_params)
+            total_matches = cursor.fetchone()[0]
+            
+            query = f"""
+                SELECT fs.Feedback_ID, fs.State, COALESCE(fs.Primary_Domain, f.Primary_Domain) as Primary_Domain,
+                       fs.Feedback_Notes, fs.Last_Updated, fs.Updated_By
+                {matches}
+                ORDER BY fs.Feedback_ID
+            """
+            params = list(match_params)
+            if limit is not None:
+                query += " OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
+                params.extend([offset, limit])
+            
+            cursor.execute(query, params)
+            
+            state_data = {}
+            for row in fabric_sql_writer.iter_cursor_rows(cursor):
+                state_data[row[0]] = {
+                    'state': row[1],
+                    'domain': row[2],
+                    'notes': row[3],
+                    'last_updated': row[4].isoformat() if row[4] else None,
+                    'updated_by': row[5]
+                }
+            
+            cursor.close()
+        finally:
+            conn.close()
+        
+        logger.info(f"Loaded {len(state_data)} of {total_matches} feedback states matching domains {domain_patterns}")
+        
+        return state_data, total_matches
+        
+    except Exception as e:
+        logger.error(f"Error querying feedback states by domain from Fabric SQL: {e}")
+        return {}, 0
+
+@_cached_for_ttl(ttl=FEEDBACK_SYNC_CACHE_TTL, fallback=dict)
+def _load_feedback_states_for_ids(feedback_ids: tuple) -> Dict[str, Dict[str, Any]]:
+    import fabric_sql_writer
+    
+    return fabric_sql_writer.get_shared_writer().query_feedback_states(feedback_ids=feedback_ids)
+
+def get_feedback_states_for_ids(feedback_ids) -> Dict[str, Dict[str, Any]]:
+    """
+    Get FeedbackState rows for the given Feedback_IDs (cached for FEEDBACK_SYNC_CACHE_TTL seconds).
+    The same set of IDs hits the same cache entry regardless of order or duplicates.
+    """
+    return _load_feedback_states_for_ids(tuple(sorted({feedback_id for feedback_id in feedback_ids if feedback_id})))
+
+@_cached_for_ttl(fallback=int)
+def count_feedback_states() -> int:
+    """Get the number of rows in the FeedbackState table (cached briefly; 0 if SQL is unreachable)."""
+    import fabric_sql_writer
+    
+    writer = fabric_sql_writer.get_shared_writer()
+    conn = writer.connect_interactive()
+    
+    if not conn:
+        raise ConnectionError("Could not establish SQL connection to count feedback states")
+    
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM FeedbackState WHERE Feedback_ID IS NOT NULL AND Feedback_ID != ''")
+        total = cursor.fetchone()[0]
+        cursor.close()
+    finally:
+        conn.close()
+    
+    return total
+
+@_cached_for_ttl(fallback=list)
+def sample_feedback_states(limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Get the most recently updated feedback states without loading the whole table (cached briefly).
+    Rows have the same shape as the values returned by get_all_feedback_states(); empty if SQL is unreachable.
+    """
+    import fabric_sql_writer
+    
+    writer = fabric_sql_writer.get_shared_writer()
+    conn = writer.connect_interactive()
+    
+    if not conn:
+        raise ConnectionError("Could not establish SQL connection to sample feedback states")
+    
+    try:
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT TOP (?)
+                fs.Feedback_ID,
+                fs.State,
+                COALESCE(fs.Primary_Domain, f.Primary_Domain) as Primary_Domain,
+                fs.Feedback_Notes,
+                fs.Last_Updated,
+                fs.Updated_By,
+                COALESCE(fs.Category, f.Category) as Category,
+                COALESCE(fs.Subcategory, f.Subcategory) as Subcategory,
+                COALESCE(fs.Feature_Area, f.Feature_Area) as Feature_Area
+            FROM FeedbackState fs
+            LEFT JOIN Feedback f ON fs.Feedback_ID = f.Feedback_ID
+            WHERE fs.Feedback_ID IS NOT NULL AND fs.Feedback_ID != ''
+            ORDER BY fs.Last_Updated DESC
+        """, [limit])
+        
+        samples = [
+            {
+                'state': row[1],
+                'domain': row[2],
+                'notes': row[3],
+                'last_updated': row[4].isoformat() if row[4] else None,
+                'updated_by': row[5],
+                'category': row[6],
+                'subcategory': row[7],
+                'feature_area': row[8]
+            }
+            for row in cursor.fetchall()
+        ]
+        cursor.close()
+    finally:
+        conn.close()
+    
+    return samples
+
 def update_feedback_field_in_sql(feedback_id: str, field_name: str, new_value: str, bearer_token: str) -> bool:
     """
     Update a specific field for a feedback item directly in Fabric SQL database.
@@ -261,7 +475,7 @@ def update_feedback_field_in_sql(feedback_id: str, field_name: str, new_value: s
         import fabric_sql_writer
         
         # Create SQL writer and get connection
-        writer = fabric_sql_writer.FabricSQLWriter()
+        writer = fabric_sql_writer.get_shared_writer()
         conn = writer.connect_interactive()
         
         if not conn:
@@ -322,6 +536,7 @@ def update_feedback_field_in_sql(feedback_id: str, field_name: str, new_value: s
         # Check if any rows were affected
         if cursor.rowcount > 0:
             conn.commit()
+            invalidate_feedback_states_cache()
             logger.info(f"✅ Successfully updated {field_name} to '{new_value}' for feedback {feedback_id}")
             cursor.close()
             conn.close()
@@ -374,7 +589,7 @@ def update_feedback_category_in_sql(
         import fabric_sql_writer
         from datetime import datetime
 
-        writer = fabric_sql_writer.FabricSQLWriter()
+        writer = fabric_sql_writer.get_shared_writer()
         conn = writer.connect_interactive()
 
         if not conn:
@@ -458,6 +673,7 @@ def update_feedback_category_in_sql(
             state_rows = cursor.rowcount
 
         conn.commit()
+        invalidate_feedback_states_cache()
         cursor.close()
         conn.close()
 
@@ -8,6 +8,11 @@ from config import (
     DOMAIN_CATEGORIES, IMPACT_TYPES_CONFIG
 )
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
@@ -56,108 +61,126 @@ def ensure_nltk_resources():
         download_nltk_resources()
         _nltk_resources_downloaded = True
 
-def clean_feedback_text(text: str) -> str:
-    """
-    Clean and normalize feedback text from various sources, especially ADO which contains HTML/CSS.
-    
-    Args:
-        text: Raw feedback text that may contain HTML, CSS, or other formatting
-    
-    Returns:
-        Cleaned text suitable for analysis and display
-    """
-    if not text or not isinstance(text, str):
-        return ""
-    
+# Substitutions applied in order by clean_feedback_text; compiled once at import time
+_MARKUP_CLEANUP_SUBS = [
     # Remove CSS styles (common in ADO feedback) - more aggressive approach
     # Remove everything that looks like CSS class definitions and rules
-    text = re.sub(r'[a-zA-Z0-9\.\#\-_,\s]*\{[^}]*\}', '', text)
-    
+    (re.compile(r'[a-zA-Z0-9\.\#\-_,\s]*\{[^}]*\}'), ''),
+
     # Remove specific CSS patterns that might be missed
-    text = re.sub(r'p\.MsoNormal[^}]*}?', '', text)
-    text = re.sub(r'li\.MsoNormal[^}]*}?', '', text)
-    text = re.sub(r'div\.MsoNormal[^}]*}?', '', text)
-    text = re.sub(r'span\.EmailStyle\d+[^}]*}?', '', text)
-    text = re.sub(r'\.MsoChpDefault[^}]*}?', '', text)
-    text = re.sub(r'div\.WordSection\d+[^}]*}?', '', text)
-    
+    (re.compile(r'p\.MsoNormal[^}]*}?'), ''),
+    (re.compile(r'li\.MsoNormal[^}]*}?'), ''),
+    (re.compile(r'div\.MsoNormal[^}]*}?'), ''),
+    (re.compile(r'span\.EmailStyle\d+[^}]*}?'), ''),
+    (re.compile(r'\.MsoChpDefault[^}]*}?'), ''),
+    (re.compile(r'div\.WordSection\d+[^}]*}?'), ''),
+
     # Remove the specific problematic pattern from ADO: "a: p.xxmsonormal, li.xxmsonormal, div.xxmsonormal {"
-    text = re.sub(r'[a-zA-Z]+:\s*p\.[a-zA-Z]+,?\s*li\.[a-zA-Z]+,?\s*div\.[a-zA-Z]+\s*\{?', '', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'[a-zA-Z]+:\s*p\.[a-zA-Z]+,?\s*li\.[a-zA-Z]+,?\s*div\.[a-zA-Z]+\s*\{?', re.IGNORECASE), ''),
+
     # Remove CSS selector lists (handles comma-separated selectors)
-    text = re.sub(r'[a-zA-Z]+\.[a-zA-Z]+(?:\s*,\s*[a-zA-Z]+\.[a-zA-Z]+)*\s*\{?', '', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'[a-zA-Z]+\.[a-zA-Z]+(?:\s*,\s*[a-zA-Z]+\.[a-zA-Z]+)*\s*\{?', re.IGNORECASE), ''),
+
     # Remove any remaining CSS-like patterns
-    text = re.sub(r'[a-zA-Z\-]+:[^;]{1,50};', '', text)  # CSS properties
-    text = re.sub(r'margin:[^;]+;?', '', text)
-    text = re.sub(r'font-[^;]+;?', '', text)
-    text = re.sub(r'color:[^;]+;?', '', text)
-    
+    (re.compile(r'[a-zA-Z\-]+:[^;]{1,50};'), ''),  # CSS properties
+    (re.compile(r'margin:[^;]+;?'), ''),
+    (re.compile(r'font-[^;]+;?'), ''),
+    (re.compile(r'color:[^;]+;?'), ''),
+
     # Remove class name lists that might remain (including x_ prefixed versions)
-    text = re.sub(r'p\.x?_?MsoNormal,?\s*li\.x?_?MsoNormal,?\s*div\.x?_?MsoNormal', '', text)
-    text = re.sub(r'p\.x_MsoNormal,?\s*li\.x_MsoN[^,\s]*', '', text)  # Handle truncated versions
-    
+    (re.compile(r'p\.x?_?MsoNormal,?\s*li\.x?_?MsoNormal,?\s*div\.x?_?MsoNormal'), ''),
+    (re.compile(r'p\.x_MsoNormal,?\s*li\.x_MsoN[^,\s]*'), ''),  # Handle truncated versions
+
     # Remove any remaining CSS class patterns with x_ prefix
-    text = re.sub(r'[a-zA-Z\.x_]+MsoNormal[^,\s]*,?\s*', '', text)
-    
+    (re.compile(r'[a-zA-Z\.x_]+MsoNormal[^,\s]*,?\s*'), ''),
+
     # Remove HTML entities and tags
-    text = re.sub(r'&nbsp;', ' ', text)
-    text = re.sub(r'&[a-zA-Z0-9#]+;', ' ', text)  # HTML entities
-    text = re.sub(r'<[^>]+>', '', text)  # HTML tags
-    
+    (re.compile(r'&nbsp;'), ' '),
+    (re.compile(r'&[a-zA-Z0-9#]+;'), ' '),  # HTML entities
+    (re.compile(r'<[^>]+>'), ''),  # HTML tags
+
     # Remove font specifications and styling
-    text = re.sub(r'font-family:[^;]+;', '', text)
-    text = re.sub(r'font-size:[^;]+;', '', text)
-    text = re.sub(r'margin:[^;]+;', '', text)
-    text = re.sub(r'color:[^;]+;', '', text)
-    
+    (re.compile(r'font-family:[^;]+;'), ''),
+    (re.compile(r'font-size:[^;]+;'), ''),
+    (re.compile(r'margin:[^;]+;'), ''),
+    (re.compile(r'color:[^;]+;'), ''),
+
     # Remove orphaned CSS fragments and malformed patterns
-    text = re.sub(r'[a-zA-Z]+:\s*[^;{}\s]+[;{}\s]*', '', text)  # CSS properties without context
-    text = re.sub(r'\{[^}]*\}', '', text)  # Any remaining CSS blocks
-    text = re.sub(r'[a-zA-Z]+\.[a-zA-Z]+[,\s]*', '', text)  # Leftover CSS class references
-    
+    (re.compile(r'[a-zA-Z]+:\s*[^;{}\s]+[;{}\s]*'), ''),  # CSS properties without context
+    (re.compile(r'\{[^}]*\}'), ''),  # Any remaining CSS blocks
+    (re.compile(r'[a-zA-Z]+\.[a-zA-Z]+[,\s]*'), ''),  # Leftover CSS class references
+
     # Remove common CSS properties
-    text = re.sub(r'[a-zA-Z-]+:\s*[^;]+;', '', text)
-    
+    (re.compile(r'[a-zA-Z-]+:\s*[^;]+;'), ''),
+
     # Clean up whitespace and formatting
-    text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single space
-    text = re.sub(r'\n\s*\n', '\n\n', text)  # Multiple newlines to double newline
-    text = text.strip()
-    
-    # Remove empty lines and excessive whitespace
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    text = '\n'.join(lines)
-    
+    (re.compile(r'\s+'), ' '),  # Multiple spaces to single space
+    (re.compile(r'\n\s*\n'), '\n\n'),  # Multiple newlines to double newline
+]
+
+_EMAIL_CLEANUP_SUBS = [
     # Remove patterns like "Description:" that appear anywhere in the text
-    text = re.sub(r'\bDescription:\s*', '', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\bDescription:\s*', re.IGNORECASE), ''),
+
     # Remove "microsoft.com Description:" pattern specifically
-    text = re.sub(r'microsoft\.com\s+Description:\s*', 'microsoft.com ', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'microsoft\.com\s+Description:\s*', re.IGNORECASE), 'microsoft.com '),
+
     # EMAIL REMOVAL - Simple regex approach
     # Remove email headers
-    text = re.sub(r'^From:\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^To:\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^Sent:\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^Subject:\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'^Cc:\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    
+    (re.compile(r'^From:\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+    (re.compile(r'^To:\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+    (re.compile(r'^Sent:\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+    (re.compile(r'^Subject:\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+    (re.compile(r'^Cc:\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+
     # Remove email addresses (replace with placeholder to avoid removing context)
-    text = re.sub(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', '[email-removed]', text)
-    
+    (re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'), '[email-removed]'),
+
     # Remove external email markers
-    text = re.sub(r'\[EXTERNAL\]\s*', '', text, flags=re.IGNORECASE)
-    
+    (re.compile(r'\[EXTERNAL\]\s*', re.IGNORECASE), ''),
+
     # Remove email signatures
-    text = re.sub(r'Best regards,?\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    text = re.sub(r'Thanks,?\s*.*$', '', text, flags=re.MULTILINE | re.IGNORECASE)
-    
+    (re.compile(r'Best regards,?\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+    (re.compile(r'Thanks,?\s*.*$', re.MULTILINE | re.IGNORECASE), ''),
+
     # Remove email threading
-    text = re.sub(r'-----Original Message-----.*', '', text, flags=re.DOTALL | re.IGNORECASE)
-    
+    (re.compile(r'-----Original Message-----.*', re.DOTALL | re.IGNORECASE), ''),
+
     # Clean up whitespace and formatting
-    text = re.sub(r'\s+', ' ', text)  # Multiple spaces to single space
-    text = re.sub(r'\n\s*\n', '\n\n', text)  # Multiple newlines to double newline
+    (re.compile(r'\s+'), ' '),  # Multiple spaces to single space
+    (re.compile(r'\n\s*\n'), '\n\n'),  # Multiple newlines to double newline
+]
+
+_EXCESS_PUNCTUATION_RE = re.compile(r'[.,;:!?]{3,}')
+
+def _apply_substitutions(text: str, substitutions) -> str:
+    for pattern, replacement in substitutions:
+        text = pattern.sub(replacement, text)
+    return text
+
+def clean_feedback_text(text: str) -> str:
+    """
+    Clean and normalize feedback text from various sources, especially ADO which contains HTML/CSS.
+    
+    Args:
+        text: Raw feedback text that may contain HTML, CSS, or other formatting
+    
+    Returns:
+        Cleaned text suitable for analysis and display
+    """
+    if not text or not isinstance(text, str):
+        return ""
+    
+    # Strip CSS, HTML and styling fragments, then collapse whitespace
+    text = _apply_substitutions(text, _MARKUP_CLEANUP_SUBS)
+    text = text.strip()
+    
+    # Remove empty lines and excessive whitespace
+    lines = [line.strip() for line in text.split('\n') if line.strip()]
+    text = '\n'.join(lines)
+    
+    # Remove "Description:" labels, email headers, addresses, signatures and threading
+    text = _apply_substitutions(text, _EMAIL_CLEANUP_SUBS)
     text = text.strip()
     
     # Remove empty lines and excessive whitespace
@@ -165,7 +188,7 @@ def clean_feedback_text(text: str) -> str:
     text = '\n'.join(lines)
     
     # Remove excessive punctuation
-    text = re.sub(r'[.,;:!?]{3,}', '...', text)
+    text = _EXCESS_PUNCTUATION_RE.sub('...', text)
     
     return text.strip()
 
@@ -452,6 +475,57 @@ def determine_impact_type(text: str) -> str:
     
     return 'FEEDBACK'  # Fallback
 
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of lowercase keywords occur as substrings of a lowercase text.
+    
+    Uses an Aho-Corasick automaton (pyahocorasick) so a text is scanned once regardless of
+    how many keywords there are; falls back to per-keyword substring checks without it.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = frozenset(keywords)
+        self._automaton = None
+        if ahocorasick is not None:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                if keyword:
+                    automaton.add_word(keyword, keyword)
+            if len(automaton):
+                automaton.make_automaton()
+                self._automaton = automaton
+    
+    def find(self, text_lower: str) -> set:
+        """Return the set of keywords contained in text_lower"""
+        if self._automaton is None:
+            return {keyword for keyword in self.keywords if keyword in text_lower}
+        found = {keyword for _, keyword in self._automaton.iter(text_lower)}
+        if '' in self.keywords:
+            found.add('')
+        return found
+
+# (categories dict, [(category_info, subcategory_info, lowercase keywords)], KeywordMatcher)
+_category_index = None
+
+def _get_category_index(categories: dict):
+    """Flatten the category tree and build its keyword matcher once per categories object"""
+    global _category_index
+    cached = _category_index
+    if cached is not None and cached[0] is categories:
+        return cached[1], cached[2]
+    
+    entries = []
+    all_keywords = set()
+    for category_info in categories.values():
+        for subcategory_info in category_info['subcategories'].values():
+            keywords_lower = tuple(keyword.lower() for keyword in subcategory_info['keywords'])
+            entries.append((category_info, subcategory_info, keywords_lower))
+            all_keywords.update(keywords_lower)
+    
+    matcher = KeywordMatcher(all_keywords)
+    _category_index = (categories, entries, matcher)
+    return entries, matcher
+
 def enhanced_categorize_feedback(text: str, source: str = "", scenario: str = "", organization: str = "") -> dict:
     """
     Enhanced categorization that provides hierarchical categorization with audience detection.
@@ -510,38 +584,39 @@ def enhanced_categorize_feedback(text: str, source: str = "", scenario: str = ""
     total_keywords_found = 0
     best_subcategory_keyword_count = 0
     
+    # Find every category keyword present in the text in a single scan
+    category_entries, keyword_matcher = _get_category_index(ENHANCED_FEEDBACK_CATEGORIES)
+    found_keywords = keyword_matcher.find(text_lower)
+    
+    # Bonus for source alignment does not depend on the subcategory
+    source_lower = source.lower()
+    source_bonus = 1 if (
+        (audience == 'Developer' and source_lower == 'github') or
+        (audience == 'Customer' and source_lower in ['reddit', 'fabric community'])
+    ) else 0
+    
     # Analyze all categories and subcategories
-    for category_id, category_info in ENHANCED_FEEDBACK_CATEGORIES.items():
-        for subcategory_id, subcategory_info in category_info['subcategories'].items():
-            score = 0
-            keywords_found = 0
-            
-            # Count keyword matches
-            for keyword in subcategory_info['keywords']:
-                if keyword.lower() in text_lower:
-                    score += 1
-                    keywords_found += 1
-            
-            # Bonus for audience alignment
-            if category_info['audience'] == audience or category_info['audience'] == 'All':
-                score += 2
-            
-            # Bonus for source alignment
-            if audience == 'Developer' and source.lower() == 'github':
-                score += 1
-            elif audience == 'Customer' and source.lower() in ['reddit', 'fabric community']:
-                score += 1
-            
-            if score > best_score:
-                best_score = score
-                best_match = {
-                    'primary_category': category_info['name'],
-                    'subcategory': subcategory_info['name'],
-                    'priority': subcategory_info['priority'],
-                    'feature_area': subcategory_info['feature_area']
-                }
-                total_keywords_found = keywords_found
-                best_subcategory_keyword_count = len(subcategory_info['keywords'])
+    for category_info, subcategory_info, keywords_lower in category_entries:
+        # Count keyword matches
+        keywords_found = sum(1 for keyword in keywords_lower if keyword in found_keywords)
+        score = keywords_found
+        
+        # Bonus for audience alignment
+        if category_info['audience'] == audience or category_info['audience'] == 'All':
+            score += 2
+        
+        score += source_bonus
+        
+        if score > best_score:
+            best_score = score
+            best_match = {
+                'primary_category': category_info['name'],
+                'subcategory': subcategory_info['name'],
+                'priority': subcategory_info['priority'],
+                'feature_area': subcategory_info['feature_area']
+            }
+            total_keywords_found = keywords_found
+            best_subcategory_keyword_count = len(subcategory_info['keywords'])
     
     # Update result if we found a good match
     if best_match and best_score > 0:
@@ -751,6 +826,40 @@ def analyze_feedback_trends(feedback_items: list) -> dict:
     
     return trends
 
+def _sentiment_from_scores(polarity: float, subjectivity: float) -> dict:
+    """Build the sentiment result dictionary from TextBlob polarity and subjectivity scores"""
+    # Determine sentiment label based on polarity
+    if polarity > 0.1:
+        label = 'Positive'
+    elif polarity < -0.1:
+        label = 'Negative'
+    else:
+        label = 'Neutral'
+    
+    # Determine confidence based on absolute polarity value
+    abs_polarity = abs(polarity)
+    if abs_polarity >= 0.5:
+        confidence = 'High'
+    elif abs_polarity >= 0.2:
+        confidence = 'Medium'
+    else:
+        confidence = 'Low'
+    
+    return {
+        'polarity': round(polarity, 3),
+        'subjectivity': round(subjectivity, 3),
+        'label': label,
+        'confidence': confidence
+    }
+
+def _neutral_sentiment() -> dict:
+    return {
+        'polarity': 0.0,
+        'subjectivity': 0.0,
+        'label': 'Neutral',
+        'confidence': 'Low'
+    }
+
 def analyze_sentiment(text: str) -> dict:
     """
     Analyzes sentiment of the given text using TextBlob.
@@ -762,53 +871,57 @@ def analyze_sentiment(text: str) -> dict:
         Dictionary containing sentiment score, polarity, and label
     """
     if not text or not isinstance(text, str):
-        return {
-            'polarity': 0.0,
-            'subjectivity': 0.0,
-            'label': 'Neutral',
-            'confidence': 'Low'
-        }
+        return _neutral_sentiment()
     
     try:
         # Ensure NLTK resources are downloaded before using TextBlob
         ensure_nltk_resources()
         
-        blob = TextBlob(text)
-        polarity = blob.sentiment.polarity  # Range: -1 (negative) to 1 (positive)
-        subjectivity = blob.sentiment.subjectivity  # Range: 0 (objective) to 1 (subjective)
-        
-        # Determine sentiment label based on polarity
-        if polarity > 0.1:
-            label = 'Positive'
-        elif polarity < -0.1:
-            label = 'Negative'
-        else:
-            label = 'Neutral'
-        
-        # Determine confidence based on absolute polarity value
-        abs_polarity = abs(polarity)
-        if abs_polarity >= 0.5:
-            confidence = 'High'
-        elif abs_polarity >= 0.2:
-            confidence = 'Medium'
-        else:
-            confidence = 'Low'
-        
-        return {
-            'polarity': round(polarity, 3),
-            'subjectivity': round(subjectivity, 3),
-            'label': label,
-            'confidence': confidence
-        }
+        sentiment = TextBlob(text).sentiment  # polarity: -1..1, subjectivity: 0..1
+        return _sentiment_from_scores(sentiment.polarity, sentiment.subjectivity)
         
     except Exception as e:
         logger.error(f"Error analyzing sentiment: {e}")
-        return {
-            'polarity': 0.0,
-            'subjectivity': 0.0,
-            'label': 'Neutral',
-            'confidence': 'Low'
-        }
+        return _neutral_sentiment()
+
+def analyze_sentiment_batch(texts: list) -> list:
+    """
+    Analyzes sentiment for a list of texts in one call.
+    
+    NLTK resources are checked once for the whole batch and repeated texts are
+    only scored once.
+    
+    Args:
+        texts: The texts to analyze
+    
+    Returns:
+        List of sentiment dictionaries (same shape as analyze_sentiment), in input order
+    """
+    try:
+        ensure_nltk_resources()
+    except Exception as e:
+        logger.error(f"Error analyzing sentiment: {e}")
+        return [_neutral_sentiment() for _ in texts]
+    
+    results = []
+    scored = {}
+    for text in texts:
+        if not text or not isinstance(text, str):
+            results.append(_neutral_sentiment())
+            continue
+        
+        result = scored.get(text)
+        if result is None:
+            try:
+                sentiment = TextBlob(text).sentiment
+                result = _sentiment_from_scores(sentiment.polarity, sentiment.subjectivity)
+            except Exception as e:
+                logger.error(f"Error analyzing sentiment: {e}")
+                result = _neutral_sentiment()
+            scored[text] = result
+        results.append(result)
+    
+    return results
 
 if __name__ == '__main__':
     # Test cases